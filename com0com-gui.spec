@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('assets', 'assets'), ('src', 'src')],
+    datas=[('assets', 'assets'), ('src', 'src'), ('com0com_cli_specification.json', '.')],
     hiddenimports=['PyQt6.QtCore', 'PyQt6.QtGui', 'PyQt6.QtWidgets', 'PyQt6.QtSvg', 'PyQt6.sip', 'src.gui.main_window', 'src.core.command_manager', 'src.core.config_manager', 'src.utils.constants'],
     hookspath=[],
     hooksconfig={},
@@ -4,7 +4,16 @@ Virtual Port Manager - Main Application Entry Point
 A PyQt6-based GUI wrapper for com0com's setupc.exe command-line tool.
 """
 
+import time
+STARTUP_TIME = time.perf_counter()
+
 import sys
+
+# Headless mode runs before any Qt import, so it starts quickly
+if __name__ == "__main__" and sys.argv[1:2] == ["--cli"]:
+    from src.cli import main as cli_main
+    sys.exit(cli_main(sys.argv[2:]))
+
 import os
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
@@ -12,10 +21,15 @@ from PyQt6.QtGui import QIcon
 
 from src.gui.main_window import MainWindow
 from src.utils.constants import APP_NAME, APP_VERSION
+from src.utils.startup_profiler import StartupProfiler
+from src.utils.config_paths import get_resource_path
 
 
 def main():
     """Initialize and run the Virtual Port Manager application."""
+    profiler = StartupProfiler.from_environment(STARTUP_TIME)
+    profiler.mark("imports")
+    
     # Disable dark mode detection
     os.environ['QT_QPA_PLATFORMTHEME'] = ''
     
@@ -24,6 +38,7 @@ def main():
     app.setApplicationName(APP_NAME)
     app.setApplicationVersion(APP_VERSION)
     app.setOrganizationName("Virtual Port Manager")
+    profiler.mark("application")
     
     # Set native Windows style for best fusiontegration
     app.setStyle('fusion')
@@ -34,8 +49,8 @@ def main():
         pass  # High DPI support is enabled by default in Qt6
     
     # Set application icon (try SVG first, then ICO)
-    svg_icon_path = os.path.join(os.path.dirname(__file__), "assets", "icons", "app_icon.svg")
-    ico_icon_path = os.path.join(os.path.dirname(__file__), "assets", "icons", "app.ico")
+    svg_icon_path = get_resource_path("assets", "icons", "app_icon.svg")
+    ico_icon_path = get_resource_path("assets", "icons", "app.ico")
     
     if os.path.exists(svg_icon_path):
         app.setWindowIcon(QIcon(svg_icon_path))
@@ -43,13 +58,16 @@ def main():
         app.setWindowIcon(QIcon(ico_icon_path))
     
     # Apply Windows theme stylesheet
-    stylesheet_path = os.path.join(os.path.dirname(__file__), "assets", "styles", "windows_theme.qss")
+    stylesheet_path = get_resource_path("assets", "styles", "windows_theme.qss")
     if os.path.exists(stylesheet_path):
         with open(stylesheet_path, 'r', encoding='utf-8') as f:
             app.setStyleSheet(f.read())
+    profiler.mark("theme")
     
     # Create and show main window
     main_window = MainWindow()
+    profiler.mark("main_window")
+    profiler.watch_first_paint(main_window)
     main_window.show()
     
     # Start event loop
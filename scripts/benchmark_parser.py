@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Port List Parser Micro-Benchmark
+Times PortListParser on synthetic setupc list output.
+
+Run from project root directory: python scripts/benchmark_parser.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.models import PortListParser
+
+PAIR_COUNTS = [10, 100, 1000]
+REPEATS = 5
+
+# Parameters reported for each port by "setupc --detail-prms list"
+DETAIL_PARAMS = ("EmuBR=no,EmuOverrun=no,EmuNoise=0,AddRTTO=0,AddRITO=0,"
+                 "PlugInMode=no,ExclusiveMode=no,HiddenMode=no,AllDataBits=no,"
+                 "cts=rrts,dsr=rdtr,dcd=rdtr,ri=!on")
+
+def build_output(pair_count: int, detailed: bool) -> str:
+    """Build list output for the given number of pairs."""
+    lines = []
+    for number in range(pair_count):
+        for port_letter, com_offset in (("A", 0), ("B", 1)):
+            params = f"PortName=COM{number * 2 + com_offset + 10}"
+            if detailed:
+                params += "," + DETAIL_PARAMS
+            lines.append(f"       CNC{port_letter}{number} {params}")
+    return "\n".join(lines) + "\n"
+
+def time_parse(output: str, streamed: bool) -> float:
+    """Get the best time in seconds for one parse of the output."""
+    if streamed:
+        lines = output.splitlines()
+        statement = lambda: PortListParser.parse_port_list(iter(lines))
+    else:
+        statement = lambda: PortListParser.parse_port_list(output)
+    
+    number = max(1, 2000 // len(output.splitlines()))
+    return min(timeit.repeat(statement, number=number, repeat=REPEATS)) / number
+
+def main():
+    """Run the benchmark and print a results table."""
+    print(f"{'pairs':>6} {'mode':>8} {'input':>8} {'time (ms)':>10} {'per pair (us)':>14}")
+    for pair_count in PAIR_COUNTS:
+        for detailed in (False, True):
+            output = build_output(pair_count, detailed)
+            for streamed in (False, True):
+                seconds = time_parse(output, streamed)
+                print(f"{pair_count:>6} {'detail' if detailed else 'basic':>8} "
+                      f"{'lines' if streamed else 'text':>8} {seconds * 1000:>10.3f} "
+                      f"{seconds * 1e6 / pair_count:>14.2f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Headless Benchmark Suite
+Measures port list parsing, tree updates, refresh round-trips and batch
+provisioning against the fake setupc emulator (scripts/fake_setupc.py).
+
+Runs without a display (Qt offscreen platform) and without com0com, so it
+works on Linux CI machines. Results are written as JSON: one record per
+benchmark, pair count and execution mode, with times in milliseconds.
+
+Run from project root directory: python scripts/benchmark_suite.py --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPTS_DIR)
+sys.path.insert(0, PROJECT_ROOT)
+
+from PyQt6.QtCore import QEventLoop, QTimer, QT_VERSION_STR, PYQT_VERSION_STR
+from PyQt6.QtWidgets import QApplication
+
+from src.core.command_manager import CommandManager
+from src.core.models import BatchInstallItem, PortListParser
+from src.gui.components.port_tree_widget import PortTreeWidget
+from src.utils.constants import EXECUTION_MODES
+from scripts.fake_setupc import FakeSetupc, PortTable
+
+BENCHMARKS = ["parse", "tree", "refresh", "batch"]
+DEFAULT_SIZES = [10, 100, 1000]
+DEFAULT_REPEAT = 5
+DEFAULT_BATCH_REPEAT = 1
+WAIT_TIMEOUT = 600  # Seconds before a round-trip is abandoned
+FAKE_SETUPC = os.path.join(SCRIPTS_DIR, "fake_setupc.py")
+
+def summarize(benchmark: str, pairs: int, mode: str, samples: list) -> dict:
+    """Build a result record from per-run times in seconds."""
+    return {
+        "benchmark": benchmark,
+        "pairs": pairs,
+        "mode": mode,
+        "runs": len(samples),
+        "min_ms": min(samples) * 1000,
+        "median_ms": statistics.median(samples) * 1000,
+        "mean_ms": statistics.mean(samples) * 1000,
+        "max_ms": max(samples) * 1000
+    }
+
+def list_output(pairs: int, detailed: bool = False) -> str:
+    """Get emulator list output for the given number of pairs."""
+    _, output = FakeSetupc(PortTable(None, pairs)).run(["--detail-prms", "list"] if detailed else ["list"])
+    return output
+
+def wait_for(app: QApplication, condition, timeout: float = WAIT_TIMEOUT) -> None:
+    """Run the event loop until condition() is true."""
+    if condition():
+        return
+    deadline = time.monotonic() + timeout
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.timeout.connect(lambda: loop.quit() if condition() or time.monotonic() > deadline else None)
+    timer.start(1)
+    loop.exec()
+    timer.stop()
+    if not condition():
+        raise TimeoutError("Benchmark round-trip did not complete")
+
+def bench_parse(app: QApplication, pairs: int, repeat: int) -> list:
+    """Time PortListParser on basic and detailed list output."""
+    results = []
+    for mode, detailed in (("basic", False), ("detail", True)):
+        output = list_output(pairs, detailed)
+        number = max(1, 2000 // (pairs * 2))
+        samples = timeit.repeat(lambda: PortListParser.parse_port_list(output), number=number, repeat=repeat)
+        results.append(summarize("parse", pairs, mode, [sample / number for sample in samples]))
+    return results
+
+def bench_tree(app: QApplication, pairs: int, repeat: int) -> list:
+    """Time loading the port tree and updating one pair in it."""
+    port_pairs = PortListParser.parse_port_list(list_output(pairs))
+    changed = PortListParser.parse_port_list(list_output(pairs).replace("PortName=COM10\n", "PortName=COM10,EmuBR=yes\n"))
+    
+    load_samples = []
+    update_samples = []
+    for _ in range(repeat):
+        tree = PortTreeWidget()
+        tree.show()
+        app.processEvents()
+        
+        started = time.perf_counter()
+        tree.update_port_pairs(port_pairs)
+        app.processEvents()
+        load_samples.append(time.perf_counter() - started)
+        
+        started = time.perf_counter()
+        tree.update_port_pairs(changed)
+        app.processEvents()
+        update_samples.append(time.perf_counter() - started)
+        
+        tree.close()
+        tree.deleteLater()
+        app.processEvents()
+    
+    return [summarize("tree_load", pairs, "widget", load_samples),
+            summarize("tree_update_one", pairs, "widget", update_samples)]
+
+def create_manager(state_path: str, mode: str) -> CommandManager:
+    """Create a command manager that runs the emulator with the given state file."""
+    os.environ["FAKE_SETUPC_STATE"] = state_path
+    manager = CommandManager(FAKE_SETUPC)
+    manager.set_execution_mode(mode)
+    return manager
+
+def bench_refresh(app: QApplication, pairs: int, repeat: int, modes: list, work_dir: str) -> list:
+    """Time list round-trips from request to parsed port pairs."""
+    state_path = os.path.join(work_dir, f"refresh_{pairs}.json")
+    PortTable(state_path, pairs)
+    
+    results = []
+    for mode in modes:
+        manager = create_manager(state_path, mode)
+        received = []
+        manager.port_list_updated.connect(received.append)
+        
+        # The first command starts the session, which is not part of a refresh
+        future = manager.list_ports()
+        wait_for(app, future.done)
+        
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            future = manager.list_ports()
+            wait_for(app, future.done)
+            samples.append(time.perf_counter() - started)
+            if len(received[-1]) != pairs:
+                raise RuntimeError(f"Refresh returned {len(received[-1])} pairs, expected {pairs}")
+        
+        manager.shutdown()
+        results.append(summarize("refresh", pairs, mode, samples))
+    return results
+
+def bench_batch(app: QApplication, pairs: int, repeat: int, modes: list, work_dir: str) -> list:
+    """Time installing pairs as one batch until the refreshed list shows them all."""
+    items = [BatchInstallItem(number, f"PortName=COM{number * 2 + 10}", f"PortName=COM{number * 2 + 11}")
+             for number in range(pairs)]
+    
+    results = []
+    for mode in modes:
+        samples = []
+        for run in range(repeat):
+            state_path = os.path.join(work_dir, f"batch_{pairs}_{mode}_{run}.json")
+            PortTable(state_path, 0)
+            manager = create_manager(state_path, mode)
+            received = []
+            manager.port_list_updated.connect(received.append)
+            
+            started = time.perf_counter()
+            future = manager.install_port_pairs(items)
+            wait_for(app, lambda: future.done() and received and len(received[-1]) == pairs)
+            samples.append(time.perf_counter() - started)
+            
+            failures = sum(1 for result in future.result() if not result.success)
+            manager.shutdown()
+            if failures:
+                raise RuntimeError(f"{failures} of {pairs} batch installs failed")
+        
+        results.append(summarize("batch_install", pairs, mode, samples))
+    return results
+
+def main():
+    """Run the selected benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description="Run headless benchmarks against the fake setupc emulator")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Port pair counts")
+    parser.add_argument("--benchmarks", nargs="+", choices=BENCHMARKS, default=BENCHMARKS)
+    parser.add_argument("--modes", nargs="+", choices=EXECUTION_MODES, default=EXECUTION_MODES,
+                        help="Execution modes for the refresh and batch benchmarks")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Runs per measurement")
+    parser.add_argument("--batch-repeat", type=int, default=DEFAULT_BATCH_REPEAT,
+                        help="Runs per batch provisioning measurement")
+    parser.add_argument("--latency", default="0", help="Emulated setupc latency (FAKE_SETUPC_LATENCY format)")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    args = parser.parse_args()
+    
+    os.environ["FAKE_SETUPC_LATENCY"] = args.latency
+    os.environ.pop("FAKE_SETUPC_FAILURES", None)
+    os.environ.pop("FAKE_SETUPC_PAIRS", None)
+    
+    app = QApplication(sys.argv[:1])
+    work_dir = tempfile.mkdtemp(prefix="vpm_benchmark_")
+    results = []
+    try:
+        for pairs in args.sizes:
+            if "parse" in args.benchmarks:
+                results.extend(bench_parse(app, pairs, args.repeat))
+            if "tree" in args.benchmarks:
+                results.extend(bench_tree(app, pairs, args.repeat))
+            if "refresh" in args.benchmarks:
+                results.extend(bench_refresh(app, pairs, args.repeat, args.modes, work_dir))
+            if "batch" in args.benchmarks:
+                results.extend(bench_batch(app, pairs, args.batch_repeat, args.modes, work_dir))
+            for result in results:
+                if result["pairs"] == pairs:
+                    print(f"{result['benchmark']:>16} {pairs:>6} {result['mode']:>8} "
+                          f"{result['median_ms']:>10.3f} ms", file=sys.stderr)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    report = json.dumps({
+        "metadata": {
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qt": QT_VERSION_STR,
+            "pyqt": PYQT_VERSION_STR,
+            "latency": args.latency
+        },
+        "results": results
+    }, indent=2)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
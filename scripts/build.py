@@ -115,6 +115,7 @@ def build_executable():
         # Asset bundling
         "--add-data", "assets;assets",  # Include entire assets directory
         "--add-data", "src;src",        # Include source code (for imports)
+        "--add-data", "com0com_cli_specification.json;.",  # Port parameter registry
         
         # Windows-specific options
         "--uac-admin",                  # UAC elevation (built-in PyInstaller option)
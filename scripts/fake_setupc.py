@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Fake setupc
+Pure-Python emulator of com0com's setupc.exe for testing and benchmarks.
+
+Implements the commands in SETUPC_COMMANDS against a port table kept in
+memory or in a JSON file, so it can stand in for setupc.exe wherever the
+application runs it. Without arguments it runs interactively like setupc.exe
+(session mode); otherwise it runs one command and exits.
+
+Configured through environment variables, since the application passes only
+setupc arguments:
+    FAKE_SETUPC_STATE    JSON file holding the port table (in memory if unset)
+    FAKE_SETUPC_PAIRS    Number of pairs to create when the table is new
+    FAKE_SETUPC_LATENCY  Seconds per command, e.g. "0.05" or "list=0.01,install=0.2,*=0.05"
+    FAKE_SETUPC_FAILURES Failure probability, same format as FAKE_SETUPC_LATENCY
+    FAKE_SETUPC_SEED     Seed for failure injection
+
+Point the setupc.exe path setting at this file (it must be executable).
+
+Run from project root directory: FAKE_SETUPC_STATE=ports.json python scripts/fake_setupc.py list
+"""
+
+import fnmatch
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+PROMPT = "command> "
+BANNER = "Enter 'help' to get info about usage of Setup for com0com.\n"
+
+# Global options; those listed in VALUE_OPTIONS take an argument
+OPTIONS = {"--output", "--wait", "--detail-prms", "--silent", "--no-update",
+           "--no-update-fnames", "--show-fnames"}
+VALUE_OPTIONS = {"--output", "--wait"}
+
+# Parameters reported with --detail-prms when a port does not set them
+DEFAULT_PARAMS = {
+    "EmuBR": "no", "EmuOverrun": "no", "EmuNoise": "0", "AddRTTO": "0", "AddRITO": "0",
+    "PlugInMode": "no", "ExclusiveMode": "no", "HiddenMode": "no", "AllDataBits": "no",
+    "cts": "rrts", "dsr": "rdtr", "dcd": "rdtr", "ri": "!on"
+}
+
+FIRST_COM_NUMBER = 3  # Lowest number assigned for PortName=COM#
+
+HELP_TEXT = """Setup for com0com (fake)
+
+Usage:
+  [options] <command>
+
+Options:
+  --output <file>              - file for output, default is console
+  --wait [+]<to>               - wait <to> seconds for install completion
+  --detail-prms                - show detailed parameters
+  --silent                     - suppress dialogs if possible
+  --no-update                  - do not update driver while install command
+  --no-update-fnames           - do not update friendly names
+  --show-fnames                - show friendly names activity
+
+Commands:
+  install <n> <prmsA> <prmsB>  - install a pair of linked ports with
+   or                            identifiers CNCA<n> and CNCB<n>
+  install <prmsA> <prmsB>        (first free <n> if omitted)
+  install                      - update the driver
+  remove <n>                   - remove a pair of linked ports with
+                                 identifiers CNCA<n> and CNCB<n>
+  disable all                  - disable all ports in current hardware profile
+  enable all                   - enable all ports in current hardware profile
+  change <portid> <prms>       - set parameters <prms> for port with
+                                 identifier <portid>
+  list                         - for each port show parameters
+  preinstall                   - preinstall driver
+  update                       - update driver
+  reload                       - reload driver
+  uninstall                    - uninstall all ports and the driver
+  infclean                     - clean old INF files
+  busynames <pattern>          - show names that already in use and match the
+                                 <pattern> (wildcards: '*' and '?')
+  updatefnames                 - update friendly names
+  listfnames                   - for each bus and port show friendly names
+  quit                         - quit
+  help                         - print this help
+"""
+
+
+def parse_per_command(value: str) -> Dict[str, float]:
+    """Parse "0.1" or "list=0.01,*=0.1" into command -> value ("*" for the default)."""
+    result = {}
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        command, separator, number = item.rpartition("=")
+        result[command.strip().lower() if separator else "*"] = float(number)
+    return result
+
+def parse_params(text: str) -> Dict[str, str]:
+    """Parse a setupc parameter string ("-" for defaults) into a dict."""
+    if text in ("", "-", "*"):
+        return {}
+    params = {}
+    for item in text.split(","):
+        key, separator, value = item.partition("=")
+        if not separator or not key:
+            raise ValueError(f"Invalid parameter '{item}'")
+        params[key] = value
+    return params
+
+def format_params(params: Dict[str, str]) -> str:
+    """Format parameters the way setupc list prints them."""
+    if not params:
+        return "PortName=-"
+    return ",".join(f"{key}={value}" for key, value in params.items())
+
+
+class PortTable:
+    """Port pairs known to the fake driver, optionally persisted to a JSON file."""
+    
+    def __init__(self, path: Optional[str] = None, initial_pairs: int = 0):
+        self.path = path
+        self.pairs: Dict[int, Dict[str, Dict[str, str]]] = {}  # number -> {"A": params, "B": params}
+        self.enabled = True
+        self.pending_update = False  # Set by installs run with --no-update
+        self.command_counts: Dict[str, int] = {}
+        
+        if not self.load():
+            for number in range(initial_pairs):
+                self.pairs[number] = {
+                    "A": {"PortName": f"COM{number * 2 + 10}"},
+                    "B": {"PortName": f"COM{number * 2 + 11}"}
+                }
+            self.save()
+    
+    def load(self) -> bool:
+        """Load the table from its file; False if there is no file."""
+        if not self.path:
+            return False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        
+        self.pairs = {int(number): ports for number, ports in data.get("pairs", {}).items()}
+        self.enabled = data.get("enabled", True)
+        self.pending_update = data.get("pending_update", False)
+        self.command_counts = data.get("command_counts", {})
+        return True
+    
+    def save(self) -> None:
+        """Write the table to its file, replacing it atomically."""
+        if not self.path:
+            return
+        data = {
+            "pairs": {str(number): ports for number, ports in sorted(self.pairs.items())},
+            "enabled": self.enabled,
+            "pending_update": self.pending_update,
+            "command_counts": self.command_counts
+        }
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.path)
+    
+    def busy_names(self) -> List[str]:
+        """Get the port names in use."""
+        names = []
+        for ports in self.pairs.values():
+            for params in ports.values():
+                for key in ("PortName", "RealPortName"):
+                    name = params.get(key)
+                    if name and name not in ("-", "COM#"):
+                        names.append(name)
+        return names
+    
+    def assign_com_names(self, params: Dict[str, str]) -> None:
+        """Replace PortName=COM# with a free COM port name, as setupc does."""
+        if params.get("PortName") != "COM#":
+            return
+        busy = set(self.busy_names())
+        number = FIRST_COM_NUMBER
+        while f"COM{number}" in busy:
+            number += 1
+        params["RealPortName"] = f"COM{number}"
+
+
+class FakeSetupc:
+    """setupc.exe command interpreter over a PortTable."""
+    
+    def __init__(self, table: PortTable, latency: Optional[Dict[str, float]] = None,
+                 failures: Optional[Dict[str, float]] = None, seed: Optional[int] = None):
+        self.table = table
+        self.latency = latency or {}
+        self.failures = failures or {}
+        self.random = random.Random(seed)
+    
+    @classmethod
+    def from_environment(cls) -> "FakeSetupc":
+        """Create the emulator from the FAKE_SETUPC_* environment variables."""
+        seed = os.environ.get("FAKE_SETUPC_SEED")
+        return cls(
+            PortTable(os.environ.get("FAKE_SETUPC_STATE") or None,
+                      int(os.environ.get("FAKE_SETUPC_PAIRS", "0"))),
+            parse_per_command(os.environ.get("FAKE_SETUPC_LATENCY", "")),
+            parse_per_command(os.environ.get("FAKE_SETUPC_FAILURES", "")),
+            int(seed) if seed else None
+        )
+    
+    def run(self, args: List[str]) -> Tuple[int, str]:
+        """Run one command line (options and command); returns (exit code, output)."""
+        options = {}
+        index = 0
+        while index < len(args) and args[index].startswith("--"):
+            option = args[index].lower()
+            if option not in OPTIONS:
+                return 1, f"Invalid option {args[index]}\n"
+            if option in VALUE_OPTIONS:
+                index += 1
+                options[option] = args[index] if index < len(args) else ""
+            else:
+                options[option] = True
+            index += 1
+        
+        args = args[index:]
+        if not args:
+            return 0, ""
+        command = args[0].lower()
+        
+        self._delay(command)
+        if self.table.path:
+            self.table.load()  # Pick up changes made by other processes
+        self.table.command_counts[command] = self.table.command_counts.get(command, 0) + 1
+        
+        if self._should_fail(command):
+            code, output = 1, f"ERROR: injected failure for {command}\n"
+        else:
+            handler = getattr(self, f"_cmd_{command}", None)
+            if handler is None or command == "quit":
+                code, output = 1, f"Invalid command {args[0]}\n"
+            else:
+                try:
+                    code, output = handler(args[1:], options)
+                except ValueError as e:
+                    code, output = 1, f"ERROR: {e}\n"
+        
+        self.table.save()
+        
+        output_path = options.get("--output")
+        if output_path:
+            with open(output_path, "a", encoding="utf-8") as f:
+                f.write(output)
+            output = ""
+        return code, output
+    
+    def run_interactive(self, stdin, stdout) -> None:
+        """Read commands after a prompt until quit or EOF, like setupc.exe without arguments."""
+        stdout.write(BANNER)
+        while True:
+            stdout.write(PROMPT)
+            stdout.flush()
+            line = stdin.readline()
+            if not line or line.strip().lower() == "quit":
+                return
+            _, output = self.run(line.split())
+            stdout.write(output)
+    
+    def _delay(self, command: str) -> None:
+        """Sleep for the configured command latency."""
+        seconds = self.latency.get(command, self.latency.get("*", 0.0))
+        if seconds > 0:
+            time.sleep(seconds)
+    
+    def _should_fail(self, command: str) -> bool:
+        """Decide whether to inject a failure."""
+        probability = self.failures.get(command, self.failures.get("*", 0.0))
+        return probability > 0 and self.random.random() < probability
+    
+    def _format_port(self, port_id: str, params: Dict[str, str], detailed: bool) -> str:
+        """Format one port line of list output."""
+        if detailed:
+            params = dict(params)
+            params.setdefault("PortName", "-")
+            for key, value in DEFAULT_PARAMS.items():
+                params.setdefault(key, value)
+        return f"       {port_id} {format_params(params)}\n"
+    
+    def _get_port(self, port_id: str) -> Dict[str, str]:
+        """Get the parameters of a port by identifier."""
+        if len(port_id) > 4 and port_id[:3].upper() == "CNC" and port_id[3].upper() in "AB":
+            try:
+                ports = self.table.pairs.get(int(port_id[4:]))
+            except ValueError:
+                ports = None
+            if ports is not None:
+                return ports[port_id[3].upper()]
+        raise ValueError(f"Port {port_id} not found")
+    
+    # Commands
+    def _cmd_list(self, args, options) -> Tuple[int, str]:
+        detailed = "--detail-prms" in options
+        lines = []
+        for number, ports in sorted(self.table.pairs.items()):
+            for letter in ("A", "B"):
+                lines.append(self._format_port(f"CNC{letter}{number}", ports[letter], detailed))
+        return 0, "".join(lines)
+    
+    def _cmd_install(self, args, options) -> Tuple[int, str]:
+        if not args:
+            self.table.pending_update = False
+            return 0, "Driver updated\n"
+        
+        if len(args) == 3:
+            number = int(args[0])
+            if number in self.table.pairs:
+                raise ValueError(f"The port CNCA{number} already exists")
+            args = args[1:]
+        elif len(args) == 2:
+            number = 0
+            while number in self.table.pairs:
+                number += 1
+        else:
+            raise ValueError("Invalid number of install arguments")
+        
+        ports = {"A": parse_params(args[0]), "B": parse_params(args[1])}
+        for params in ports.values():
+            self.table.assign_com_names(params)
+        self.table.pairs[number] = ports
+        self.table.pending_update = "--no-update" in options
+        
+        return 0, (self._format_port(f"CNCA{number}", ports["A"], False) +
+                   self._format_port(f"CNCB{number}", ports["B"], False))
+    
+    def _cmd_remove(self, args, options) -> Tuple[int, str]:
+        if len(args) != 1:
+            raise ValueError("Invalid number of remove arguments")
+        number = int(args[0])
+        if self.table.pairs.pop(number, None) is None:
+            raise ValueError(f"Port pair {number} not found")
+        return 0, f"Removed CNCA{number}\nRemoved CNCB{number}\n"
+    
+    def _cmd_change(self, args, options) -> Tuple[int, str]:
+        if len(args) != 2:
+            raise ValueError("Invalid number of change arguments")
+        params = self._get_port(args[0])
+        for key, value in parse_params(args[1]).items():
+            if value == "-":
+                params.pop(key, None)  # Back to the default
+            else:
+                params[key] = value
+        self.table.assign_com_names(params)
+        return 0, self._format_port(args[0].upper(), params, False)
+    
+    def _cmd_disable(self, args, options) -> Tuple[int, str]:
+        if args != ["all"]:
+            raise ValueError("Invalid disable arguments")
+        self.table.enabled = False
+        return 0, "Disabled all ports\n"
+    
+    def _cmd_enable(self, args, options) -> Tuple[int, str]:
+        if args != ["all"]:
+            raise ValueError("Invalid enable arguments")
+        self.table.enabled = True
+        return 0, "Enabled all ports\n"
+    
+    def _cmd_preinstall(self, args, options) -> Tuple[int, str]:
+        return 0, "Driver preinstalled\n"
+    
+    def _cmd_update(self, args, options) -> Tuple[int, str]:
+        self.table.pending_update = False
+        return 0, "Driver updated\n"
+    
+    def _cmd_reload(self, args, options) -> Tuple[int, str]:
+        return 0, "Driver reloaded\n"
+    
+    def _cmd_uninstall(self, args, options) -> Tuple[int, str]:
+        output = "".join(f"Removed CNCA{number}\nRemoved CNCB{number}\n" for number in sorted(self.table.pairs))
+        self.table.pairs.clear()
+        return 0, output + "Driver uninstalled\n"
+    
+    def _cmd_infclean(self, args, options) -> Tuple[int, str]:
+        return 0, "No old INF files found\n"
+    
+    def _cmd_busynames(self, args, options) -> Tuple[int, str]:
+        pattern = args[0] if args else "*"
+        names = [name for name in self.table.busy_names() if fnmatch.fnmatchcase(name.upper(), pattern.upper())]
+        return 0, "".join(f"{name}\n" for name in sorted(names))
+    
+    def _cmd_updatefnames(self, args, options) -> Tuple[int, str]:
+        return 0, "Friendly names updated\n"
+    
+    def _cmd_listfnames(self, args, options) -> Tuple[int, str]:
+        lines = []
+        for number, ports in sorted(self.table.pairs.items()):
+            for letter in ("A", "B"):
+                params = ports[letter]
+                name = params.get("RealPortName", params.get("PortName", "-"))
+                lines.append(f'       CNC{letter}{number} FriendlyName="com0com - serial port emulator {name}"\n')
+        return 0, "".join(lines)
+    
+    def _cmd_help(self, args, options) -> Tuple[int, str]:
+        return 0, HELP_TEXT
+
+
+def main() -> int:
+    """Run one command from the arguments, or an interactive session without any."""
+    emulator = FakeSetupc.from_environment()
+    if len(sys.argv) > 1:
+        code, output = emulator.run(sys.argv[1:])
+        sys.stdout.write(output)
+        return code
+    
+    emulator.run_interactive(sys.stdin, sys.stdout)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
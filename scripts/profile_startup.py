@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Startup Profiling Harness
+Measures import time and time to first paint of the application.
+
+Each run launches the application with startup profiling enabled, waits for
+the main window to paint, and collects the recorded milestones. Works for
+both main.py and the frozen PyInstaller executable (--exe).
+
+Run from project root directory: python scripts/profile_startup.py
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.utils.constants import STARTUP_PROFILE_ENV, STARTUP_PROFILE_EXIT_ENV
+
+DEFAULT_RUNS = 5
+RUN_TIMEOUT = 60
+IMPORT_TARGET = "src.gui.main_window"
+IMPORTTIME_PATTERN = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def run_once(command: list, offscreen: bool) -> dict:
+    """Launch the application once and return its startup report.
+    
+    The report gains a "wall" mark: seconds from launch to process exit,
+    which includes interpreter start-up and, for frozen builds, unpacking.
+    """
+    fd, report_path = tempfile.mkstemp(suffix=".jsonl")
+    os.close(fd)
+    
+    env = dict(os.environ)
+    env[STARTUP_PROFILE_ENV] = report_path
+    env[STARTUP_PROFILE_EXIT_ENV] = "1"
+    if offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+    
+    try:
+        started = time.perf_counter()
+        subprocess.run(command, cwd=PROJECT_ROOT, env=env, timeout=RUN_TIMEOUT,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        wall = time.perf_counter() - started
+        
+        with open(report_path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    finally:
+        os.remove(report_path)
+    
+    if not lines:
+        raise RuntimeError("The application exited without writing a startup report")
+    
+    report = json.loads(lines[-1])
+    report["marks"]["wall"] = wall
+    return report
+
+def profile_imports(top: int) -> list:
+    """Get the slowest imports of the main window as (module, self ms, cumulative ms)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {IMPORT_TARGET}"],
+        cwd=PROJECT_ROOT, env=dict(os.environ, QT_QPA_PLATFORM="offscreen"),
+        capture_output=True, text=True, timeout=RUN_TIMEOUT
+    )
+    
+    imports = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, _, module = match.groups()
+            imports.append((module, int(self_us) / 1000, int(cumulative_us) / 1000))
+    
+    imports.sort(key=lambda item: item[1], reverse=True)
+    return imports[:top]
+
+def summarize(reports: list) -> dict:
+    """Get the median and best time of each mark across runs."""
+    names = []
+    for report in reports:
+        for name in report["marks"]:
+            if name not in names:
+                names.append(name)
+    
+    summary = {}
+    for name in names:
+        values = [report["marks"][name] for report in reports if name in report["marks"]]
+        summary[name] = {"median": statistics.median(values), "best": min(values)}
+    return summary
+
+def main():
+    """Run the harness and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="number of launches")
+    parser.add_argument("--exe", help="profile a frozen executable instead of main.py")
+    parser.add_argument("--offscreen", action="store_true", help="use the offscreen Qt platform")
+    parser.add_argument("--imports", type=int, default=15, metavar="N",
+                        help="list the N slowest imports (0 to skip; main.py only)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+    
+    command = [args.exe] if args.exe else [sys.executable, "main.py"]
+    reports = [run_once(command, args.offscreen) for _ in range(args.runs)]
+    summary = summarize(reports)
+    imports = profile_imports(args.imports) if args.imports and not args.exe else []
+    
+    if args.json:
+        print(json.dumps({
+            "command": command,
+            "runs": args.runs,
+            "frozen": reports[0]["frozen"],
+            "modules_loaded": reports[0]["modules_loaded"],
+            "marks": summary,
+            "imports": [{"module": module, "self_ms": self_ms, "cumulative_ms": cumulative_ms}
+                        for module, self_ms, cumulative_ms in imports],
+        }, indent=2))
+        return
+    
+    print(f"Startup of {' '.join(command)} ({args.runs} runs, "
+          f"{reports[0]['modules_loaded']} modules loaded)")
+    print(f"{'milestone':<22} {'median (ms)':>12} {'best (ms)':>10}")
+    for name, times in summary.items():
+        print(f"{name:<22} {times['median'] * 1000:>12.1f} {times['best'] * 1000:>10.1f}")
+    
+    if imports:
+        print(f"\nSlowest imports of {IMPORT_TARGET} (by self time)")
+        print(f"{'module':<48} {'self (ms)':>10} {'total (ms)':>11}")
+        for module, self_ms, cumulative_ms in imports:
+            print(f"{module:<48} {self_ms:>10.1f} {cumulative_ms:>11.1f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,297 @@
+"""Headless command-line interface for scripted port management.
+
+Runs setupc.exe commands with the same validation and parsing as the GUI,
+without importing Qt, and prints the results as JSON. Started with
+``main.py --cli <command> ...``.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from .core.change_planner import DurationEstimator, estimate_plan
+from .core.command_builder import CommandValidationError, build_install, build_remove, build_change
+from .core.command_journal import CommandJournal
+from .core.models import ApplicationConfig, CommandResult, PortListParser
+from .core.setupc_runner import run_setupc
+from .core.topology import Topology, TopologyError, plan_topology
+from .utils.config_paths import get_config_file_path
+from .utils.constants import (APP_NAME, APP_VERSION, DEFAULT_SETUPC_PATH, SETUPC_COMMANDS, SETUPC_OPTIONS,
+                              COMMAND_JOURNAL_FILENAME, CLI_EXIT_SUCCESS, CLI_EXIT_FAILURE, CLI_EXIT_INVALID,
+                              CLI_EXIT_SETUPC_NOT_FOUND, CLI_EXIT_TIMEOUT)
+
+
+class CliError(Exception):
+    """Invalid input detected before any command was run."""
+
+
+def load_config() -> ApplicationConfig:
+    """Load the GUI configuration without modifying it."""
+    config = ApplicationConfig()
+    path = get_config_file_path()
+    try:
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                config = ApplicationConfig.from_dict(json.load(f))
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Warning: Failed to load config from {path}: {e}", file=sys.stderr)
+    
+    if not os.path.isfile(config.setupc_path):
+        config.setupc_path = DEFAULT_SETUPC_PATH
+    return config
+
+
+def build_batch_operation(operation: Dict[str, Any]) -> Tuple[str, str]:
+    """Validate one batch file operation; returns (command_key, command)."""
+    if not isinstance(operation, dict):
+        raise CliError("Each operation must be an object")
+    
+    action = operation.get("action")
+    if action == "install":
+        return build_install(operation.get("number"), str(operation.get("params_a", "-")),
+                             str(operation.get("params_b", "-")))
+    if action == "remove":
+        return build_remove(operation.get("number"))
+    if action == "change":
+        return build_change(str(operation.get("port_id", "")), str(operation.get("params", "")))
+    raise CliError(f"Unknown action '{action}' (expected install, remove or change)")
+
+
+def result_to_dict(result: CommandResult) -> Dict[str, Any]:
+    """Convert a command result for JSON output."""
+    return {
+        "success": result.success,
+        "command": result.command,
+        "return_code": result.return_code,
+        "execution_time": round(result.execution_time, 6),
+        "output": result.output,
+        "error": result.get_error_message() if not result.success else ""
+    }
+
+
+def exit_code_for(results: List[CommandResult]) -> int:
+    """Get the process exit code for a set of command results."""
+    failed = [result for result in results if not result.success]
+    if not failed:
+        return CLI_EXIT_SUCCESS
+    if any(result.return_code == -2 for result in failed):
+        return CLI_EXIT_SETUPC_NOT_FOUND
+    if any(result.is_timeout() for result in failed):
+        return CLI_EXIT_TIMEOUT
+    return CLI_EXIT_FAILURE
+
+
+class CliRunner:
+    """Runs validated setupc commands and records them in the command journal."""
+    
+    def __init__(self, setupc_path: str, timeout: int, journal: Optional[CommandJournal] = None):
+        self.setupc_path = setupc_path
+        self.timeout = timeout
+        self.journal = journal
+    
+    def run(self, command_key: str, command: str) -> CommandResult:
+        """Run one command."""
+        result = run_setupc(self.setupc_path, command, self.timeout)
+        if self.journal is not None:
+            self.journal.record(command_key, result)
+        return result
+    
+    def list_ports(self, detailed: bool) -> Tuple[Dict[str, Any], int]:
+        """List port pairs."""
+        command = SETUPC_COMMANDS["LIST"]
+        if detailed:
+            command = f"{SETUPC_OPTIONS['DETAIL_PRMS']} {command}"
+        
+        result = self.run("LIST", command)
+        report = result_to_dict(result)
+        del report["output"]
+        if result.success:
+            parser = PortListParser()
+            parser.feed(result.output.splitlines())
+            report["port_pairs"] = [pair.to_dict() for pair in parser.get_port_pairs()]
+            report["warnings"] = [f"Line {line_number}: {reason}: {line}"
+                                  for line_number, line, reason in parser.malformed_lines]
+        return report, exit_code_for([result])
+    
+    def run_single(self, command_key: str, command: str, no_update: bool = False) -> Tuple[Dict[str, Any], int]:
+        """Run one install, remove or change command."""
+        if no_update:
+            command = f"{SETUPC_OPTIONS['NO_UPDATE']} {command}"
+        result = self.run(command_key, command)
+        return result_to_dict(result), exit_code_for([result])
+    
+    def run_batch(self, operations: List[Dict[str, Any]], stop_on_error: bool) -> Tuple[Dict[str, Any], int]:
+        """Run batch operations in order with one driver update at the end.
+        
+        Every operation is validated before the first one runs. Installs run
+        with --no-update and --no-update-fnames; if any succeeded, one driver
+        update and one friendly name update follow.
+        """
+        commands = []
+        for index, operation in enumerate(operations):
+            try:
+                commands.append(build_batch_operation(operation))
+            except (CliError, CommandValidationError) as e:
+                raise CliError(f"Operation {index + 1}: {e}")
+        
+        deferred_options = f"{SETUPC_OPTIONS['NO_UPDATE']} {SETUPC_OPTIONS['NO_UPDATE_FNAMES']}"
+        results = []
+        reports = []
+        stopped = False
+        for operation, (command_key, command) in zip(operations, commands):
+            if stopped:
+                reports.append({"operation": operation, "skipped": True})
+                continue
+            
+            if command_key.startswith("INSTALL"):
+                command = f"{deferred_options} {command}"
+            result = self.run(command_key, command)
+            results.append(result)
+            reports.append({"operation": operation, **result_to_dict(result)})
+            stopped = stop_on_error and not result.success
+        
+        installed = any(result.success and command_key.startswith("INSTALL")
+                        for (command_key, _), result in zip(commands, results))
+        update_reports = []
+        if installed:
+            for command_key in ("INSTALL_UPDATE", "UPDATEFNAMES"):
+                result = self.run(command_key, SETUPC_COMMANDS[command_key])
+                results.append(result)
+                update_reports.append(result_to_dict(result))
+        
+        exit_code = exit_code_for(results)
+        return {"success": exit_code == CLI_EXIT_SUCCESS, "results": reports, "updates": update_reports}, exit_code
+    
+    def apply_topology(self, topology: Topology, dry_run: bool) -> Tuple[Dict[str, Any], int]:
+        """Reconcile the port pairs with a topology.
+        
+        One list reads the current state; when it already matches, nothing
+        else runs. Otherwise the planned operations run with deferred updates,
+        followed by the driver and friendly name updates they need and one
+        list to report the new state.
+        """
+        result = self.run("LIST", SETUPC_COMMANDS["LIST"])
+        if not result.success:
+            return {"success": False, "list": result_to_dict(result)}, exit_code_for([result])
+        
+        plan = plan_topology(PortListParser.parse_port_list(result.output), topology)
+        report = {"success": True, "changed": not plan.is_empty(),
+                  "planned": [{"command": planned.command, "description": planned.description}
+                              for planned in plan.commands()]}
+        if dry_run:
+            estimate = estimate_plan(plan, DurationEstimator(journal=self.journal))
+            report["estimated_seconds"] = round(estimate.total_seconds(), 3)
+            report["commands_without_estimate"] = estimate.unknown_count()
+        if dry_run or plan.is_empty():
+            return report, CLI_EXIT_SUCCESS
+        
+        results = [self.run(planned.command_key, planned.command) for planned in plan.operations]
+        if any(result.success for result in results):
+            results += [self.run(planned.command_key, planned.command) for planned in plan.finalize]
+        report["results"] = [result_to_dict(result) for result in results]
+        
+        result = self.run("LIST", SETUPC_COMMANDS["LIST"])
+        if result.success:
+            remaining = plan_topology(PortListParser.parse_port_list(result.output), topology)
+            report["converged"] = remaining.is_empty()
+        results.append(result)
+        
+        exit_code = exit_code_for(results)
+        report["success"] = exit_code == CLI_EXIT_SUCCESS
+        return report, exit_code
+
+
+def load_batch_file(path: str) -> List[Dict[str, Any]]:
+    """Read batch operations from a JSON file ("-" for stdin).
+    
+    The file holds a list of operations, or an object with an "operations" list.
+    """
+    try:
+        if path == "-":
+            data = json.load(sys.stdin)
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise CliError(f"Failed to read batch file {path}: {e}")
+    
+    if isinstance(data, dict):
+        data = data.get("operations")
+    if not isinstance(data, list):
+        raise CliError("Batch file must contain a list of operations")
+    return data
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the command-line argument parser."""
+    parser = argparse.ArgumentParser(prog="main.py --cli", description=f"{APP_NAME} {APP_VERSION} headless mode")
+    parser.add_argument("--setupc", help="Path to setupc.exe (default: the configured path)")
+    parser.add_argument("--timeout", type=int, help="Command timeout in seconds (default: the configured timeout)")
+    parser.add_argument("--no-journal", action="store_true", help="Do not record commands in the command history")
+    parser.add_argument("--pretty", action="store_true", help="Indent the JSON output")
+    
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    list_parser = subparsers.add_parser("list", help="List port pairs")
+    list_parser.add_argument("--detail", action="store_true", help="Include default parameter values")
+    
+    install_parser = subparsers.add_parser("install", help="Install a port pair")
+    install_parser.add_argument("--number", type=int, help="Pair number (default: first free number)")
+    install_parser.add_argument("params_a", nargs="?", default="-", help="Parameters for port A (default: -)")
+    install_parser.add_argument("params_b", nargs="?", default="-", help="Parameters for port B (default: -)")
+    install_parser.add_argument("--no-update", action="store_true", help="Do not update the driver")
+    
+    remove_parser = subparsers.add_parser("remove", help="Remove a port pair")
+    remove_parser.add_argument("number", type=int, help="Pair number")
+    
+    change_parser = subparsers.add_parser("change", help="Change port parameters")
+    change_parser.add_argument("port_id", help="Port identifier, e.g. CNCA0")
+    change_parser.add_argument("params", help="Parameters, e.g. EmuBR=yes,PortName=COM5")
+    
+    batch_parser = subparsers.add_parser("batch", help="Run install/remove/change operations from a JSON file")
+    batch_parser.add_argument("file", help='JSON file, or "-" for stdin')
+    batch_parser.add_argument("--stop-on-error", action="store_true", help="Skip the remaining operations after a failure")
+    
+    apply_parser = subparsers.add_parser("apply", help="Reconcile the port pairs with a JSON/YAML topology file")
+    apply_parser.add_argument("file", help="Topology file")
+    apply_parser.add_argument("--dry-run", action="store_true", help="Only print the planned commands")
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the headless command line; returns the process exit code."""
+    args = create_parser().parse_args(argv)
+    
+    config = load_config()
+    setupc_path = args.setupc or config.setupc_path
+    timeout = args.timeout if args.timeout is not None else config.command_timeout
+    journal = None
+    if not args.no_journal:
+        journal = CommandJournal(get_config_file_path().parent / COMMAND_JOURNAL_FILENAME)
+    runner = CliRunner(setupc_path, timeout, journal)
+    
+    try:
+        if args.command == "list":
+            report, exit_code = runner.list_ports(args.detail)
+        elif args.command == "install":
+            report, exit_code = runner.run_single(*build_install(args.number, args.params_a, args.params_b),
+                                                  no_update=args.no_update)
+        elif args.command == "remove":
+            report, exit_code = runner.run_single(*build_remove(args.number))
+        elif args.command == "change":
+            report, exit_code = runner.run_single(*build_change(args.port_id, args.params))
+        elif args.command == "apply":
+            report, exit_code = runner.apply_topology(Topology.load(args.file), args.dry_run)
+        else:
+            report, exit_code = runner.run_batch(load_batch_file(args.file), args.stop_on_error)
+    except (CliError, CommandValidationError, TopologyError) as e:
+        report, exit_code = {"success": False, "error": str(e)}, CLI_EXIT_INVALID
+    finally:
+        if journal is not None:
+            journal.close()
+    
+    print(json.dumps(report, indent=2 if args.pretty else None))
+    return exit_code
\ No newline at end of file
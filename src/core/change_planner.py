@@ -0,0 +1,161 @@
+"""Dry-run planning of port change sets with duration estimates.
+
+plan_change_set turns a ChangeSet into the ordered setupc commands that
+would run, without running anything; estimate_plan predicts how long they
+take from the durations observed for each command type. parameter_delta
+reduces requested parameters to the ones that differ from a port's state.
+"""
+
+import statistics
+from typing import Dict, Optional, Tuple
+
+from .command_builder import build_install, build_remove, build_change
+from .command_journal import CommandJournal
+from .command_metrics import CommandMetrics
+from .models import ChangeSet, CommandEstimate, CommandPlan, PlanEstimate, PlannedCommand
+from .parameter_registry import ParameterRegistry
+from .validators import ParameterBuilder
+from ..utils.constants import (SETUPC_COMMANDS, SETUPC_OPTIONS, ESTIMATE_SOURCE_SESSION, ESTIMATE_SOURCE_JOURNAL,
+                              ESTIMATE_SOURCE_NONE, ESTIMATE_JOURNAL_SAMPLE_SIZE, SPECIAL_PARAMETER_VALUES,
+                              FRIENDLY_NAME_PARAMETERS)
+
+RESET_VALUE = SPECIAL_PARAMETER_VALUES["DEFAULT"]
+
+
+def _normalize_value(value: str) -> str:
+    """Get a comparable form of a parameter value ("yes"/"YES", "0"/"0.0")."""
+    value = value.strip().lower()
+    try:
+        return repr(float(value))
+    except ValueError:
+        return value
+
+
+def _values_match(current: Optional[str], desired: str, default: Optional[str]) -> bool:
+    """Compare a listed parameter value (None when not listed) with a requested one."""
+    if desired == RESET_VALUE:
+        return current is None or current == RESET_VALUE
+    if current is None or current == RESET_VALUE:
+        current = default
+    return current is not None and _normalize_value(current) == _normalize_value(desired)
+
+
+def parameter_delta(current: Dict[str, str], desired: Dict[str, str],
+                    defaults: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Get the desired parameters whose values differ from current.
+    
+    Parameters missing from current have their default value; setupc list
+    only shows parameters that were changed. defaults are the driver defaults
+    from the parameter registry unless given.
+    """
+    if defaults is None:
+        defaults = ParameterRegistry.shared().defaults()
+    return {key: value for key, value in desired.items()
+            if not _values_match(current.get(key), value, defaults.get(key))}
+
+
+def format_parameters(parameters: Dict[str, str]) -> str:
+    """Join parameters into a setupc parameter string, keeping "-" values."""
+    return ",".join(f"{key}={value}" for key, value in parameters.items()) or RESET_VALUE
+
+
+def plan_change_set(change_set: ChangeSet) -> CommandPlan:
+    """Get the commands that apply a change set; raises CommandValidationError for invalid changes.
+    
+    Removals run first to free port names, then changes, then installs.
+    Removals and installs run with --no-update and are followed by one
+    driver update. Every operation runs with --no-update-fnames; one friendly
+    name update follows if a pair was installed or removed or a port name
+    changed.
+    """
+    no_update = SETUPC_OPTIONS["NO_UPDATE"]
+    no_update_fnames = SETUPC_OPTIONS["NO_UPDATE_FNAMES"]
+    operations = []
+    
+    for pair_number in change_set.removals:
+        command_key, command = build_remove(pair_number)
+        operations.append(PlannedCommand(command_key, f"{no_update} {no_update_fnames} {command}",
+                                         f"remove pair {pair_number}"))
+    
+    names_changed = False
+    for change in change_set.changes:
+        command_key, command = build_change(change.port_id, change.parameters)
+        operations.append(PlannedCommand(command_key, f"{no_update_fnames} {command}",
+                                         f"change {change.port_id}: {change.parameters}"))
+        # A bare "-" or "*" may reset or keep the names too
+        parameters = ParameterBuilder.parse_parameter_string(change.parameters)
+        if not parameters or any(name in parameters for name in FRIENDLY_NAME_PARAMETERS):
+            names_changed = True
+    
+    for item in change_set.installs:
+        command_key, command = build_install(item.pair_number, item.params_a, item.params_b)
+        operations.append(PlannedCommand(command_key, f"{no_update} {no_update_fnames} {command}",
+                                         item.describe()))
+    
+    finalize = []
+    if change_set.removals or change_set.installs:
+        finalize.append(PlannedCommand("INSTALL_UPDATE", SETUPC_COMMANDS["INSTALL_UPDATE"], "update driver"))
+    if change_set.removals or change_set.installs or names_changed:
+        finalize.append(PlannedCommand("UPDATEFNAMES", SETUPC_COMMANDS["UPDATEFNAMES"], "update friendly names"))
+    return CommandPlan(operations, finalize)
+
+
+class DurationEstimator:
+    """Expected setupc command durations by SETUPC_COMMANDS key.
+    
+    Uses the median execution time recorded in this session's metrics, or
+    failing that, the median of the most recent successful journal entries.
+    """
+    
+    def __init__(self, metrics: Optional[CommandMetrics] = None, journal: Optional[CommandJournal] = None):
+        self.metrics = metrics
+        self.journal = journal
+        self._journal_medians: Dict[str, Optional[float]] = {}
+    
+    def estimate(self, command_key: str) -> Tuple[Optional[float], str]:
+        """Get (seconds, ESTIMATE_SOURCE_*) for one command type; seconds is None without data."""
+        if self.metrics is not None:
+            type_metrics = self.metrics.command_types.get(command_key)
+            if type_metrics is not None and type_metrics.count:
+                return type_metrics.duration.quantiles()[0.5], ESTIMATE_SOURCE_SESSION
+        
+        if self.journal is not None:
+            if command_key not in self._journal_medians:
+                entries = self.journal.query(command_type=command_key, success=True,
+                                             limit=ESTIMATE_JOURNAL_SAMPLE_SIZE)
+                self._journal_medians[command_key] = (
+                    statistics.median(entry.execution_time for entry in entries) if entries else None)
+            median = self._journal_medians[command_key]
+            if median is not None:
+                return median, ESTIMATE_SOURCE_JOURNAL
+        
+        return None, ESTIMATE_SOURCE_NONE
+
+
+def estimate_plan(plan: CommandPlan, estimator: DurationEstimator, include_refresh: bool = True) -> PlanEstimate:
+    """Estimate each planned command; setupc writes run one at a time, so durations add up.
+    
+    include_refresh adds the port list refresh that follows a non-empty plan.
+    """
+    commands = plan.commands()
+    if include_refresh and commands:
+        commands.append(PlannedCommand("LIST", SETUPC_COMMANDS["LIST"], "refresh port list"))
+    
+    estimates = []
+    for planned in commands:
+        seconds, source = estimator.estimate(planned.command_key)
+        estimates.append(CommandEstimate(planned, seconds, source))
+    return PlanEstimate(estimates)
+
+
+def format_duration(seconds: float) -> str:
+    """Format an estimated duration for display, e.g. "2 min 05 s"."""
+    if seconds < 10:
+        return f"{seconds:.1f} s"
+    minutes, seconds = divmod(round(seconds), 60)
+    if minutes < 1:
+        return f"{seconds} s"
+    hours, minutes = divmod(minutes, 60)
+    if hours < 1:
+        return f"{minutes} min {seconds:02d} s"
+    return f"{hours} h {minutes:02d} min"
\ No newline at end of file
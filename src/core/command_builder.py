@@ -0,0 +1,60 @@
+"""Qt-free setupc command construction and classification."""
+
+from typing import Optional, Tuple
+
+from .validators import ParameterValidator, ParameterBuilder
+from ..utils.constants import (SETUPC_COMMANDS, SETUPC_COMMAND_ACCESS, COMMAND_ACCESS_READ, COMMAND_ACCESS_WRITE,
+                               SPECIAL_PARAMETER_VALUES)
+
+
+class CommandValidationError(ValueError):
+    """Command arguments rejected before anything was run."""
+
+
+def is_read_command(command_key: str) -> bool:
+    """Check if a SETUPC_COMMANDS key only reads driver state."""
+    return SETUPC_COMMAND_ACCESS.get(command_key, COMMAND_ACCESS_WRITE) == COMMAND_ACCESS_READ
+
+
+def validate_parameters(param_string: str, label: str) -> None:
+    """Check a setupc parameter string's format and values.
+    
+    A value of "-" resets a parameter to its default and is always accepted.
+    """
+    valid, error = ParameterValidator.validate_parameter_string(param_string)
+    if valid:
+        parameters = ParameterBuilder.parse_parameter_string(param_string)
+        valid, _, error = ParameterBuilder.validate_and_build(
+            {key: value for key, value in parameters.items() if value != SPECIAL_PARAMETER_VALUES["DEFAULT"]})
+    if not valid:
+        raise CommandValidationError(f"Invalid parameters for {label}: {error}")
+
+
+def build_install(pair_number: Optional[int], params_a: str, params_b: str) -> Tuple[str, str]:
+    """Validate install arguments; returns (command_key, command)."""
+    validate_parameters(params_a, "port A")
+    validate_parameters(params_b, "port B")
+    if pair_number is None:
+        return "INSTALL_AUTO", SETUPC_COMMANDS["INSTALL_AUTO"].format(params_a, params_b)
+    
+    valid, error = ParameterValidator.validate_port_number(pair_number)
+    if not valid:
+        raise CommandValidationError(f"Invalid port number: {error}")
+    return "INSTALL_NUMBERED", SETUPC_COMMANDS["INSTALL_NUMBERED"].format(pair_number, params_a, params_b)
+
+
+def build_remove(pair_number: int) -> Tuple[str, str]:
+    """Validate remove arguments; returns (command_key, command)."""
+    valid, error = ParameterValidator.validate_port_number(pair_number)
+    if not valid:
+        raise CommandValidationError(f"Invalid port number: {error}")
+    return "REMOVE", SETUPC_COMMANDS["REMOVE"].format(pair_number)
+
+
+def build_change(port_id: str, parameters: str) -> Tuple[str, str]:
+    """Validate change arguments; returns (command_key, command)."""
+    valid, error = ParameterValidator.validate_port_identifier(port_id)
+    if not valid:
+        raise CommandValidationError(f"Invalid port identifier: {error}")
+    validate_parameters(parameters, port_id)
+    return "CHANGE", SETUPC_COMMANDS["CHANGE"].format(port_id, parameters)
\ No newline at end of file
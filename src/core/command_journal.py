@@ -0,0 +1,234 @@
+"""Persistent journal of executed setupc.exe commands."""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from .models import CommandResult, JournalEntry
+from ..utils.constants import (JOURNAL_BATCH_SIZE, JOURNAL_FLUSH_INTERVAL, JOURNAL_MAX_ENTRIES,
+                              JOURNAL_MAX_TEXT_LENGTH, JOURNAL_QUERY_LIMIT)
+
+# Queue markers for the writer thread
+_FLUSH = object()
+_STOP = object()
+
+
+class CommandJournal:
+    """Append-only SQLite journal of command results.
+    
+    record() only queues the entry; a background thread writes queued
+    entries in batches, one transaction per batch, so the caller (usually
+    the UI thread) never waits on the disk. Queries may run from any thread
+    and see every entry recorded before they were called.
+    """
+    
+    SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS commands (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            finished_at REAL NOT NULL,
+            command_type TEXT NOT NULL,
+            command TEXT NOT NULL,
+            success INTEGER NOT NULL,
+            cancelled INTEGER NOT NULL,
+            return_code INTEGER NOT NULL,
+            execution_time REAL NOT NULL,
+            output TEXT NOT NULL,
+            error TEXT NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS commands_finished_at ON commands (finished_at)",
+        "CREATE INDEX IF NOT EXISTS commands_type_finished_at ON commands (command_type, finished_at)",
+    )
+    COLUMNS = ("id, finished_at, command_type, command, success, cancelled, "
+               "return_code, execution_time, output, error")
+    
+    def __init__(self, path, batch_size: int = JOURNAL_BATCH_SIZE,
+                 flush_interval: float = JOURNAL_FLUSH_INTERVAL):
+        self.path = str(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._available = True  # Cleared if the database cannot be opened
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run_writer, name="CommandJournalWriter", daemon=True)
+        self._writer.start()
+    
+    def record(self, command_type: str, result: CommandResult, finished_at: Optional[float] = None) -> None:
+        """Queue a command result to be written."""
+        if self._closed or not self._available:
+            return
+        
+        self._queue.put(JournalEntry(
+            command_type=command_type,
+            command=result.command,
+            success=result.success,
+            finished_at=finished_at if finished_at is not None else time.time(),
+            execution_time=result.execution_time,
+            return_code=result.return_code,
+            cancelled=result.cancelled,
+            output=result.output[:JOURNAL_MAX_TEXT_LENGTH],
+            error=result.error[:JOURNAL_MAX_TEXT_LENGTH]
+        ))
+    
+    def flush(self) -> None:
+        """Wait until every queued entry has been written."""
+        if self._closed:
+            return
+        self._queue.put(_FLUSH)
+        self._queue.join()
+    
+    def close(self) -> None:
+        """Write queued entries and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+    
+    def query(self, command_type: Optional[str] = None, since: Optional[float] = None,
+              until: Optional[float] = None, success: Optional[bool] = None,
+              limit: Optional[int] = JOURNAL_QUERY_LIMIT) -> List[JournalEntry]:
+        """Get recorded entries, newest first.
+        
+        command_type filters by SETUPC_COMMANDS key, since/until by finish
+        time (Unix timestamps, inclusive) and success by outcome. Entries
+        still queued are written first.
+        """
+        self.flush()
+        if not self._available:
+            return []
+        
+        conditions = []
+        parameters = []
+        if command_type is not None:
+            conditions.append("command_type = ?")
+            parameters.append(command_type)
+        if since is not None:
+            conditions.append("finished_at >= ?")
+            parameters.append(since)
+        if until is not None:
+            conditions.append("finished_at <= ?")
+            parameters.append(until)
+        if success is not None:
+            conditions.append("success = ?")
+            parameters.append(int(success))
+        
+        sql = f"SELECT {self.COLUMNS} FROM commands"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY finished_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        
+        try:
+            connection = sqlite3.connect(self.path)
+            try:
+                rows = connection.execute(sql, parameters).fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to query command journal: {e}")
+            return []
+        
+        return [self._entry_from_row(row) for row in rows]
+    
+    def get_command_types(self) -> List[str]:
+        """Get the command types present in the journal."""
+        self.flush()
+        if not self._available:
+            return []
+        
+        try:
+            connection = sqlite3.connect(self.path)
+            try:
+                rows = connection.execute("SELECT DISTINCT command_type FROM commands ORDER BY command_type").fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to query command journal: {e}")
+            return []
+        
+        return [row[0] for row in rows]
+    
+    @staticmethod
+    def _entry_from_row(row) -> JournalEntry:
+        """Build an entry from a row selected with COLUMNS."""
+        entry_id, finished_at, command_type, command, success, cancelled, return_code, execution_time, output, error = row
+        return JournalEntry(
+            command_type=command_type,
+            command=command,
+            success=bool(success),
+            finished_at=finished_at,
+            execution_time=execution_time,
+            return_code=return_code,
+            cancelled=bool(cancelled),
+            output=output,
+            error=error,
+            id=entry_id
+        )
+    
+    # Writer thread
+    def _run_writer(self) -> None:
+        """Write queued entries in batches until stopped."""
+        connection = self._open()
+        
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            
+            # Gather more entries for the same transaction, unless asked to flush or stop
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not _FLUSH and batch[-1] is not _STOP:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            entries = [item for item in batch if isinstance(item, JournalEntry)]
+            stopping = any(item is _STOP for item in batch)
+            if entries and connection is not None:
+                self._write(connection, entries)
+            
+            for _ in batch:
+                self._queue.task_done()
+        
+        if connection is not None:
+            connection.close()
+    
+    def _open(self) -> Optional[sqlite3.Connection]:
+        """Open the database, create the schema and prune old entries."""
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode=WAL")  # Readers do not block the writer
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+            connection.execute("DELETE FROM commands WHERE id <= (SELECT MAX(id) FROM commands) - ?",
+                               (JOURNAL_MAX_ENTRIES,))
+            connection.commit()
+            return connection
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Command journal unavailable ({self.path}): {e}")
+            self._available = False
+            return None
+    
+    def _write(self, connection: sqlite3.Connection, entries: List[JournalEntry]) -> None:
+        """Insert entries in one transaction."""
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO commands (finished_at, command_type, command, success, cancelled, "
+                    "return_code, execution_time, output, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(entry.finished_at, entry.command_type, entry.command, int(entry.success),
+                      int(entry.cancelled), entry.return_code, entry.execution_time,
+                      entry.output, entry.error) for entry in entries]
+                )
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to write {len(entries)} command journal entries: {e}")
\ No newline at end of file
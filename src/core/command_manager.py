@@ -1,89 +1,421 @@
 """Command manager for interfacing with setupc.exe."""
 
+import codecs
+import hashlib
+import heapq
+import itertools
+import json
+import locale
+import queue
+import re
 import subprocess
 import threading
 import time
 import os
-from typing import List, Optional, Callable
-from PyQt6.QtCore import QObject, pyqtSignal, QThread, QTimer
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Callable, Tuple
+from PyQt6.QtCore import QObject, pyqtSignal, QThreadPool, QTimer
 
-from .models import PortPair, CommandResult, DriverInfo, DriverStatus, PortListParser
-from .validators import ParameterValidator
-from ..utils.constants import DEFAULT_SETUPC_PATH, DEFAULT_COMMAND_TIMEOUT, SETUPC_COMMANDS
+from .models import (PortPair, CommandResult, DriverInfo, DriverStatus, PortListParser, BatchInstallItem,
+                     PortSnapshot, CommandPlan, ChangeSet, PortChange)
+from .change_planner import DurationEstimator, format_parameters, parameter_delta, plan_change_set
+from .command_builder import CommandValidationError, is_read_command, build_install
+from .command_journal import CommandJournal
+from .command_metrics import CommandMetrics
+from .process_control import process_group_options, stop_process_tree, kill_process_tree
+from .setupc_runner import run_setupc
+from .validators import ParameterValidator, ParameterBuilder
+from ..utils.constants import (DEFAULT_SETUPC_PATH, DEFAULT_COMMAND_TIMEOUT, SETUPC_COMMANDS, SETUPC_OPTIONS,
+                              EXECUTION_MODES, EXECUTION_MODE_SESSION, DEFAULT_EXECUTION_MODE,
+                              SETUPC_SESSION_PROMPT, SETUPC_SESSION_STARTUP_TIMEOUT,
+                              SETUPC_SESSION_CLOSE_TIMEOUT, MAX_CONCURRENT_COMMANDS,
+                              COMMAND_PRIORITY_MUTATION, COMMAND_PRIORITY_READ,
+                              DEFAULT_REFRESH_COALESCE_WINDOW, DEFAULT_CANCEL_GRACE_PERIOD,
+                              DEFAULT_CANCEL_TERMINATE_GRACE_PERIOD, DRIVER_STATUS_MAX_AGE,
+                              DEFAULT_METRICS_EXPORT_INTERVAL)
 
 
-class SetupCommandWorker(QThread):
-    """Worker thread for executing setupc.exe commands."""
+class SetupcSession:
+    """Long-lived interactive setupc.exe process shared by consecutive commands.
     
-    command_finished = pyqtSignal(CommandResult)
+    setupc.exe started without arguments reads commands from stdin and prints
+    its prompt after each one completes. The prompt is used as the sentinel
+    that frames the output of each command. Interactive mode does not report
+    per-command exit codes, so failures are detected from the output text.
+    """
     
-    def __init__(self, command: str, timeout: int = DEFAULT_COMMAND_TIMEOUT, working_directory: Optional[str] = None):
-        super().__init__()
-        self.command = command
-        self.timeout = timeout
+    # Output that indicates a failed command in interactive mode
+    ERROR_PATTERN = re.compile(r"\b(error|failed|invalid|can't|cannot|not found)\b", re.IGNORECASE)
+    
+    def __init__(self, setupc_path: str, working_directory: Optional[str] = None):
+        self.setupc_path = setupc_path
         self.working_directory = working_directory
-        self.result = None
+        self.restart_count = 0
+        self._process = None
+        self._output_queue = None
+        self._lock = threading.Lock()
     
-    def run(self):
-        """Execute the command in background thread."""
-        start_time = time.time()
+    def is_alive(self) -> bool:
+        """Check if the setupc.exe process is running."""
+        return self._process is not None and self._process.poll() is None
+    
+    def execute(self, command: str, timeout: int = DEFAULT_COMMAND_TIMEOUT,
+                line_callback: Optional[Callable[[str], None]] = None) -> CommandResult:
+        """Run one setupc command in the session, restarting the process if needed.
         
-        try:
-            result = subprocess.run(
-                self.command.split(),
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                shell=False,  # Security: don't use shell
-                cwd=self.working_directory  # Set working directory for .inf file access
-            )
+        line_callback, if given, is called with each output line as it arrives.
+        """
+        with self._lock:
+            start_time = time.time()
+            full_command = f"{self.setupc_path} {command}"
             
-            execution_time = time.time() - start_time
+            try:
+                if not self.is_alive():
+                    if self._process is not None:
+                        self.restart_count += 1
+                    self._start()
+                
+                self._process.stdin.write(f"{command}\n".encode(self._encoding()))
+                self._process.stdin.flush()
+                output, complete = self._read_until_prompt(start_time + timeout, line_callback)
             
-            command_result = CommandResult(
-                success=result.returncode == 0,
-                output=result.stdout,
-                error=result.stderr,
-                return_code=result.returncode,
-                execution_time=execution_time,
-                command=self.command
-            )
+            except FileNotFoundError:
+                self._kill()
+                return CommandResult(
+                    success=False,
+                    error="setupc.exe not found. Please ensure com0com is installed and setupc.exe is in your PATH.",
+                    return_code=-2,
+                    execution_time=time.time() - start_time,
+                    command=full_command
+                )
             
-        except subprocess.TimeoutExpired:
-            execution_time = time.time() - start_time
-            command_result = CommandResult(
-                success=False,
-                output="",
-                error=f"Command timed out after {self.timeout} seconds",
-                return_code=-1,
-                execution_time=execution_time,
-                command=self.command
-            )
+            except (OSError, TimeoutError) as e:
+                self._kill()
+                return CommandResult(
+                    success=False,
+                    error=f"setupc.exe session failed: {str(e)}",
+                    return_code=-3,
+                    execution_time=time.time() - start_time,
+                    command=full_command
+                )
             
-        except FileNotFoundError:
             execution_time = time.time() - start_time
-            command_result = CommandResult(
-                success=False,
-                output="",
-                error="setupc.exe not found. Please ensure com0com is installed and setupc.exe is in your PATH.",
-                return_code=-2,
+            
+            if not complete:
+                # Either the timeout expired or the process exited mid-command;
+                # the next command starts a fresh process
+                timed_out = self.is_alive()
+                self._kill()
+                return CommandResult(
+                    success=False,
+                    output=output,
+                    error=(f"Command timed out after {timeout} seconds" if timed_out
+                           else "setupc.exe session terminated unexpectedly"),
+                    return_code=-1,
+                    execution_time=execution_time,
+                    command=full_command
+                )
+            
+            failed = bool(self.ERROR_PATTERN.search(output))
+            return CommandResult(
+                success=not failed,
+                output=output,
+                error=output.strip() if failed else "",
+                return_code=1 if failed else 0,
                 execution_time=execution_time,
-                command=self.command
+                command=full_command
             )
+    
+    def stop(self, grace_period: float, terminate_grace_period: float) -> None:
+        """Stop the setupc.exe process tree without waiting for the running command.
+        
+        Called from outside the executing thread; the interrupted command
+        returns an incomplete result and the next command starts a fresh process.
+        """
+        process = self._process
+        if process is not None:
+            stop_process_tree(process, grace_period, terminate_grace_period)
+    
+    def close(self) -> None:
+        """Ask setupc.exe to quit and make sure the process is gone."""
+        with self._lock:
+            if self.is_alive():
+                try:
+                    self._process.stdin.write(f"{SETUPC_COMMANDS['QUIT']}\n".encode(self._encoding()))
+                    self._process.stdin.flush()
+                    self._process.wait(SETUPC_SESSION_CLOSE_TIMEOUT)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+            self._kill()
+    
+    def _start(self) -> None:
+        """Start setupc.exe in interactive mode and wait for its first prompt."""
+        self._process = subprocess.Popen(
+            [self.setupc_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+            shell=False,  # Security: don't use shell
+            cwd=self.working_directory,  # Set working directory for .inf file access
+            **process_group_options()
+        )
+        self._output_queue = queue.Queue()
+        reader = threading.Thread(
+            target=self._read_output,
+            args=(self._process.stdout, self._output_queue),
+            daemon=True
+        )
+        reader.start()
+        
+        # Discard the banner printed before the first prompt
+        _, ready = self._read_until_prompt(time.time() + SETUPC_SESSION_STARTUP_TIMEOUT)
+        if not ready:
+            raise TimeoutError("setupc.exe did not start an interactive session")
+    
+    @staticmethod
+    def _read_output(stream, output_queue: queue.Queue) -> None:
+        """Forward raw process output to the queue until EOF (reader thread)."""
+        while True:
+            data = stream.read(4096)
+            if not data:
+                output_queue.put(None)
+                return
+            output_queue.put(data)
+    
+    def _read_until_prompt(self, deadline: float, line_callback: Optional[Callable[[str], None]] = None):
+        """Collect output until the prompt sentinel, EOF or the deadline.
+        
+        Complete lines are passed to line_callback as soon as they are read.
+        Returns (output, complete) where complete is False on EOF or timeout.
+        """
+        decoder = codecs.getincrementaldecoder(self._encoding())(errors="replace")
+        buffer = ""
+        emitted = 0  # Length of the buffer prefix already passed to line_callback
+        
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return buffer, False
             
-        except Exception as e:
-            execution_time = time.time() - start_time
-            command_result = CommandResult(
+            try:
+                data = self._output_queue.get(timeout=remaining)
+            except queue.Empty:
+                return buffer, False
+            
+            if data is None:
+                return buffer + decoder.decode(b"", final=True), False
+            
+            buffer += decoder.decode(data)
+            stripped = buffer.rstrip()
+            complete = stripped.endswith(SETUPC_SESSION_PROMPT)
+            if complete:
+                buffer = stripped[:-len(SETUPC_SESSION_PROMPT)]
+            
+            if line_callback is not None:
+                end = len(buffer) if complete else buffer.rfind("\n") + 1
+                if end > emitted:
+                    for line in buffer[emitted:end].splitlines():
+                        line_callback(line)
+                    emitted = end
+            
+            if complete:
+                return buffer, True
+    
+    def _kill(self) -> None:
+        """Forcefully stop the setupc.exe process and its children."""
+        if self._process is not None and self._process.poll() is None:
+            kill_process_tree(self._process)
+    
+    @staticmethod
+    def _encoding() -> str:
+        """Encoding used by setupc.exe for its console output."""
+        return locale.getpreferredencoding(False)
+
+
+@dataclass(order=True)
+class QueuedCommand:
+    """A setupc command waiting in the CommandManager queue.
+    
+    Ordering is by priority, then by submission sequence (FIFO).
+    """
+    priority: int
+    sequence: int
+    command_key: str = field(compare=False)
+    command: str = field(compare=False)
+    callback: Optional[Callable] = field(default=None, compare=False)
+    report_errors: bool = field(default=True, compare=False)  # Emit error_occurred on failure
+    line_handler: Optional[Callable[[str], None]] = field(default=None, compare=False)  # Called per output line (worker thread)
+    future: Future = field(default_factory=Future, compare=False)
+    queued_at: float = field(default_factory=time.monotonic, compare=False)
+    started_at: Optional[float] = field(default=None, compare=False)
+    
+    def get_queue_wait(self) -> float:
+        """Get the seconds the command waited in the queue before starting."""
+        if self.started_at is None:
+            return 0.0
+        return self.started_at - self.queued_at
+    
+    def is_read_only(self) -> bool:
+        """Check if the command only reads driver state."""
+        return is_read_command(self.command_key)
+
+
+class RefreshCoalescer(QObject):
+    """Merges bursts of port list refresh requests into a single list command.
+    
+    A request marks the port snapshot dirty and (re)starts the coalescing
+    window. When the window expires the refresh runs, unless commands are
+    still queued, in which case it waits until the queue drains.
+    """
+    
+    # Emitted when a refresh runs, with the number of requests merged into it
+    refreshes_saved = pyqtSignal(int)
+    
+    def __init__(self, refresh: Callable[[], object], is_busy: Callable[[], bool],
+                 window: int = DEFAULT_REFRESH_COALESCE_WINDOW, parent=None):
+        super().__init__(parent)
+        self._refresh = refresh
+        self._is_busy = is_busy
+        self.dirty = False
+        self.requested_count = 0
+        self.executed_count = 0
+        self._merged = 0
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(window)
+        self._timer.timeout.connect(self._on_window_elapsed)
+    
+    @property
+    def saved_count(self) -> int:
+        """Number of refreshes avoided by coalescing."""
+        return self.requested_count - self.executed_count - (1 if self.dirty else 0)
+    
+    def set_window(self, window: int) -> None:
+        """Set the coalescing window in milliseconds."""
+        if window >= 0:
+            self._timer.setInterval(window)
+    
+    def request(self) -> None:
+        """Mark the snapshot dirty and schedule a coalesced refresh."""
+        self.requested_count += 1
+        if self.dirty:
+            self._merged += 1
+        self.dirty = True
+        self._timer.start()
+    
+    def on_queue_idle(self) -> None:
+        """Run a deferred refresh once no more commands are waiting."""
+        if self.dirty and not self._timer.isActive():
+            self._run()
+    
+    def _on_window_elapsed(self) -> None:
+        """Run the refresh unless more commands are still queued."""
+        if not self._is_busy():
+            self._run()
+    
+    def _run(self) -> None:
+        """Run the single refresh for all merged requests."""
+        merged = self._merged
+        self.dirty = False
+        self._merged = 0
+        self.executed_count += 1
+        self._refresh()
+        
+        if merged:
+            self.refreshes_saved.emit(merged)
+
+
+class SetupCommandWorker(QObject):
+    """Worker executing one setupc.exe command on a CommandManager pool thread.
+    
+    Output is read line by line while the command runs; each line is
+    emitted through output_line (and passed to line_handler, on the worker
+    thread) before the final CommandResult is emitted. finished is emitted
+    last, once the worker is done with the pool thread.
+    """
+    
+    command_finished = pyqtSignal(CommandResult)
+    output_line = pyqtSignal(str)
+    finished = pyqtSignal()
+    
+    def __init__(self, setupc_path: str, command: str, timeout: int = DEFAULT_COMMAND_TIMEOUT,
+                 working_directory: Optional[str] = None, session: Optional[SetupcSession] = None,
+                 line_handler: Optional[Callable[[str], None]] = None):
+        super().__init__()
+        self.setupc_path = setupc_path
+        self.command = command  # setupc arguments, run in their own process unless a session is used
+        self.timeout = timeout
+        self.working_directory = working_directory
+        self.session = session
+        self.line_handler = line_handler
+        self.process = None
+        self.result = None
+        self._cancelled = False
+    
+    def run(self):
+        """Execute the command (pool thread)."""
+        try:
+            self._execute()
+        finally:
+            self.finished.emit()
+    
+    def _execute(self):
+        """Run the command and emit its result."""
+        if self._cancelled:
+            result = CommandResult(success=False, command=f"{self.setupc_path} {self.command}")
+        elif self.session is not None:
+            result = self.session.execute(self.command, self.timeout, self._on_output_line)
+        else:
+            result = run_setupc(self.setupc_path, self.command, self.timeout, self.working_directory,
+                                self._on_output_line, self._on_process_started)
+        
+        # A command that completed before the cancellation took effect keeps its result
+        if self._cancelled and not result.success:
+            result = CommandResult(
                 success=False,
-                output="",
-                error=f"Unexpected error: {str(e)}",
-                return_code=-3,
-                execution_time=execution_time,
-                command=self.command
+                output=result.output,
+                error="Command was cancelled",
+                return_code=-4,
+                execution_time=result.execution_time,
+                command=result.command,
+                cancelled=True
             )
         
-        self.result = command_result
-        self.command_finished.emit(command_result)
+        self.result = result
+        self.command_finished.emit(result)
+    
+    def cancel(self, grace_period: float, terminate_grace_period: float):
+        """Stop the running command, escalating from interrupt to terminate to kill.
+        
+        The process is stopped on a helper thread so the caller does not
+        wait for the grace periods; the worker then finishes with a
+        cancelled result.
+        """
+        self._cancelled = True
+        
+        if self.session is not None:
+            target = lambda: self.session.stop(grace_period, terminate_grace_period)
+        elif self.process is not None:
+            target = lambda: stop_process_tree(self.process, grace_period, terminate_grace_period)
+        else:
+            return  # Not started yet; run() checks the flag
+        
+        threading.Thread(target=target, daemon=True).start()
+    
+    def _on_process_started(self, process: subprocess.Popen):
+        """Keep the running process so cancel() can stop it (pool thread)."""
+        self.process = process
+        if self._cancelled:
+            kill_process_tree(process)
+    
+    def _on_output_line(self, line: str):
+        """Forward one line of command output."""
+        if self.line_handler is not None:
+            self.line_handler(line)
+        self.output_line.emit(line)
 
 
 class CommandManager(QObject):
@@ -94,16 +426,49 @@ class CommandManager(QObject):
     command_completed = pyqtSignal(CommandResult)
     driver_status_changed = pyqtSignal(DriverInfo)
     error_occurred = pyqtSignal(str)
+    queue_depth_changed = pyqtSignal(int)  # Number of commands waiting to run
+    batch_progress = pyqtSignal(int, int, CommandResult)  # (item index, item count, item result)
+    batch_finished = pyqtSignal(list)  # List[CommandResult], one per batch item
+    refreshes_saved = pyqtSignal(int)  # Number of port list refreshes merged into one
+    port_list_warnings = pyqtSignal(list)  # List[str] describing skipped port list lines
+    command_started = pyqtSignal(str)  # Command line, emitted when a queued command starts running
+    output_line = pyqtSignal(str, str)  # (command line, output line) from a running command
+    command_suppressed = pyqtSignal(str, float)  # (command line, estimated seconds saved) for skipped no-op changes
     
     def __init__(self, setupc_path: str = DEFAULT_SETUPC_PATH):
         super().__init__()
         self.setupc_path = setupc_path
         self.timeout = DEFAULT_COMMAND_TIMEOUT
-        self.current_worker = None
+        self.cancel_grace_period = DEFAULT_CANCEL_GRACE_PERIOD
+        self.cancel_terminate_grace_period = DEFAULT_CANCEL_TERMINATE_GRACE_PERIOD
+        self.execution_mode = DEFAULT_EXECUTION_MODE
+        self._pending = []  # Heap of QueuedCommand
+        self._sequence = itertools.count()
+        self._running = {}  # QueuedCommand.sequence -> (QueuedCommand, SetupCommandWorker)
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(MAX_CONCURRENT_COMMANDS)
+        self._session = None
         self._port_pairs_cache = []
+        self._write_count = 0  # Completed write commands, to tell if a list result is current
+        self._last_list_result = None
+        self._last_list_time = 0.0
+        self._last_list_write_count = -1
+        self._snapshot_path = None
+        self._saved_port_pairs = None  # Port pairs last written to the snapshot file
+        self._journal: Optional[CommandJournal] = None
+        self.metrics = CommandMetrics()
+        self._metrics_export_path = None
+        self._metrics_export_timer = QTimer(self)
+        self._metrics_export_timer.timeout.connect(self.export_metrics)
         
+        self._refresh_coalescer = RefreshCoalescer(self.list_ports, self.is_busy, parent=self)
+        self._refresh_coalescer.refreshes_saved.connect(self.refreshes_saved)
+    
     def set_setupc_path(self, path: str) -> None:
         """Set the path to setupc.exe."""
+        if path != self.setupc_path:
+            self.close_session()
+            self._saved_port_pairs = None
         self.setupc_path = path
     
     def set_timeout(self, timeout: int) -> None:
@@ -111,92 +476,440 @@ class CommandManager(QObject):
         if timeout > 0:
             self.timeout = timeout
     
+    def set_cancel_grace_periods(self, grace_period: float, terminate_grace_period: float) -> None:
+        """Set how long cancellation waits after the interrupt and terminate steps."""
+        if grace_period >= 0 and terminate_grace_period >= 0:
+            self.cancel_grace_period = grace_period
+            self.cancel_terminate_grace_period = terminate_grace_period
+    
+    def set_journal(self, journal: Optional[CommandJournal]) -> None:
+        """Set the journal every command result is recorded in (None to stop recording)."""
+        self._journal = journal
+    
+    def set_metrics_export(self, path, interval: int = DEFAULT_METRICS_EXPORT_INTERVAL) -> None:
+        """Write metrics to a Prometheus text file every interval seconds (path None or empty to stop)."""
+        self._metrics_export_path = path or None
+        if self._metrics_export_path is not None and interval > 0:
+            self._metrics_export_timer.start(interval * 1000)
+            self.export_metrics()
+        else:
+            self._metrics_export_timer.stop()
     
-    def _execute_command_async(self, command: str, callback: Optional[Callable] = None) -> None:
-        """Execute setupc command asynchronously."""
-        if self.current_worker and self.current_worker.isRunning():
-            self.error_occurred.emit("Another command is already running. Please wait.")
+    def export_metrics(self) -> bool:
+        """Write the metrics to the export file now, if one is set."""
+        if self._metrics_export_path is None:
+            return False
+        return self.metrics.write_prometheus_file(self._metrics_export_path)
+    
+    def set_snapshot_path(self, path) -> None:
+        """Set the file the last parsed port list is saved to."""
+        self._snapshot_path = path
+    
+    def load_port_snapshot(self) -> Optional[PortSnapshot]:
+        """Load the saved port snapshot if it was taken with the current setupc.exe."""
+        if self._snapshot_path is None:
+            return None
+        
+        try:
+            with open(self._snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = PortSnapshot.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Warning: Failed to load port snapshot from {self._snapshot_path}: {e}")
+            return None
+        
+        if snapshot.setupc_path_hash != self._get_setupc_path_hash():
+            return None
+        return snapshot
+    
+    def _save_port_snapshot(self, port_pairs: List[PortPair]) -> None:
+        """Save the port pairs as the last known snapshot when they changed."""
+        if self._snapshot_path is None or port_pairs == self._saved_port_pairs:
             return
         
-        full_command = f"{self.setupc_path} {command}"
+        snapshot = PortSnapshot(port_pairs, time.time(), self._get_setupc_path_hash())
+        temp_path = f"{self._snapshot_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot.to_dict(), f)
+            os.replace(temp_path, self._snapshot_path)
+            self._saved_port_pairs = port_pairs
+        except OSError as e:
+            print(f"Warning: Failed to save port snapshot to {self._snapshot_path}: {e}")
+    
+    def _get_setupc_path_hash(self) -> str:
+        """Get a hash identifying the configured setupc.exe."""
+        path = os.path.normcase(os.path.abspath(self.setupc_path))
+        return hashlib.sha256(path.encode('utf-8')).hexdigest()
+    
+    def set_refresh_coalesce_window(self, window: int) -> None:
+        """Set the window (ms) in which post-command refreshes are merged."""
+        self._refresh_coalescer.set_window(window)
+    
+    def request_refresh(self) -> None:
+        """Request a port list refresh, merged with other pending requests."""
+        self._refresh_coalescer.request()
+    
+    def get_refresh_stats(self) -> Tuple[int, int, int]:
+        """Get (requested, executed, saved) counts for coalesced refreshes."""
+        coalescer = self._refresh_coalescer
+        return coalescer.requested_count, coalescer.executed_count, coalescer.saved_count
+    
+    def set_execution_mode(self, mode: str) -> None:
+        """Switch between one process per command and a persistent setupc session."""
+        if mode not in EXECUTION_MODES or mode == self.execution_mode:
+            return
+        
+        self.execution_mode = mode
+        if mode != EXECUTION_MODE_SESSION:
+            self.close_session()
+    
+    def close_session(self) -> None:
+        """Stop the persistent setupc session, if one is running."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
+    def shutdown(self) -> None:
+        """Release background resources before the application exits."""
+        self.cancel_all_commands()
+        grace_time = self.cancel_grace_period + self.cancel_terminate_grace_period + SETUPC_SESSION_CLOSE_TIMEOUT
+        self._thread_pool.waitForDone(int(grace_time * 1000))
+        self.close_session()
+        self._metrics_export_timer.stop()
+        self.export_metrics()
+    
+    def _get_session(self, working_directory: Optional[str]) -> SetupcSession:
+        """Get the persistent setupc session, creating it on first use."""
+        if self._session is None:
+            self._session = SetupcSession(self.setupc_path, working_directory)
+        return self._session
+    
+    def _execute_command_async(self, command_key: str, command: str,
+                               callback: Optional[Callable] = None,
+                               priority: Optional[int] = None,
+                               report_errors: bool = True,
+                               line_handler: Optional[Callable[[str], None]] = None) -> Future:
+        """Queue a setupc command for asynchronous execution.
+        
+        Mutating commands run before read-only ones; commands of equal
+        priority run in submission order. The returned future resolves to
+        the CommandResult once the command and its callback have run.
+        line_handler is called on the worker thread with each output line.
+        """
+        if priority is None:
+            priority = COMMAND_PRIORITY_READ if is_read_command(command_key) else COMMAND_PRIORITY_MUTATION
+        
+        request = QueuedCommand(priority, next(self._sequence), command_key, command, callback, report_errors,
+                                line_handler)
+        heapq.heappush(self._pending, request)
+        self.queue_depth_changed.emit(len(self._pending))
+        
+        self._dispatch_next()
+        return request.future
+    
+    def _dispatch_next(self) -> None:
+        """Start queued commands as far as the access rules allow.
+        
+        Reads run concurrently, up to the pool size; a write runs only when
+        nothing else is running, and a queued write blocks later reads from
+        starting so it is not starved.
+        """
+        started = False
+        while self._pending and self._can_start(self._pending[0]):
+            self._start_command(heapq.heappop(self._pending))
+            started = True
+        
+        if started:
+            self.queue_depth_changed.emit(len(self._pending))
+    
+    def _can_start(self, request: QueuedCommand) -> bool:
+        """Check if a command may start alongside the running ones."""
+        if not self._running:
+            return True
+        if not request.is_read_only():
+            return False
+        if any(not running.is_read_only() for running, _ in self._running.values()):
+            return False
         
+        # A persistent session runs one command at a time
+        limit = 1 if self.execution_mode == EXECUTION_MODE_SESSION else self._thread_pool.maxThreadCount()
+        return len(self._running) < limit
+    
+    def _start_command(self, request: QueuedCommand) -> None:
+        """Start a command on the thread pool."""
         # Extract working directory from setupc.exe path for .inf file access
         working_directory = os.path.dirname(self.setupc_path) if self.setupc_path else None
         
-        self.current_worker = SetupCommandWorker(full_command, self.timeout, working_directory)
-        self.current_worker.command_finished.connect(self._on_command_finished)
+        full_command = f"{self.setupc_path} {request.command}"
+        session = self._get_session(working_directory) if self.execution_mode == EXECUTION_MODE_SESSION else None
+        worker = SetupCommandWorker(self.setupc_path, request.command, self.timeout, working_directory, session,
+                                    request.line_handler)
         
-        if callback:
-            self.current_worker.command_finished.connect(callback)
+        worker.output_line.connect(lambda line: self.output_line.emit(full_command, line))
+        worker.command_finished.connect(lambda result: self._on_command_finished(request, result))
+        worker.finished.connect(lambda: self._on_worker_finished(request, worker))
         
-        self.current_worker.start()
+        request.started_at = time.monotonic()
+        self._running[request.sequence] = (request, worker)
+        self.command_started.emit(full_command)
+        self._thread_pool.start(worker.run)
     
-    def _on_command_finished(self, result: CommandResult) -> None:
+    def _on_command_finished(self, request: QueuedCommand, result: CommandResult) -> None:
         """Handle command completion."""
+        if not request.is_read_only():
+            self._write_count += 1
+        
+        self.metrics.record(request.command_key, result, request.get_queue_wait())
+        if self._journal is not None:
+            self._journal.record(request.command_key, result)
+        
         self.command_completed.emit(result)
         
-        if not result.success:
+        if result.cancelled:
+            # Stopped on request: only resolve the future
+            if not request.future.done():
+                request.future.set_result(result)
+            return
+        
+        if not result.success and request.report_errors:
             self.error_occurred.emit(result.get_error_message())
+        
+        if request.callback:
+            request.callback(result)
+        
+        if not request.future.done():
+            request.future.set_result(result)
+    
+    def _on_worker_finished(self, request: QueuedCommand, worker: SetupCommandWorker) -> None:
+        """Release the command's slot once its worker has finished."""
+        if not request.future.done():
+            # The thread stopped without reporting a result (e.g. it was terminated)
+            request.future.set_result(CommandResult(
+                success=False,
+                error="Command was interrupted",
+                return_code=-3,
+                command=request.command
+            ))
+        
+        self._running.pop(request.sequence, None)
+        worker.deleteLater()
+        
+        self._dispatch_next()
+        if not self.is_busy():
+            self._refresh_coalescer.on_queue_idle()
     
-    def list_ports(self) -> None:
+    def get_queue_depth(self) -> int:
+        """Get the number of commands waiting to run."""
+        return len(self._pending)
+    
+    def get_running_count(self) -> int:
+        """Get the number of commands currently running."""
+        return len(self._running)
+    
+    def list_ports(self) -> Optional[Future]:
         """Get all current port pairs asynchronously."""
+        return self._list_ports(report_driver_status=False)
+    
+    def probe_startup(self) -> Future:
+        """Load the port snapshot and the driver status with one list command.
+        
+        port_list_updated and driver_status_changed are both emitted from
+        the single execution. The returned future resolves to
+        (List[PortPair], DriverInfo).
+        """
+        probe_future = Future()
+        
+        def finish_probe(list_future: Future):
+            result = list_future.result()
+            port_pairs = self.get_cached_port_pairs() if result.success else []
+            probe_future.set_result((port_pairs, self._get_driver_info(result)))
+        
+        self._list_ports(report_driver_status=True).add_done_callback(finish_probe)
+        return probe_future
+    
+    def _list_ports(self, report_driver_status: bool) -> Future:
+        """Run list, updating the port snapshot and optionally the driver status."""
+        # Lines are parsed on the worker thread as setupc prints them
+        parser = PortListParser()
+        
         def handle_list_result(result: CommandResult):
+            self._last_list_result = result
+            self._last_list_time = time.monotonic()
+            self._last_list_write_count = self._write_count
+            
+            if report_driver_status:
+                self.driver_status_changed.emit(self._get_driver_info(result))
+            
             if result.success:
                 try:
-                    port_pairs = PortListParser.parse_port_list(result.output)
+                    if parser.line_number == 0 and result.output:
+                        parser.feed(result.output.splitlines())
+                    port_pairs = parser.get_port_pairs()
+                    malformed_lines = parser.malformed_lines
                     self._port_pairs_cache = port_pairs
                     self.port_list_updated.emit(port_pairs)
+                    self._save_port_snapshot(port_pairs)
+                    if malformed_lines:
+                        self.port_list_warnings.emit([
+                            f"Line {line_number}: {reason}: {line}"
+                            for line_number, line, reason in malformed_lines
+                        ])
                 except Exception as e:
                     self.error_occurred.emit(f"Failed to parse port list: {str(e)}")
-            else:
+            elif not report_driver_status:
                 self.error_occurred.emit(f"Failed to list ports: {result.get_error_message()}")
         
-        self._execute_command_async(SETUPC_COMMANDS["LIST"], handle_list_result)
+        return self._execute_command_async("LIST", SETUPC_COMMANDS["LIST"], handle_list_result,
+                                           line_handler=parser.feed_line)
     
-    def refresh_port_list(self) -> None:
+    def refresh_port_list(self) -> Optional[Future]:
         """Refresh the port list (convenience method)."""
-        self.list_ports()
+        return self.list_ports()
     
     def get_cached_port_pairs(self) -> List[PortPair]:
         """Get the last cached port pairs list."""
         return self._port_pairs_cache.copy()
     
-    def install_port_pair(self, pair_number: Optional[int] = None, 
-                         params_a: str = "-", params_b: str = "-") -> None:
-        """Install new port pair."""
-        # Validate parameters
-        if params_a != "-":
-            valid, error = ParameterValidator.validate_parameter_string(params_a)
-            if not valid:
-                self.error_occurred.emit(f"Invalid parameters for port A: {error}")
-                return
+    def _build_install_command(self, pair_number: Optional[int], params_a: str,
+                               params_b: str) -> Tuple[str, str, str]:
+        """Validate install arguments and build the command.
         
-        if params_b != "-":
-            valid, error = ParameterValidator.validate_parameter_string(params_b)
-            if not valid:
-                self.error_occurred.emit(f"Invalid parameters for port B: {error}")
-                return
-        
-        # Build command
-        if pair_number is not None:
-            valid, error = ParameterValidator.validate_port_number(pair_number)
-            if not valid:
-                self.error_occurred.emit(f"Invalid port number: {error}")
-                return
-            command = SETUPC_COMMANDS["INSTALL_NUMBERED"].format(pair_number, params_a, params_b)
-        else:
-            command = SETUPC_COMMANDS["INSTALL_AUTO"].format(params_a, params_b)
+        Returns (command_key, command, error); error is empty when valid.
+        """
+        try:
+            command_key, command = build_install(pair_number, params_a, params_b)
+        except CommandValidationError as e:
+            return "", "", str(e)
+        return command_key, command, ""
+    
+    def install_port_pair(self, pair_number: Optional[int] = None,
+                         params_a: str = "-", params_b: str = "-") -> Optional[Future]:
+        """Install new port pair."""
+        command_key, command, error = self._build_install_command(pair_number, params_a, params_b)
+        if error:
+            self.error_occurred.emit(error)
+            return
         
         def handle_install_result(result: CommandResult):
             if result.success:
                 # Refresh port list after successful installation
-                self.list_ports()
+                self.request_refresh()
             else:
                 self.error_occurred.emit(f"Failed to install port pair: {result.get_error_message()}")
         
-        self._execute_command_async(command, handle_install_result)
+        return self._execute_command_async(command_key, command, handle_install_result)
     
-    def remove_port_pair(self, pair_number: int) -> None:
+    def install_port_pairs(self, items: List[BatchInstallItem]) -> Future:
+        """Install several port pairs with a single driver update at the end.
+        
+        Each install runs with --no-update and --no-update-fnames; once all
+        of them have completed, one driver update (plain ``install``), one
+        friendly name update and one port list refresh are queued. Progress
+        is reported per item through batch_progress, and the returned future
+        resolves to the per-item CommandResult list (also sent through
+        batch_finished).
+        """
+        batch_future = Future()
+        total = len(items)
+        results = [None] * total
+        options = f"{SETUPC_OPTIONS['NO_UPDATE']} {SETUPC_OPTIONS['NO_UPDATE_FNAMES']}"
+        outstanding = set()
+        
+        def finish_batch():
+            self.batch_finished.emit(results)
+            if not batch_future.done():
+                batch_future.set_result(results)
+        
+        def finalize_batch():
+            if not any(result.success for result in results):
+                finish_batch()
+                return
+            
+            # Apply all deferred driver and friendly name updates at once
+            self._execute_command_async("INSTALL_UPDATE", SETUPC_COMMANDS["INSTALL_UPDATE"])
+            update_future = self._execute_command_async("UPDATEFNAMES", SETUPC_COMMANDS["UPDATEFNAMES"])
+            update_future.add_done_callback(lambda future: finish_batch())
+            self.request_refresh()
+        
+        def record_result(index: int, result: CommandResult):
+            results[index] = result
+            outstanding.discard(index)
+            self.batch_progress.emit(index, total, result)
+            if not outstanding:
+                finalize_batch()
+        
+        commands = []
+        for index, item in enumerate(items):
+            command_key, command, error = self._build_install_command(item.pair_number, item.params_a, item.params_b)
+            if error:
+                results[index] = CommandResult(success=False, error=error, command=item.describe())
+                self.batch_progress.emit(index, total, results[index])
+            else:
+                outstanding.add(index)
+                commands.append((index, command_key, f"{options} {command}"))
+        
+        if not commands:
+            finish_batch()
+            return batch_future
+        
+        # Futures resolve for cancelled items too, so the batch always completes
+        for index, command_key, command in commands:
+            item_future = self._execute_command_async(command_key, command, report_errors=False)
+            item_future.add_done_callback(lambda future, index=index: record_result(index, future.result()))
+        
+        return batch_future
+    
+    def run_plan(self, plan: CommandPlan) -> Future:
+        """Run a command plan's operations in order, then its driver update once.
+        
+        Operations are queued together and run one at a time in plan order.
+        Progress is reported through batch_progress and batch_finished like
+        install_port_pairs, and the returned future resolves to the operation
+        results.
+        """
+        plan_future = Future()
+        total = len(plan.operations)
+        results = [None] * total
+        outstanding = set(range(total))
+        
+        def finish_plan():
+            self.batch_finished.emit(results)
+            if not plan_future.done():
+                plan_future.set_result(results)
+        
+        def record_result(index: int, result: CommandResult):
+            results[index] = result
+            outstanding.discard(index)
+            self.batch_progress.emit(index, total, result)
+            if outstanding:
+                return
+            if not any(result.success for result in results):
+                finish_plan()
+                return
+            
+            if not plan.finalize:
+                self.request_refresh()
+                finish_plan()
+                return
+            
+            final_futures = [self._execute_command_async(planned.command_key, planned.command)
+                             for planned in plan.finalize]
+            final_futures[-1].add_done_callback(lambda future: finish_plan())
+            self.request_refresh()
+        
+        if not plan.operations:
+            finish_plan()
+            return plan_future
+        
+        for index, planned in enumerate(plan.operations):
+            item_future = self._execute_command_async(planned.command_key, planned.command, report_errors=False)
+            item_future.add_done_callback(lambda future, index=index: record_result(index, future.result()))
+        
+        return plan_future
+    
+    def remove_port_pair(self, pair_number: int) -> Optional[Future]:
         """Remove existing port pair."""
         valid, error = ParameterValidator.validate_port_number(pair_number)
         if not valid:
@@ -208,14 +921,18 @@ class CommandManager(QObject):
         def handle_remove_result(result: CommandResult):
             if result.success:
                 # Refresh port list after successful removal
-                self.list_ports()
+                self.request_refresh()
             else:
                 self.error_occurred.emit(f"Failed to remove port pair: {result.get_error_message()}")
         
-        self._execute_command_async(command, handle_remove_result)
+        return self._execute_command_async("REMOVE", command, handle_remove_result)
     
-    def change_port_config(self, port_id: str, parameters: str) -> None:
-        """Modify port parameters."""
+    def change_port_config(self, port_id: str, parameters: str) -> Optional[Future]:
+        """Modify port parameters.
+        
+        Only parameters that differ from the cached port state are sent; when
+        none do, setupc is not run and the future resolves to None.
+        """
         valid, error = ParameterValidator.validate_port_identifier(port_id)
         if not valid:
             self.error_occurred.emit(f"Invalid port identifier: {error}")
@@ -226,72 +943,154 @@ class CommandManager(QObject):
             self.error_occurred.emit(f"Invalid parameters: {error}")
             return
         
+        delta = self._get_parameter_delta(port_id, parameters)
+        if delta is not None:
+            if not delta:
+                self._suppress_change(port_id, parameters)
+                future = Future()
+                future.set_result(None)
+                return future
+            parameters = format_parameters(delta)
+        
         command = SETUPC_COMMANDS["CHANGE"].format(port_id, parameters)
         
         def handle_change_result(result: CommandResult):
             if result.success:
                 # Refresh port list after successful change
-                self.list_ports()
+                self.request_refresh()
             else:
                 self.error_occurred.emit(f"Failed to change port configuration: {result.get_error_message()}")
         
-        self._execute_command_async(command, handle_change_result)
+        return self._execute_command_async("CHANGE", command, handle_change_result)
     
-    def get_driver_status(self) -> None:
-        """Check driver installation status."""
-        def handle_list_result(result: CommandResult):
-            if result.success:
-                # If list command works, driver is installed
-                driver_info = DriverInfo(
-                    status=DriverStatus.INSTALLED,
-                    install_path=self.setupc_path
-                )
+    def change_ports_config(self, port_ids: List[str], parameters: str) -> Optional[Future]:
+        """Apply the same parameter change to several ports with one refresh at the end.
+        
+        Every port and the parameters are validated before anything is
+        queued; the change commands then run back to back through run_plan,
+        without a driver update. Ports that already match are skipped.
+        """
+        changes = [PortChange(port_id, parameters) for port_id in port_ids]
+        try:
+            plan_change_set(ChangeSet(changes=changes))
+        except CommandValidationError as e:
+            self.error_occurred.emit(str(e))
+            return
+        
+        needed = []
+        skipped = []
+        for change in changes:
+            delta = self._get_parameter_delta(change.port_id, change.parameters)
+            if delta is None:
+                needed.append(change)
+            elif delta:
+                needed.append(PortChange(change.port_id, format_parameters(delta)))
             else:
-                # Determine error type
-                if "not found" in result.error.lower():
-                    driver_info = DriverInfo(
-                        status=DriverStatus.NOT_INSTALLED,
-                        error_message="setupc.exe not found"
-                    )
-                else:
-                    driver_info = DriverInfo(
-                        status=DriverStatus.ERROR,
-                        error_message=result.get_error_message()
-                    )
-            
-            self.driver_status_changed.emit(driver_info)
+                skipped.append(change)
+        
+        # Queue the remaining changes first so listeners see the batch as running
+        future = self.run_plan(plan_change_set(ChangeSet(changes=needed)))
+        for change in skipped:
+            self._suppress_change(change.port_id, change.parameters)
+        return future
+    
+    def _get_parameter_delta(self, port_id: str, parameters: str) -> Optional[Dict[str, str]]:
+        """Get the requested parameters that differ from the cached port state.
+        
+        Returns None when the cache cannot be trusted: the port is unknown,
+        a write has completed since the last list, or a write is queued or
+        running. A bare "-" or "*" is never reduced.
+        """
+        desired = ParameterBuilder.parse_parameter_string(parameters)
+        if not desired or self._last_list_write_count != self._write_count:
+            return None
+        if any(not request.is_read_only() for request in self._pending):
+            return None
+        if any(not request.is_read_only() for request, _ in self._running.values()):
+            return None
+        
+        for pair in self._port_pairs_cache:
+            for port in (pair.port_a, pair.port_b):
+                if port.identifier.upper() == port_id.upper():
+                    current = {key: str(value) for key, value in port.parameters.items()}
+                    return parameter_delta(current, desired)
+        return None
+    
+    def _suppress_change(self, port_id: str, parameters: str) -> None:
+        """Record a change command skipped because the port already has the requested values."""
+        seconds, _ = DurationEstimator(self.metrics, self._journal).estimate("CHANGE")
+        seconds = seconds or 0.0
+        self.metrics.record_suppressed("CHANGE", seconds)
+        command = SETUPC_COMMANDS["CHANGE"].format(port_id, parameters)
+        self.command_suppressed.emit(f"{self.setupc_path} {command}", seconds)
+    
+    def get_driver_status(self, max_age: float = DRIVER_STATUS_MAX_AGE) -> Optional[Future]:
+        """Check driver installation status.
+        
+        The latest list result is reused when no write command has completed
+        since and it is at most max_age seconds old. Otherwise list runs
+        again, which also refreshes the port snapshot.
+        """
+        result = self._last_list_result
+        if (result is not None and not result.cancelled
+                and self._last_list_write_count == self._write_count
+                and time.monotonic() - self._last_list_time <= max_age):
+            self.driver_status_changed.emit(self._get_driver_info(result))
+            future = Future()
+            future.set_result(result)
+            return future
         
-        self._execute_command_async(SETUPC_COMMANDS["LIST"], handle_list_result)
+        return self._list_ports(report_driver_status=True)
     
-    def preinstall_driver(self) -> None:
+    def _get_driver_info(self, result: CommandResult) -> DriverInfo:
+        """Derive the driver status from a list result."""
+        if result.success:
+            # If list command works, driver is installed
+            return DriverInfo(
+                status=DriverStatus.INSTALLED,
+                install_path=self.setupc_path
+            )
+        
+        # Determine error type
+        if "not found" in result.error.lower():
+            return DriverInfo(
+                status=DriverStatus.NOT_INSTALLED,
+                error_message="setupc.exe not found"
+            )
+        return DriverInfo(
+            status=DriverStatus.ERROR,
+            error_message=result.get_error_message()
+        )
+    
+    def preinstall_driver(self) -> Optional[Future]:
         """Preinstall the driver."""
         def handle_preinstall_result(result: CommandResult):
             if result.success:
                 # Update driver status after successful preinstall (delayed)
                 QTimer.singleShot(50, self.get_driver_status)
         
-        self._execute_command_async(SETUPC_COMMANDS["PREINSTALL"], handle_preinstall_result)
+        return self._execute_command_async("PREINSTALL", SETUPC_COMMANDS["PREINSTALL"], handle_preinstall_result)
     
-    def update_driver(self) -> None:
+    def update_driver(self) -> Optional[Future]:
         """Update the driver."""
         def handle_update_result(result: CommandResult):
             if result.success:
                 # Update driver status after successful update (delayed)
                 QTimer.singleShot(50, self.get_driver_status)
         
-        self._execute_command_async(SETUPC_COMMANDS["UPDATE"], handle_update_result)
+        return self._execute_command_async("UPDATE", SETUPC_COMMANDS["UPDATE"], handle_update_result)
     
-    def reload_driver(self) -> None:
+    def reload_driver(self) -> Optional[Future]:
         """Reload the driver."""
         def handle_reload_result(result: CommandResult):
             if result.success:
                 # Refresh port list after successful reload
-                self.list_ports()
+                self.request_refresh()
                 # Status will be updated when the list command completes
         
-        self._execute_command_async(SETUPC_COMMANDS["RELOAD"], handle_reload_result)
+        return self._execute_command_async("RELOAD", SETUPC_COMMANDS["RELOAD"], handle_reload_result)
     
-    def uninstall_driver(self) -> None:
+    def uninstall_driver(self) -> Optional[Future]:
         """Uninstall all ports and driver."""
         def handle_uninstall_result(result: CommandResult):
             if result.success:
@@ -301,40 +1100,75 @@ class CommandManager(QObject):
                 # Update driver status after successful uninstall (delayed)
                 QTimer.singleShot(50, self.get_driver_status)
         
-        self._execute_command_async(SETUPC_COMMANDS["UNINSTALL"], handle_uninstall_result)
+        return self._execute_command_async("UNINSTALL", SETUPC_COMMANDS["UNINSTALL"], handle_uninstall_result)
     
-    def disable_all_ports(self) -> None:
+    def disable_all_ports(self) -> Optional[Future]:
         """Disable all ports in current hardware profile."""
         def handle_disable_result(result: CommandResult):
             if result.success:
                 # Refresh port list after successful disable
-                self.list_ports()
+                self.request_refresh()
         
-        self._execute_command_async(SETUPC_COMMANDS["DISABLE_ALL"], handle_disable_result)
+        return self._execute_command_async("DISABLE_ALL", SETUPC_COMMANDS["DISABLE_ALL"], handle_disable_result)
     
-    def enable_all_ports(self) -> None:
+    def enable_all_ports(self) -> Optional[Future]:
         """Enable all ports in current hardware profile."""
         def handle_enable_result(result: CommandResult):
             if result.success:
                 # Refresh port list after successful enable
-                self.list_ports()
+                self.request_refresh()
         
-        self._execute_command_async(SETUPC_COMMANDS["ENABLE_ALL"], handle_enable_result)
+        return self._execute_command_async("ENABLE_ALL", SETUPC_COMMANDS["ENABLE_ALL"], handle_enable_result)
     
     def is_busy(self) -> bool:
-        """Check if a command is currently executing."""
-        return self.current_worker is not None and self.current_worker.isRunning()
+        """Check if a command is currently executing or waiting in the queue."""
+        return bool(self._running) or bool(self._pending)
+    
+    def cancel_current_command(self) -> bool:
+        """Cancel the running commands by stopping their setupc.exe process trees.
+        
+        Each process is interrupted, then terminated, then killed with its
+        children, waiting the configured grace period between steps. The
+        commands complete with a cancelled CommandResult.
+        """
+        for _, worker in self._running.values():
+            worker.cancel(self.cancel_grace_period, self.cancel_terminate_grace_period)
+        return bool(self._running)
     
-    def cancel_current_command(self) -> None:
-        """Cancel the currently running command."""
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.terminate()
-            self.current_worker.wait(3000)  # Wait up to 3 seconds
-            if self.current_worker.isRunning():
-                self.current_worker.kill()  # Force kill if still running
+    def cancel_pending_commands(self) -> int:
+        """Drop all queued commands, resolving their futures as cancelled.
+        
+        Batches whose installs partly succeeded still queue their final
+        driver update. Returns the number of commands dropped.
+        """
+        cancelled = sorted(self._pending)
+        self._pending = []
+        if cancelled:
+            self.queue_depth_changed.emit(0)
+        
+        for request in cancelled:
+            request.future.set_result(CommandResult(
+                success=False,
+                error="Command was cancelled",
+                return_code=-4,
+                command=f"{self.setupc_path} {request.command}",
+                cancelled=True
+            ))
+        
+        return len(cancelled)
+    
+    def cancel_all_commands(self) -> int:
+        """Cancel the running command and drop the queue.
+        
+        Returns the number of commands cancelled.
+        """
+        count = self.cancel_pending_commands()
+        running_count = len(self._running)
+        self.cancel_current_command()
+        return count + running_count
     
     # Utility Commands
-    def clean_inf_files(self) -> None:
+    def clean_inf_files(self) -> Optional[Future]:
         """Clean old INF files using setupc.exe infclean."""
         def handle_infclean_result(result: CommandResult):
             if result.success:
@@ -343,17 +1177,17 @@ class CommandManager(QObject):
             else:
                 self.error_occurred.emit(f"Failed to clean INF files: {result.get_error_message()}")
         
-        self._execute_command_async(SETUPC_COMMANDS["INFCLEAN"], handle_infclean_result)
+        return self._execute_command_async("INFCLEAN", SETUPC_COMMANDS["INFCLEAN"], handle_infclean_result)
     
-    def list_friendly_names(self) -> None:
+    def list_friendly_names(self) -> Optional[Future]:
         """Get friendly names using setupc.exe listfnames."""
         def handle_listfnames_result(result: CommandResult):
             if not result.success:
                 self.error_occurred.emit(f"Failed to list friendly names: {result.get_error_message()}")
         
-        self._execute_command_async(SETUPC_COMMANDS["LISTFNAMES"], handle_listfnames_result)
+        return self._execute_command_async("LISTFNAMES", SETUPC_COMMANDS["LISTFNAMES"], handle_listfnames_result)
     
-    def check_busy_names(self, pattern: str) -> None:
+    def check_busy_names(self, pattern: str) -> Optional[Future]:
         """Check names in use using setupc.exe busynames."""
         if not pattern.strip():
             self.error_occurred.emit("Pattern cannot be empty for busy names check")
@@ -364,15 +1198,15 @@ class CommandManager(QObject):
                 self.error_occurred.emit(f"Failed to check busy names: {result.get_error_message()}")
         
         command = SETUPC_COMMANDS["BUSYNAMES"].format(pattern)
-        self._execute_command_async(command, handle_busynames_result)
+        return self._execute_command_async("BUSYNAMES", command, handle_busynames_result)
     
-    def update_friendly_names(self) -> None:
+    def update_friendly_names(self) -> Optional[Future]:
         """Update friendly names using setupc.exe updatefnames."""
         def handle_updatefnames_result(result: CommandResult):
             if result.success:
                 # Refresh port list after updating friendly names
-                self.list_ports()
+                self.request_refresh()
             else:
                 self.error_occurred.emit(f"Failed to update friendly names: {result.get_error_message()}")
         
-        self._execute_command_async(SETUPC_COMMANDS["UPDATEFNAMES"], handle_updatefnames_result)
\ No newline at end of file
+        return self._execute_command_async("UPDATEFNAMES", SETUPC_COMMANDS["UPDATEFNAMES"], handle_updatefnames_result)
\ No newline at end of file
@@ -0,0 +1,202 @@
+"""Latency and outcome metrics for setupc.exe commands."""
+
+import bisect
+import math
+import os
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from .models import CommandResult
+from ..utils.constants import METRICS_SAMPLE_SIZE, METRICS_LATENCY_BUCKETS, METRICS_PREFIX
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class LatencyHistogram:
+    """Latency distribution with cumulative buckets and recent samples.
+    
+    The buckets and totals cover every observation, for Prometheus export;
+    quantiles are computed from the most recent METRICS_SAMPLE_SIZE samples.
+    """
+    
+    def __init__(self, buckets: Tuple[float, ...] = METRICS_LATENCY_BUCKETS,
+                 sample_size: int = METRICS_SAMPLE_SIZE):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)  # Last entry counts values above every bound
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=sample_size)
+    
+    def observe(self, value: float) -> None:
+        """Add one observation in seconds."""
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.samples.append(value)
+    
+    def quantiles(self) -> Dict[float, Optional[float]]:
+        """Get QUANTILES (nearest rank) of the recent samples; None values if empty."""
+        if not self.samples:
+            return {q: None for q in QUANTILES}
+        ordered = sorted(self.samples)
+        return {q: ordered[max(0, math.ceil(q * len(ordered)) - 1)] for q in QUANTILES}
+    
+    def cumulative_buckets(self) -> List[Tuple[str, int]]:
+        """Get (upper bound label, cumulative count) pairs including +Inf."""
+        result = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.bucket_counts):
+            cumulative += count
+            result.append((repr(float(bound)), cumulative))
+        result.append(("+Inf", self.count))
+        return result
+
+
+class CommandTypeMetrics:
+    """Counters and latency distributions for one command type."""
+    
+    def __init__(self):
+        self.duration = LatencyHistogram()
+        self.queue_wait = LatencyHistogram()
+        self.failures = 0
+        self.timeouts = 0
+        self.cancellations = 0
+        self.suppressed = 0  # Commands skipped because they would not change anything
+        self.suppressed_seconds = 0.0  # Estimated execution time saved by skipping them
+    
+    @property
+    def count(self) -> int:
+        """Get the number of completed commands."""
+        return self.duration.count
+    
+    @property
+    def failure_rate(self) -> float:
+        """Get the fraction of commands that failed (cancellations excluded)."""
+        completed = self.count - self.cancellations
+        return self.failures / completed if completed else 0.0
+
+
+class CommandMetrics:
+    """Per-command-type latency, queue wait and outcome metrics.
+    
+    Fed by CommandManager on the thread that handles command completion;
+    not thread-safe.
+    """
+    
+    def __init__(self):
+        self.started_at = time.time()
+        self.command_types: Dict[str, CommandTypeMetrics] = {}
+    
+    def record(self, command_type: str, result: CommandResult, queue_wait: float = 0.0) -> None:
+        """Record a finished command."""
+        metrics = self.command_types.get(command_type)
+        if metrics is None:
+            metrics = self.command_types[command_type] = CommandTypeMetrics()
+        
+        metrics.duration.observe(result.execution_time)
+        metrics.queue_wait.observe(max(0.0, queue_wait))
+        if result.cancelled:
+            metrics.cancellations += 1
+        elif not result.success:
+            metrics.failures += 1
+            if result.is_timeout():
+                metrics.timeouts += 1
+    
+    def record_suppressed(self, command_type: str, saved_seconds: float) -> None:
+        """Record a command that was skipped because it would not change anything."""
+        metrics = self.command_types.get(command_type)
+        if metrics is None:
+            metrics = self.command_types[command_type] = CommandTypeMetrics()
+        
+        metrics.suppressed += 1
+        metrics.suppressed_seconds += max(0.0, saved_seconds)
+    
+    def reset(self) -> None:
+        """Discard all recorded metrics."""
+        self.started_at = time.time()
+        self.command_types.clear()
+    
+    def to_prometheus(self) -> str:
+        """Format the metrics in the Prometheus text exposition format."""
+        lines = []
+        
+        for name, attribute, description in (
+            ("command_duration_seconds", "duration", "setupc.exe command execution time"),
+            ("command_queue_wait_seconds", "queue_wait", "Time commands waited in the queue before starting"),
+        ):
+            metric = f"{METRICS_PREFIX}_{name}"
+            lines.append(f"# HELP {metric} {description}.")
+            lines.append(f"# TYPE {metric} histogram")
+            for command_type, metrics in sorted(self.command_types.items()):
+                histogram = getattr(metrics, attribute)
+                labels = f'command="{command_type}"'
+                for bound, cumulative in histogram.cumulative_buckets():
+                    lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"{metric}_sum{{{labels}}} {histogram.total:.6f}")
+                lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+        
+        metric = f"{METRICS_PREFIX}_command_duration_recent_seconds"
+        lines.append(f"# HELP {metric} Quantiles of recent command execution times.")
+        lines.append(f"# TYPE {metric} gauge")
+        for command_type, metrics in sorted(self.command_types.items()):
+            for q, value in metrics.duration.quantiles().items():
+                if value is not None:
+                    lines.append(f'{metric}{{command="{command_type}",quantile="{q}"}} {value:.6f}')
+        
+        metric = f"{METRICS_PREFIX}_command_duration_max_seconds"
+        lines.append(f"# HELP {metric} Longest command execution time.")
+        lines.append(f"# TYPE {metric} gauge")
+        for command_type, metrics in sorted(self.command_types.items()):
+            lines.append(f'{metric}{{command="{command_type}"}} {metrics.duration.max:.6f}')
+        
+        for name, attribute, description in (
+            ("command_failures_total", "failures", "Commands that failed, including timeouts"),
+            ("command_timeouts_total", "timeouts", "Commands stopped for exceeding the timeout"),
+            ("command_cancellations_total", "cancellations", "Commands cancelled on request"),
+            ("command_suppressed_total", "suppressed", "Commands skipped because they would not change anything"),
+        ):
+            metric = f"{METRICS_PREFIX}_{name}"
+            lines.append(f"# HELP {metric} {description}.")
+            lines.append(f"# TYPE {metric} counter")
+            for command_type, metrics in sorted(self.command_types.items()):
+                lines.append(f'{metric}{{command="{command_type}"}} {getattr(metrics, attribute)}')
+        
+        metric = f"{METRICS_PREFIX}_command_suppressed_saved_seconds_total"
+        lines.append(f"# HELP {metric} Estimated execution time saved by skipping commands.")
+        lines.append(f"# TYPE {metric} counter")
+        for command_type, metrics in sorted(self.command_types.items()):
+            lines.append(f'{metric}{{command="{command_type}"}} {metrics.suppressed_seconds:.6f}')
+        
+        metric = f"{METRICS_PREFIX}_metrics_start_time_seconds"
+        lines.append(f"# HELP {metric} Unix time at which metrics collection started.")
+        lines.append(f"# TYPE {metric} gauge")
+        lines.append(f"{metric} {self.started_at:.3f}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def write_prometheus_file(self, path) -> bool:
+        """Write the metrics to a Prometheus text file, replacing it atomically.
+        
+        Suitable for the node exporter textfile collector, which reads
+        *.prom files. Returns True on success.
+        """
+        path = str(path)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(self.to_prometheus())
+            os.replace(temp_path, path)
+            return True
+        except OSError as e:
+            print(f"Warning: Failed to write metrics file {path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
\ No newline at end of file
@@ -0,0 +1,276 @@
+"""Qt-free application configuration store."""
+
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from .models import ApplicationConfig
+from ..utils.config_paths import get_config_file_path
+from ..utils.constants import (DEFAULT_SETUPC_PATH, EXECUTION_MODES, PORT_SNAPSHOT_FILENAME,
+                               CONSOLE_LOG_DIRNAME, CONSOLE_LOG_FILENAME, COMMAND_JOURNAL_FILENAME)
+
+
+class ConfigStore:
+    """Manages application configuration and settings persistence without Qt.
+    
+    Listeners added with add_listener are called with the configuration
+    after every change.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._listeners: List[Callable[[ApplicationConfig], None]] = []
+        self._config = ApplicationConfig()
+        self._config_file_path = self._get_config_file_path()
+        self.load_config()
+    
+    def _get_config_file_path(self) -> Path:
+        """Get the path to the configuration file."""
+        return get_config_file_path()
+    
+    def add_listener(self, listener: Callable[[ApplicationConfig], None]) -> None:
+        """Call listener with the configuration whenever it changes."""
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable[[ApplicationConfig], None]) -> None:
+        """Stop calling a listener added with add_listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify_changed(self) -> None:
+        """Report a configuration change."""
+        for listener in list(self._listeners):
+            listener(self._config)
+    
+    def load_config(self) -> None:
+        """Load configuration from file."""
+        try:
+            if self._config_file_path.exists():
+                with open(self._config_file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self._config = ApplicationConfig.from_dict(data)
+                
+                # Check if the configured setupc_path exists, if not use default
+                if not os.path.isfile(self._config.setupc_path):
+                    self._config.setupc_path = DEFAULT_SETUPC_PATH
+                    self.save_config()  # Save the updated path
+            else:
+                # Create default config file
+                self.save_config()
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Failed to load config from {self._config_file_path}: {e}")
+            # Use default configuration
+            self._config = ApplicationConfig()
+    
+    def save_config(self) -> None:
+        """Save configuration to file."""
+        try:
+            # Ensure directory exists
+            self._config_file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(self._config_file_path, 'w', encoding='utf-8') as f:
+                json.dump(self._config.to_dict(), f, indent=2)
+        except IOError as e:
+            print(f"Warning: Failed to save config to {self._config_file_path}: {e}")
+    
+    def get_config_dir(self) -> Path:
+        """Get the directory holding config.json and other application state."""
+        return self._config_file_path.parent
+    
+    def get_port_snapshot_path(self) -> Path:
+        """Get the path of the saved port snapshot."""
+        return self.get_config_dir() / PORT_SNAPSHOT_FILENAME
+    
+    def get_console_log_path(self) -> Path:
+        """Get the path of the rotating command output log."""
+        return self.get_config_dir() / CONSOLE_LOG_DIRNAME / CONSOLE_LOG_FILENAME
+    
+    def get_command_journal_path(self) -> Path:
+        """Get the path of the command journal database."""
+        return self.get_config_dir() / COMMAND_JOURNAL_FILENAME
+    
+    @property
+    def config(self) -> ApplicationConfig:
+        """Get the current configuration."""
+        return self._config
+    
+    def update_config(self, **kwargs) -> None:
+        """Update configuration with new values."""
+        updated = False
+        
+        for key, value in kwargs.items():
+            if hasattr(self._config, key):
+                if getattr(self._config, key) != value:
+                    setattr(self._config, key, value)
+                    updated = True
+        
+        if updated:
+            self.save_config()
+            self._notify_changed()
+    
+    def update_window_geometry(self, x: int, y: int, width: int, height: int) -> None:
+        """Update window geometry settings."""
+        geometry = {
+            'x': x,
+            'y': y,
+            'width': width,
+            'height': height
+        }
+        
+        if self._config.window_geometry != geometry:
+            self._config.window_geometry = geometry
+            self.save_config()
+    
+    def get_setupc_path(self) -> str:
+        """Get the setupc.exe path."""
+        return self._config.setupc_path
+    
+    def set_setupc_path(self, path: str) -> None:
+        """Set the setupc.exe path."""
+        if self._config.setupc_path != path:
+            self._config.setupc_path = path
+            self.save_config()
+            self._notify_changed()
+    
+    def get_command_timeout(self) -> int:
+        """Get the command timeout."""
+        return self._config.command_timeout
+    
+    def set_command_timeout(self, timeout: int) -> None:
+        """Set the command timeout."""
+        if timeout > 0 and self._config.command_timeout != timeout:
+            self._config.command_timeout = timeout
+            self.save_config()
+            self._notify_changed()
+    
+    def get_execution_mode(self) -> str:
+        """Get the setupc.exe execution mode."""
+        return self._config.execution_mode
+    
+    def set_execution_mode(self, mode: str) -> None:
+        """Set the setupc.exe execution mode."""
+        if mode in EXECUTION_MODES and self._config.execution_mode != mode:
+            self._config.execution_mode = mode
+            self.save_config()
+            self._notify_changed()
+    
+    def get_refresh_coalesce_window(self) -> int:
+        """Get the port list refresh coalescing window in milliseconds."""
+        return self._config.refresh_coalesce_window
+    
+    def set_refresh_coalesce_window(self, window: int) -> None:
+        """Set the port list refresh coalescing window in milliseconds."""
+        if window >= 0 and self._config.refresh_coalesce_window != window:
+            self._config.refresh_coalesce_window = window
+            self.save_config()
+            self._notify_changed()
+    
+    def get_cancel_grace_periods(self) -> Tuple[float, float]:
+        """Get the (interrupt, terminate) grace periods used when cancelling a command."""
+        return self._config.cancel_grace_period, self._config.cancel_terminate_grace_period
+    
+    def set_cancel_grace_periods(self, grace_period: float, terminate_grace_period: float) -> None:
+        """Set the (interrupt, terminate) grace periods used when cancelling a command."""
+        if grace_period < 0 or terminate_grace_period < 0:
+            return
+        if (self._config.cancel_grace_period, self._config.cancel_terminate_grace_period) != (grace_period, terminate_grace_period):
+            self._config.cancel_grace_period = grace_period
+            self._config.cancel_terminate_grace_period = terminate_grace_period
+            self.save_config()
+            self._notify_changed()
+    
+    def get_console_max_blocks(self) -> int:
+        """Get the number of lines kept in the command output panel."""
+        return self._config.console_max_blocks
+    
+    def set_console_max_blocks(self, max_blocks: int) -> None:
+        """Set the number of lines kept in the command output panel."""
+        if max_blocks > 0 and self._config.console_max_blocks != max_blocks:
+            self._config.console_max_blocks = max_blocks
+            self.save_config()
+            self._notify_changed()
+    
+    def get_metrics_export(self) -> Tuple[str, int]:
+        """Get the (path, interval in seconds) of the Prometheus metrics export; empty path if disabled."""
+        return self._config.metrics_export_path, self._config.metrics_export_interval
+    
+    def set_metrics_export(self, path: str, interval: int) -> None:
+        """Set the (path, interval in seconds) of the Prometheus metrics export; empty path to disable."""
+        if interval <= 0:
+            return
+        if (self._config.metrics_export_path, self._config.metrics_export_interval) != (path, interval):
+            self._config.metrics_export_path = path
+            self._config.metrics_export_interval = interval
+            self.save_config()
+            self._notify_changed()
+    
+    def get_auto_refresh_interval(self) -> int:
+        """Get the auto refresh interval."""
+        return self._config.auto_refresh_interval
+    
+    def set_auto_refresh_interval(self, interval: int) -> None:
+        """Set the auto refresh interval."""
+        if interval >= 0 and self._config.auto_refresh_interval != interval:
+            self._config.auto_refresh_interval = interval
+            self.save_config()
+            self._notify_changed()
+    
+    def get_window_geometry(self) -> Dict[str, int]:
+        """Get the window geometry."""
+        return self._config.window_geometry.copy()
+    
+    def get_log_level(self) -> str:
+        """Get the logging level."""
+        return self._config.log_level
+    
+    def set_log_level(self, level: str) -> None:
+        """Set the logging level."""
+        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+        if level in valid_levels and self._config.log_level != level:
+            self._config.log_level = level
+            self.save_config()
+            self._notify_changed()
+    
+    def get_theme(self) -> str:
+        """Get the application theme."""
+        return self._config.theme
+    
+    def set_theme(self, theme: str) -> None:
+        """Set the application theme."""
+        valid_themes = ['system', 'light', 'dark']
+        if theme in valid_themes and self._config.theme != theme:
+            self._config.theme = theme
+            self.save_config()
+            self._notify_changed()
+    
+    def reset_to_defaults(self) -> None:
+        """Reset configuration to default values."""
+        self._config = ApplicationConfig()
+        self.save_config()
+        self._notify_changed()
+    
+    def export_config(self, file_path: str) -> bool:
+        """Export configuration to a file."""
+        try:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(self._config.to_dict(), f, indent=2)
+            return True
+        except IOError:
+            return False
+    
+    def import_config(self, file_path: str) -> bool:
+        """Import configuration from a file."""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            # Validate the imported data
+            imported_config = ApplicationConfig.from_dict(data)
+            
+            self._config = imported_config
+            self.save_config()
+            self._notify_changed()
+            return True
+        except (json.JSONDecodeError, IOError):
+            return False
\ No newline at end of file
@@ -1,7 +1,8 @@
 """Data models for com0com GUI application."""
 
+import re
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Union
 from enum import Enum
 
 
@@ -47,6 +48,23 @@ class Port:
                 param_pairs.append(f"{key}={value}")
         
         return ",".join(param_pairs) if param_pairs else "-"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert port to dictionary for serialization."""
+        return {
+            "identifier": self.identifier,
+            "port_name": self.port_name,
+            "parameters": dict(self.parameters)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Port":
+        """Create port from dictionary."""
+        return cls(
+            identifier=data["identifier"],
+            port_name=data.get("port_name", ""),
+            parameters=dict(data.get("parameters", {}))
+        )
 
 
 @dataclass
@@ -73,6 +91,50 @@ class PortPair:
     def is_active(self) -> bool:
         """Check if port pair is active."""
         return self.status == PortStatus.ACTIVE
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert port pair to dictionary for serialization."""
+        return {
+            "number": self.number,
+            "port_a": self.port_a.to_dict(),
+            "port_b": self.port_b.to_dict(),
+            "status": self.status.value
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PortPair":
+        """Create port pair from dictionary."""
+        return cls(
+            number=int(data["number"]),
+            port_a=Port.from_dict(data["port_a"]),
+            port_b=Port.from_dict(data["port_b"]),
+            status=PortStatus(data.get("status", PortStatus.UNKNOWN.value))
+        )
+
+
+@dataclass
+class PortSnapshot:
+    """Last known port pairs, persisted for display before the first list completes."""
+    port_pairs: List[PortPair]
+    timestamp: float  # time.time() when the list was parsed
+    setupc_path_hash: str  # Identifies the setupc.exe the list came from
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert snapshot to dictionary for serialization."""
+        return {
+            "timestamp": self.timestamp,
+            "setupc_path_hash": self.setupc_path_hash,
+            "port_pairs": [pair.to_dict() for pair in self.port_pairs]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PortSnapshot":
+        """Create snapshot from dictionary."""
+        return cls(
+            port_pairs=[PortPair.from_dict(pair) for pair in data.get("port_pairs", [])],
+            timestamp=float(data["timestamp"]),
+            setupc_path_hash=data["setupc_path_hash"]
+        )
 
 
 @dataclass
@@ -84,13 +146,20 @@ class CommandResult:
     return_code: int = 0
     execution_time: float = 0.0
     command: str = ""
+    cancelled: bool = False  # Stopped on request rather than failed
+    
+    def is_timeout(self) -> bool:
+        """Check if the command was stopped for exceeding its timeout."""
+        return not self.success and self.return_code == -1
     
     def get_error_message(self) -> str:
         """Get user-friendly error message."""
         if self.success:
             return ""
         
-        if self.error:
+        if self.cancelled:
+            return "Command was cancelled"
+        elif self.error:
             return self.error
         elif self.return_code != 0:
             return f"Command failed with exit code {self.return_code}"
@@ -98,6 +167,125 @@ class CommandResult:
             return "Unknown error occurred"
 
 
+@dataclass
+class JournalEntry:
+    """A command result recorded in the command journal."""
+    command_type: str  # SETUPC_COMMANDS key, e.g. "CHANGE"
+    command: str
+    success: bool
+    finished_at: float  # Unix timestamp
+    execution_time: float = 0.0
+    return_code: int = 0
+    cancelled: bool = False
+    output: str = ""
+    error: str = ""
+    id: Optional[int] = None  # Assigned by the journal
+    
+    @property
+    def started_at(self) -> float:
+        """Get the approximate Unix timestamp at which the command started."""
+        return self.finished_at - self.execution_time
+
+
+@dataclass
+class BatchInstallItem:
+    """One port pair to install as part of a batch."""
+    pair_number: Optional[int] = None  # None for auto-assigned number
+    params_a: str = "-"
+    params_b: str = "-"
+    
+    def describe(self) -> str:
+        """Get a short description of the item for progress reporting."""
+        number = "auto" if self.pair_number is None else str(self.pair_number)
+        return f"install {number}: {self.params_a} {self.params_b}"
+
+
+@dataclass
+class PlannedCommand:
+    """One setupc command in a command plan, not yet run."""
+    command_key: str  # SETUPC_COMMANDS key
+    command: str  # Full setupc arguments, including options
+    description: str = ""
+
+
+@dataclass
+class CommandPlan:
+    """Ordered commands for a set of port changes.
+    
+    operations run first, with driver and friendly name updates deferred;
+    finalize holds the single update that follows once any operation succeeded.
+    """
+    operations: List[PlannedCommand] = field(default_factory=list)
+    finalize: List[PlannedCommand] = field(default_factory=list)
+    
+    def is_empty(self) -> bool:
+        """Check if the plan has nothing to change."""
+        return not self.operations
+    
+    def commands(self) -> List[PlannedCommand]:
+        """Get every planned command in run order."""
+        return self.operations + self.finalize if self.operations else []
+
+
+@dataclass
+class PortChange:
+    """New parameter values for one existing port."""
+    port_id: str  # e.g., "CNCA0"
+    parameters: str  # e.g., "EmuBR=yes,PortName=COM5"
+
+
+@dataclass
+class ChangeSet:
+    """Port pairs to install, remove and modify together."""
+    installs: List[BatchInstallItem] = field(default_factory=list)
+    removals: List[int] = field(default_factory=list)
+    changes: List[PortChange] = field(default_factory=list)
+    
+    def is_empty(self) -> bool:
+        """Check if the change set holds no changes."""
+        return not (self.installs or self.removals or self.changes)
+
+
+@dataclass
+class CommandEstimate:
+    """Expected duration of one planned command."""
+    planned: PlannedCommand
+    seconds: Optional[float] = None  # None when no duration has been observed
+    source: str = ""  # ESTIMATE_SOURCE_* constant
+
+
+@dataclass
+class PlanEstimate:
+    """Expected durations of a plan's commands, in run order."""
+    estimates: List[CommandEstimate] = field(default_factory=list)
+    
+    def total_seconds(self) -> float:
+        """Get the summed duration of the commands with an estimate."""
+        return sum(estimate.seconds for estimate in self.estimates if estimate.seconds is not None)
+    
+    def unknown_count(self) -> int:
+        """Get the number of commands without an estimate."""
+        return sum(1 for estimate in self.estimates if estimate.seconds is None)
+
+
+@dataclass
+class ParameterSpec:
+    """One port parameter as described by the com0com CLI specification."""
+    name: str  # e.g., "EmuBR"
+    group: str  # e.g., "emulation"
+    type: str  # PARAMETER_TYPE_* constant
+    label: str = ""  # e.g., "Baud Rate Emulation"
+    description: str = ""
+    default: Optional[str] = None  # Driver default value, None if the driver derives it
+    values: List[str] = field(default_factory=list)  # Allowed values, pin names without "!"
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    unit: str = ""  # e.g., "milliseconds"
+    pattern: str = ""  # Regular expression other values must match
+    special_values: Dict[str, str] = field(default_factory=dict)  # Value -> meaning, e.g. "COM#"
+    example: str = ""  # e.g., "PortName=COM8"
+
+
 @dataclass
 class DriverInfo:
     """com0com driver information."""
@@ -115,7 +303,14 @@ class ApplicationConfig:
     """Application configuration settings."""
     setupc_path: str = r"C:\Program Files (x86)\com0com\setupc.exe"
     command_timeout: int = 30
+    execution_mode: str = "oneshot"
+    refresh_coalesce_window: int = 150
+    cancel_grace_period: float = 2.0
+    cancel_terminate_grace_period: float = 2.0
     auto_refresh_interval: int = 0
+    console_max_blocks: int = 5000
+    metrics_export_path: str = ""  # Prometheus text file; empty to disable the export
+    metrics_export_interval: int = 60
     window_geometry: Dict[str, int] = field(default_factory=lambda: {
         "width": 1000,
         "height": 700,
@@ -130,7 +325,14 @@ class ApplicationConfig:
         return {
             "setupc_path": self.setupc_path,
             "command_timeout": self.command_timeout,
+            "execution_mode": self.execution_mode,
+            "refresh_coalesce_window": self.refresh_coalesce_window,
+            "cancel_grace_period": self.cancel_grace_period,
+            "cancel_terminate_grace_period": self.cancel_terminate_grace_period,
             "auto_refresh_interval": self.auto_refresh_interval,
+            "console_max_blocks": self.console_max_blocks,
+            "metrics_export_path": self.metrics_export_path,
+            "metrics_export_interval": self.metrics_export_interval,
             "window_geometry": self.window_geometry,
             "log_level": self.log_level,
             "theme": self.theme
@@ -147,65 +349,115 @@ class ApplicationConfig:
 
 
 class PortListParser:
-    """Parser for setupc.exe list command output."""
+    """Parser for setupc.exe list command output.
+    
+    Lines can be fed one at a time as they are read from setupc, so the
+    output never has to be buffered. Pairs are indexed by number, and lines
+    that look like port entries but cannot be parsed are collected in
+    malformed_lines instead of aborting the parse.
+    """
+    
+    PORT_ID_PATTERN = re.compile(r"CNC([AB])(\d+)$")
+    # key=value separated by commas and/or whitespace; quoted values may contain both
+    PARAMETER_PATTERN = re.compile(r'[\s,]*([^=,\s"]+)=("(?:[^"\\]|\\.)*"|[^,\s"]*)')
+    
+    def __init__(self):
+        self._pairs: Dict[int, PortPair] = {}
+        self._last_number = -1
+        self._sorted = True
+        self.line_number = 0
+        self.malformed_lines: List[Tuple[int, str, str]] = []  # (line number, line, reason)
     
     @staticmethod
-    def parse_port_list(output: str) -> List[PortPair]:
-        """Parse setupc.exe list output into PortPair objects."""
-        port_pairs = []
-        current_pair = None
+    def parse_port_list(output: Union[str, Iterable[str]],
+                        malformed_lines: Optional[list] = None) -> List[PortPair]:
+        """Parse setupc.exe list output into PortPair objects.
         
-        for line in output.strip().split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Look for port identifiers (CNCA0, CNCB0, etc.)
-            if line.startswith('CNC'):
-                parts = line.split()
-                if len(parts) >= 1:
-                    port_id = parts[0]
-                    
-                    # Extract pair number
-                    pair_num = int(port_id[4:])  # Skip "CNCA" or "CNCB"
-                    port_type = port_id[3]  # "A" or "B"
-                    
-                    # Find or create port pair
-                    pair = next((p for p in port_pairs if p.number == pair_num), None)
-                    if not pair:
-                        pair = PortPair(
-                            number=pair_num,
-                            port_a=Port(identifier=f"CNCA{pair_num}"),
-                            port_b=Port(identifier=f"CNCB{pair_num}"),
-                            status=PortStatus.ACTIVE
-                        )
-                        port_pairs.append(pair)
-                    
-                    # Set port data
-                    port = pair.port_a if port_type == 'A' else pair.port_b
-                    port.identifier = port_id
-                    
-                    # Parse parameters from the rest of the line
-                    if len(parts) > 1:
-                        params_str = ' '.join(parts[1:])
-                        port.parameters = PortListParser._parse_parameters(params_str)
-                        
-                        # Extract port name if present
-                        if 'PortName' in port.parameters:
-                            port.port_name = port.parameters['PortName']
+        Accepts the whole output or an iterable of lines. Malformed lines
+        are appended to malformed_lines when a list is given.
+        """
+        parser = PortListParser()
+        parser.feed(output.splitlines() if isinstance(output, str) else output)
+        if malformed_lines is not None:
+            malformed_lines.extend(parser.malformed_lines)
+        return parser.get_port_pairs()
+    
+    def feed(self, lines: Iterable[str]):
+        """Parse a sequence of output lines."""
+        for line in lines:
+            self.feed_line(line)
+    
+    def feed_line(self, line: str):
+        """Parse one line of output."""
+        self.line_number += 1
+        line = line.strip()
+        
+        # Port entries start with their identifier (CNCA0, CNCB0, etc.)
+        if not line.startswith('CNC'):
+            return
+        
+        parts = line.split(None, 1)
+        port_id = parts[0]
         
-        return sorted(port_pairs, key=lambda p: p.number)
+        match = self.PORT_ID_PATTERN.match(port_id)
+        if not match:
+            self.malformed_lines.append((self.line_number, line, f"Invalid port identifier '{port_id}'"))
+            return
+        
+        port_type, pair_num = match.group(1), int(match.group(2))
+        
+        # Find or create port pair
+        pair = self._pairs.get(pair_num)
+        if pair is None:
+            pair = PortPair(
+                number=pair_num,
+                port_a=Port(identifier=f"CNCA{pair_num}"),
+                port_b=Port(identifier=f"CNCB{pair_num}"),
+                status=PortStatus.ACTIVE
+            )
+            self._pairs[pair_num] = pair
+            if pair_num < self._last_number:
+                self._sorted = False
+            self._last_number = pair_num
+        
+        # Set port data
+        port = pair.port_a if port_type == 'A' else pair.port_b
+        
+        # Parse parameters from the rest of the line
+        if len(parts) > 1:
+            parameters, remainder = self._parse_parameters(parts[1])
+            if remainder:
+                self.malformed_lines.append((self.line_number, line, f"Unparsed parameter text '{remainder}'"))
+            port.parameters = parameters
+            
+            # Extract port name if present
+            if 'PortName' in parameters:
+                port.port_name = parameters['PortName']
     
-    @staticmethod
-    def _parse_parameters(params_str: str) -> Dict[str, str]:
-        """Parse parameter string into dictionary."""
+    def get_port_pairs(self) -> List[PortPair]:
+        """Get the parsed port pairs ordered by pair number."""
+        port_pairs = list(self._pairs.values())
+        if not self._sorted:
+            port_pairs.sort(key=lambda p: p.number)
+        return port_pairs
+    
+    @classmethod
+    def _parse_parameters(cls, params_str: str) -> Tuple[Dict[str, str], str]:
+        """Parse parameter string into a dictionary.
+        
+        Returns the parameters and any trailing text that could not be parsed.
+        """
         parameters = {}
+        position = 0
         
-        # Simple parameter parsing - can be enhanced for complex cases
-        for param in params_str.split(','):
-            param = param.strip()
-            if '=' in param:
-                key, value = param.split('=', 1)
-                parameters[key.strip()] = value.strip()
+        while True:
+            match = cls.PARAMETER_PATTERN.match(params_str, position)
+            if not match:
+                break
+            key, value = match.groups()
+            if value.startswith('"'):
+                value = re.sub(r'\\(.)', r'\1', value[1:-1])
+            parameters[key] = value
+            position = match.end()
         
-        return parameters
\ No newline at end of file
+        return parameters, params_str[position:].strip(' \t,')
\ No newline at end of file
@@ -0,0 +1,235 @@
+"""Port parameter registry compiled from com0com_cli_specification.json.
+
+The port_parameters section of the specification is the one description of
+every parameter setupc accepts: its group, type, allowed values, range and
+driver default. ParameterRegistry reads it once per process and compiles a
+validator for each parameter, so validating a value is a dict lookup and a
+call. The GUI builds its parameter forms from the same specs.
+"""
+
+import json
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .models import ParameterSpec
+from ..utils.config_paths import get_resource_path
+from ..utils.constants import (PARAMETER_SPECIFICATION_FILE, PARAMETER_TYPE_STRING, PARAMETER_TYPE_BOOLEAN,
+                              PARAMETER_TYPE_INTEGER, PARAMETER_TYPE_FLOAT, PARAMETER_TYPE_PIN_ASSIGNMENT,
+                              PIN_INVERT_PREFIX, SPECIAL_PARAMETER_VALUES)
+
+Validator = Callable[[str], Tuple[bool, str]]
+
+# setupc accepts these for any parameter: the driver default and the current setting
+ANY_PARAMETER_VALUES = frozenset((SPECIAL_PARAMETER_VALUES["DEFAULT"], SPECIAL_PARAMETER_VALUES["CURRENT"]))
+
+
+class ParameterRegistryError(ValueError):
+    """Raised when the parameter specification cannot be read or is malformed."""
+
+
+def _parse_range(text: str) -> Tuple[float, float]:
+    """Parse a specification range such as "0-0.99999999"."""
+    minimum, _, maximum = text.partition("-")
+    try:
+        return float(minimum), float(maximum)
+    except ValueError:
+        raise ParameterRegistryError(f"Invalid parameter range: {text!r}")
+
+
+def _format_number(value: float) -> str:
+    """Format a range bound without a trailing ".0" for whole numbers."""
+    return str(int(value)) if value == int(value) else str(value)
+
+
+def _range_error(spec: ParameterSpec, kind: str) -> str:
+    """Get the error message for a number outside the parameter's range."""
+    minimum = 0 if spec.minimum is None else spec.minimum
+    if spec.maximum is None:
+        return f"{spec.name} must be {kind} of {_format_number(minimum)} or greater"
+    return f"{spec.name} must be {kind} between {_format_number(minimum)} and {_format_number(spec.maximum)}"
+
+
+def _compile_boolean(spec: ParameterSpec) -> Validator:
+    """Compile a validator for one of a fixed set of values, ignoring case."""
+    allowed = frozenset(value.lower() for value in spec.values)
+    error = f"{spec.name} must be " + " or ".join(f"'{value}'" for value in spec.values)
+    
+    def validate(value: str) -> Tuple[bool, str]:
+        return (True, "") if value.lower() in allowed else (False, error)
+    return validate
+
+
+def _compile_integer(spec: ParameterSpec) -> Validator:
+    """Compile a validator for whole numbers, 0 or greater unless the range says otherwise."""
+    minimum = 0 if spec.minimum is None else spec.minimum
+    maximum = spec.maximum
+    error = _range_error(spec, "an integer")
+    
+    def validate(value: str) -> Tuple[bool, str]:
+        try:
+            number = int(value)
+        except ValueError:
+            return False, error
+        if number < minimum or (maximum is not None and number > maximum):
+            return False, error
+        return True, ""
+    return validate
+
+
+def _compile_float(spec: ParameterSpec) -> Validator:
+    """Compile a validator for decimal numbers within the parameter's range."""
+    minimum = 0.0 if spec.minimum is None else spec.minimum
+    maximum = spec.maximum
+    error = _range_error(spec, "a number")
+    
+    def validate(value: str) -> Tuple[bool, str]:
+        try:
+            number = float(value)
+        except ValueError:
+            return False, error
+        if not minimum <= number or (maximum is not None and number > maximum):
+            return False, error
+        return True, ""
+    return validate
+
+
+def _compile_pin_assignment(spec: ParameterSpec) -> Validator:
+    """Compile a validator for a pin name, optionally inverted with "!"."""
+    regex = re.compile(f"{re.escape(PIN_INVERT_PREFIX)}?(?:{'|'.join(map(re.escape, spec.values))})")
+    error = f"{spec.name} must be one of: {', '.join(spec.values)} (optionally prefixed with {PIN_INVERT_PREFIX})"
+    
+    def validate(value: str) -> Tuple[bool, str]:
+        return (True, "") if regex.fullmatch(value) else (False, error)
+    return validate
+
+
+def _compile_string(spec: ParameterSpec) -> Validator:
+    """Compile a validator for free text, restricted to the pattern and special values if given."""
+    if not spec.pattern:
+        return lambda value: (True, "")
+    
+    regex = re.compile(spec.pattern)
+    special = frozenset(spec.special_values)
+    examples = [spec.example.partition("=")[2] or spec.pattern] + list(spec.special_values)
+    error = f"{spec.name} must look like {' or '.join(examples)}"
+    
+    def validate(value: str) -> Tuple[bool, str]:
+        return (True, "") if value in special or regex.fullmatch(value) else (False, error)
+    return validate
+
+
+# Validator compiler for each PARAMETER_TYPE_*
+_COMPILERS: Dict[str, Callable[[ParameterSpec], Validator]] = {
+    PARAMETER_TYPE_STRING: _compile_string,
+    PARAMETER_TYPE_BOOLEAN: _compile_boolean,
+    PARAMETER_TYPE_INTEGER: _compile_integer,
+    PARAMETER_TYPE_FLOAT: _compile_float,
+    PARAMETER_TYPE_PIN_ASSIGNMENT: _compile_pin_assignment,
+}
+
+
+class ParameterRegistry:
+    """Port parameter specs and their compiled validators, by parameter name.
+    
+    Use shared() for the registry loaded from the bundled specification;
+    it is read and compiled on first use only.
+    """
+    
+    _shared: Optional["ParameterRegistry"] = None
+    
+    def __init__(self, specs: List[ParameterSpec]):
+        self.specs: Dict[str, ParameterSpec] = {}
+        self.validators: Dict[str, Validator] = {}
+        for spec in specs:
+            compiler = _COMPILERS.get(spec.type)
+            if compiler is None:
+                raise ParameterRegistryError(f"Unknown type {spec.type!r} for parameter {spec.name}")
+            validator = compiler(spec)
+            # Descriptive defaults such as "port identifier" are not values
+            if spec.default is not None and not validator(spec.default)[0]:
+                spec.default = None
+            self.specs[spec.name] = spec
+            self.validators[spec.name] = validator
+    
+    @classmethod
+    def shared(cls) -> "ParameterRegistry":
+        """Get the registry for the bundled specification, loading it on first use."""
+        if cls._shared is None:
+            cls._shared = cls.load()
+        return cls._shared
+    
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "ParameterRegistry":
+        """Load a specification file (the bundled one if path is None)."""
+        if path is None:
+            path = get_resource_path(PARAMETER_SPECIFICATION_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ParameterRegistryError(f"Cannot read parameter specification {path}: {e}")
+        return cls.from_specification(data)
+    
+    @classmethod
+    def from_specification(cls, data: dict) -> "ParameterRegistry":
+        """Build a registry from a parsed specification."""
+        data_types = data.get("data_types", {})
+        specs = []
+        try:
+            for group, parameters in data["port_parameters"].items():
+                for name, entry in parameters.items():
+                    spec_type = entry["type"]
+                    minimum, maximum = _parse_range(entry["range"]) if "range" in entry else (None, None)
+                    values = entry.get("values") or data_types.get(spec_type, {}).get("values", [])
+                    specs.append(ParameterSpec(
+                        name=name,
+                        group=group,
+                        type=spec_type,
+                        label=entry.get("label", name),
+                        description=entry.get("description", ""),
+                        default=entry.get("default"),
+                        values=list(values),
+                        minimum=minimum,
+                        maximum=maximum,
+                        unit=entry.get("unit", ""),
+                        pattern=entry.get("pattern", ""),
+                        special_values=dict(entry.get("special_values", {})),
+                        example=entry.get("example", "")
+                    ))
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ParameterRegistryError(f"Malformed port_parameters in parameter specification: {e}")
+        return cls(specs)
+    
+    def get(self, name: str) -> Optional[ParameterSpec]:
+        """Get a parameter's spec, None if the parameter is unknown."""
+        return self.specs.get(name)
+    
+    def names(self) -> List[str]:
+        """Get every parameter name in specification order."""
+        return list(self.specs)
+    
+    def groups(self) -> Dict[str, List[ParameterSpec]]:
+        """Get the specs grouped as in the specification, e.g. "emulation" -> [EmuBR, ...]."""
+        groups: Dict[str, List[ParameterSpec]] = {}
+        for spec in self.specs.values():
+            groups.setdefault(spec.group, []).append(spec)
+        return groups
+    
+    def defaults(self) -> Dict[str, str]:
+        """Get the driver default of every parameter that has a fixed one."""
+        return {name: spec.default for name, spec in self.specs.items() if spec.default is not None}
+    
+    def validate(self, name: str, value: str) -> Tuple[bool, str]:
+        """Validate one value; "-", "*" and parameters the specification does not list always pass."""
+        validator = self.validators.get(name)
+        if validator is None or value in ANY_PARAMETER_VALUES:
+            return True, ""
+        return validator(value)
+    
+    def validate_parameters(self, parameters: Dict[str, str]) -> Tuple[bool, str]:
+        """Validate parameter values, reporting the first invalid one."""
+        for name, value in parameters.items():
+            valid, error = self.validate(name, str(value))
+            if not valid:
+                return False, f"Invalid {name}: {error}"
+        return True, ""
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""Process tree control for stopping setupc.exe commands."""
+
+import os
+import signal
+import subprocess
+import sys
+
+# Steps reported by stop_process_tree
+STOP_EXITED = "exited"  # The process had already exited
+STOP_INTERRUPT = "interrupt"  # Exited after the graceful interrupt
+STOP_TERMINATE = "terminate"  # Exited after being terminated
+STOP_KILL = "kill"  # The whole process tree was killed
+
+
+def process_group_options() -> dict:
+    """Get Popen keyword arguments that start the child in its own process group.
+    
+    The group lets the child and anything it spawns be signalled together.
+    """
+    if sys.platform == "win32":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def stop_process_tree(process: subprocess.Popen, grace_period: float, terminate_grace_period: float) -> str:
+    """Stop a process started with process_group_options(), escalating as needed.
+    
+    Sends a graceful interrupt and waits grace_period seconds, then
+    terminates the process and waits terminate_grace_period seconds, then
+    kills the whole process tree. Returns the step that stopped it.
+    """
+    if process.poll() is not None:
+        return STOP_EXITED
+    
+    for step, action, wait_time in ((STOP_INTERRUPT, _interrupt, grace_period),
+                                    (STOP_TERMINATE, _terminate, terminate_grace_period)):
+        try:
+            action(process)
+        except OSError:
+            # Not deliverable (e.g. no shared console on Windows); escalate
+            if process.poll() is not None:
+                return step
+            continue
+        
+        try:
+            process.wait(wait_time)
+            return step
+        except subprocess.TimeoutExpired:
+            pass
+    
+    kill_process_tree(process)
+    return STOP_KILL
+
+
+def kill_process_tree(process: subprocess.Popen) -> None:
+    """Forcefully kill a process and its children."""
+    try:
+        if sys.platform == "win32":
+            subprocess.run(
+                ["taskkill", "/PID", str(process.pid), "/T", "/F"],
+                capture_output=True,
+                shell=False
+            )
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except OSError:
+        pass
+    
+    # Fall back to the direct handle if the tree kill did not reach it
+    if process.poll() is None:
+        try:
+            process.kill()
+        except OSError:
+            pass
+    
+    try:
+        process.wait(5)
+    except subprocess.TimeoutExpired:
+        pass
+
+
+def _interrupt(process: subprocess.Popen) -> None:
+    """Ask the process group to stop (Ctrl+Break on Windows, SIGINT elsewhere)."""
+    if sys.platform == "win32":
+        process.send_signal(signal.CTRL_BREAK_EVENT)
+    else:
+        os.killpg(process.pid, signal.SIGINT)
+
+
+def _terminate(process: subprocess.Popen) -> None:
+    """Terminate the process (TerminateProcess on Windows, SIGTERM to the group elsewhere)."""
+    if sys.platform == "win32":
+        process.terminate()
+    else:
+        os.killpg(process.pid, signal.SIGTERM)
\ No newline at end of file
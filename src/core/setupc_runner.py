@@ -0,0 +1,119 @@
+"""Synchronous setupc.exe execution without Qt.
+
+run_setupc is the one place a setupc command is started in its own
+process: the CLI calls it directly and CommandManager's workers call it
+on their pool threads.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from typing import Callable, Optional
+
+from .models import CommandResult
+from .process_control import process_group_options, kill_process_tree
+from ..utils.constants import DEFAULT_COMMAND_TIMEOUT
+
+
+def run_setupc(setupc_path: str, command: str, timeout: int = DEFAULT_COMMAND_TIMEOUT,
+               working_directory: Optional[str] = None,
+               line_handler: Optional[Callable[[str], None]] = None,
+               process_started: Optional[Callable[[subprocess.Popen], None]] = None) -> CommandResult:
+    """Run one setupc command in its own process and wait for it.
+    
+    command holds the setupc arguments (e.g. "list"). The working directory
+    defaults to the directory of setupc.exe, which it needs for .inf file
+    access. Output is read line by line and each line is passed to
+    line_handler as it arrives. process_started is called with the process
+    once it runs, so it can be stopped from another thread. The process
+    tree is killed when the timeout expires.
+    """
+    # A relative path would otherwise be resolved against the working directory
+    executable = os.path.abspath(setupc_path) if os.path.dirname(setupc_path) else setupc_path
+    if working_directory is None:
+        working_directory = os.path.dirname(executable) or None
+    
+    full_command = f"{setupc_path} {command}"
+    start_time = time.time()
+    
+    try:
+        process = subprocess.Popen(
+            [executable] + command.split(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            bufsize=1,  # Line buffered
+            shell=False,  # Security: don't use shell
+            cwd=working_directory,  # Set working directory for .inf file access
+            **process_group_options()
+        )
+    except FileNotFoundError:
+        return CommandResult(
+            success=False,
+            error="setupc.exe not found. Please ensure com0com is installed and setupc.exe is in your PATH.",
+            return_code=-2,
+            execution_time=time.time() - start_time,
+            command=full_command
+        )
+    except OSError as e:
+        return CommandResult(
+            success=False,
+            error=f"Unexpected error: {str(e)}",
+            return_code=-3,
+            execution_time=time.time() - start_time,
+            command=full_command
+        )
+    
+    if process_started is not None:
+        process_started(process)
+    
+    timed_out = threading.Event()
+    
+    def kill_on_timeout():
+        if process.poll() is None:
+            timed_out.set()
+            kill_process_tree(process)
+    
+    # Drain stderr separately so a full pipe cannot stall the process
+    error_chunks = []
+    error_reader = threading.Thread(target=lambda: error_chunks.append(process.stderr.read()), daemon=True)
+    error_reader.start()
+    
+    timeout_timer = threading.Timer(timeout, kill_on_timeout)
+    timeout_timer.daemon = True
+    timeout_timer.start()
+    
+    output_lines = []
+    try:
+        for line in process.stdout:
+            output_lines.append(line)
+            if line_handler is not None:
+                line_handler(line.rstrip("\r\n"))
+        return_code = process.wait()
+    finally:
+        timeout_timer.cancel()
+        error_reader.join()
+        process.stdout.close()
+        process.stderr.close()
+    
+    output = "".join(output_lines)
+    if timed_out.is_set():
+        return CommandResult(
+            success=False,
+            output=output,
+            error=f"Command timed out after {timeout} seconds",
+            return_code=-1,
+            execution_time=time.time() - start_time,
+            command=full_command
+        )
+    
+    return CommandResult(
+        success=return_code == 0,
+        output=output,
+        error="".join(error_chunks),
+        return_code=return_code,
+        execution_time=time.time() - start_time,
+        command=full_command
+    )
\ No newline at end of file
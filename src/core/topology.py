@@ -0,0 +1,209 @@
+"""Declarative port pair topologies and their reconciliation against setupc state.
+
+A topology file (JSON, or YAML when PyYAML is installed) describes the
+desired port pairs:
+    
+    {
+        "remove_unlisted": false,
+        "defaults": {"EmuBR": "yes"},
+        "pairs": [
+            {"numbers": "0-9", "port_a": {"PortName": "COM{n+10}"}, "port_b": {"PortName": "COM{n+110}"}},
+            {"numbers": [20, 21], "ports": {"cts": "rrts"}}
+        ]
+    }
+
+"numbers" is a pair number, a list of numbers or a range string such as
+"0-9,12". "defaults" and "ports" apply to both ports, "port_a"/"port_b" to
+one; later entries override earlier ones. "{n}" and "{n+K}" in values are
+replaced with the pair number. A value of "-" resets a parameter to its
+default; unlisted parameters are left alone. With "remove_unlisted", pairs
+not in the topology are removed.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+from .change_planner import RESET_VALUE, format_parameters, parameter_delta, plan_change_set
+from .command_builder import validate_parameters
+from .models import BatchInstallItem, ChangeSet, CommandPlan, PortChange, PortPair
+from .parameter_registry import ParameterRegistry
+from .validators import ParameterValidator, ParameterBuilder
+
+PortParameters = Dict[str, str]
+
+TEMPLATE_PATTERN = re.compile(r"\{n([+-]\d+)?\}")
+
+
+class TopologyError(ValueError):
+    """Invalid topology file or definition."""
+
+
+def parse_pair_numbers(spec: Any) -> List[int]:
+    """Expand a pair number, list of numbers or range string ("0-9,12")."""
+    if isinstance(spec, bool):
+        raise TopologyError(f"Invalid pair numbers: {spec!r}")
+    if isinstance(spec, int):
+        numbers = [spec]
+    elif isinstance(spec, list):
+        numbers = []
+        for item in spec:
+            numbers.extend(parse_pair_numbers(item))
+    elif isinstance(spec, str):
+        numbers = []
+        for part in spec.split(','):
+            bounds = part.strip().split('-')
+            try:
+                first, last = int(bounds[0]), int(bounds[-1])
+            except ValueError:
+                raise TopologyError(f"Invalid pair range '{part.strip()}'")
+            if len(bounds) > 2 or last < first:
+                raise TopologyError(f"Invalid pair range '{part.strip()}'")
+            numbers.extend(range(first, last + 1))
+    else:
+        raise TopologyError(f"Invalid pair numbers: {spec!r}")
+    
+    for number in numbers:
+        valid, error = ParameterValidator.validate_port_number(number)
+        if not valid:
+            raise TopologyError(f"Invalid pair number {number}: {error}")
+    return numbers
+
+
+def expand_template(value: str, number: int) -> str:
+    """Replace {n} and {n+K} in a parameter value with the pair number."""
+    return TEMPLATE_PATTERN.sub(lambda match: str(number + int(match.group(1) or 0)), value)
+
+
+def _normalize_value(value: Any) -> str:
+    """Convert a JSON/YAML scalar to its setupc string form."""
+    if isinstance(value, bool):
+        return "yes" if value else "no"  # YAML reads yes/no as booleans
+    if value is None:
+        return RESET_VALUE
+    return str(value)
+
+
+def _read_parameters(data: Any, where: str) -> PortParameters:
+    """Read one parameter mapping of a topology entry."""
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise TopologyError(f"{where} must be a mapping of parameter names to values")
+    
+    parameters = {}
+    for key, value in data.items():
+        if ParameterRegistry.shared().get(key) is None:
+            raise TopologyError(f"{where}: unknown parameter '{key}'")
+        parameters[key] = _normalize_value(value)
+    return parameters
+
+
+class Topology:
+    """Desired parameters of each port pair, by pair number."""
+    
+    def __init__(self, pairs: Optional[Dict[int, Tuple[PortParameters, PortParameters]]] = None,
+                 remove_unlisted: bool = False):
+        self.pairs = pairs if pairs is not None else {}
+        self.remove_unlisted = remove_unlisted
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Topology":
+        """Create a topology from parsed file contents."""
+        if not isinstance(data, dict):
+            raise TopologyError("Topology must be a mapping with a 'pairs' list")
+        entries = data.get("pairs", [])
+        if not isinstance(entries, list):
+            raise TopologyError("'pairs' must be a list")
+        
+        defaults = _read_parameters(data.get("defaults"), "defaults")
+        pairs: Dict[int, Tuple[PortParameters, PortParameters]] = {}
+        for index, entry in enumerate(entries):
+            where = f"Pair entry {index + 1}"
+            if not isinstance(entry, dict) or "numbers" not in entry:
+                raise TopologyError(f"{where} must be a mapping with 'numbers'")
+            both = _read_parameters(entry.get("ports"), f"{where} ports")
+            port_a = _read_parameters(entry.get("port_a"), f"{where} port_a")
+            port_b = _read_parameters(entry.get("port_b"), f"{where} port_b")
+            
+            for number in parse_pair_numbers(entry["numbers"]):
+                params_a, params_b = pairs.setdefault(number, (dict(defaults), dict(defaults)))
+                for params, overrides in ((params_a, port_a), (params_b, port_b)):
+                    for key, value in {**both, **overrides}.items():
+                        params[key] = expand_template(value, number)
+        
+        topology = cls(pairs, bool(data.get("remove_unlisted", False)))
+        topology.validate()
+        return topology
+    
+    @classmethod
+    def load(cls, path: str) -> "Topology":
+        """Read a JSON or YAML topology file."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError as e:
+            raise TopologyError(f"Failed to read topology file {path}: {e}")
+        
+        if path.lower().endswith(('.yaml', '.yml')):
+            if yaml is None:
+                raise TopologyError("YAML topology files require PyYAML (pip install pyyaml)")
+            try:
+                data = yaml.safe_load(text)
+            except yaml.YAMLError as e:
+                raise TopologyError(f"Invalid YAML in {path}: {e}")
+        else:
+            try:
+                data = json.loads(text)
+            except json.JSONDecodeError as e:
+                raise TopologyError(f"Invalid JSON in {path}: {e}")
+        return cls.from_dict(data)
+    
+    def validate(self) -> None:
+        """Check every desired parameter value."""
+        for number, (params_a, params_b) in self.pairs.items():
+            for letter, params in (("A", params_a), ("B", params_b)):
+                try:
+                    validate_parameters(ParameterBuilder.build_parameter_string(params), f"CNC{letter}{number}")
+                except ValueError as e:
+                    raise TopologyError(str(e))
+
+
+def diff_topology(current_pairs: List[PortPair], topology: Topology) -> ChangeSet:
+    """Get the minimal changes that turn current_pairs into the topology.
+    
+    Existing ports are changed only in the parameters that differ.
+    """
+    current = {pair.number: pair for pair in current_pairs}
+    change_set = ChangeSet()
+    
+    if topology.remove_unlisted:
+        change_set.removals = sorted(set(current) - set(topology.pairs))
+    
+    for number in sorted(topology.pairs):
+        params_a, params_b = topology.pairs[number]
+        pair = current.get(number)
+        if pair is None:
+            change_set.installs.append(BatchInstallItem(
+                pair_number=number,
+                params_a=ParameterBuilder.build_parameter_string(parameter_delta({}, params_a)),
+                params_b=ParameterBuilder.build_parameter_string(parameter_delta({}, params_b))
+            ))
+            continue
+        
+        for port, desired in ((pair.port_a, params_a), (pair.port_b, params_b)):
+            delta = parameter_delta(port.parameters, desired)
+            if delta:
+                change_set.changes.append(PortChange(port.identifier, format_parameters(delta)))
+    
+    return change_set
+
+
+def plan_topology(current_pairs: List[PortPair], topology: Topology) -> CommandPlan:
+    """Compute the minimal commands that turn current_pairs into the topology."""
+    return plan_change_set(diff_topology(current_pairs, topology))
\ No newline at end of file
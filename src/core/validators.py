@@ -3,6 +3,10 @@
 import re
 from typing import Tuple, Union
 
+from .parameter_registry import ParameterRegistry
+
+PORT_IDENTIFIER_PATTERN = re.compile(r"^CNC[AB]\d+$")
+
 
 class ParameterValidator:
     """Validation functions for setupc.exe parameters."""
@@ -22,14 +26,7 @@ class ParameterValidator:
     @staticmethod
     def validate_emu_noise(value: Union[str, float]) -> Tuple[bool, str]:
         """Validate EmuNoise parameter (0.0-0.99999999)."""
-        try:
-            noise = float(value)
-            if 0.0 <= noise <= 0.99999999:
-                return True, ""
-            else:
-                return False, "EmuNoise must be between 0.0 and 0.99999999"
-        except (ValueError, TypeError):
-            return False, "EmuNoise must be a valid floating point number"
+        return ParameterRegistry.shared().validate("EmuNoise", str(value))
     
     @staticmethod
     def validate_port_identifier(value: str) -> Tuple[bool, str]:
@@ -37,8 +34,7 @@ class ParameterValidator:
         if not isinstance(value, str):
             return False, "Port identifier must be a string"
         
-        pattern = r"^CNC[AB]\d+$"
-        if re.match(pattern, value):
+        if PORT_IDENTIFIER_PATTERN.match(value):
             return True, ""
         else:
             return False, "Port identifier must match pattern CNC[AB]<number> (e.g., CNCA0, CNCB1)"
@@ -49,26 +45,8 @@ class ParameterValidator:
         if not isinstance(value, str):
             return False, "Pin assignment must be a string"
         
-        # Handle inversion prefix
-        clean_value = value
-        if value.startswith('!'):
-            clean_value = value[1:]
-        
-        # Check for special values
-        if clean_value in ["-", "*"]:
-            return True, ""
-        
-        # Valid pin values
-        valid_pins = [
-            "rrts", "lrts", "rdtr", "ldtr",
-            "rout1", "lout1", "rout2", "lout2",
-            "ropen", "lopen", "on"
-        ]
-        
-        if clean_value in valid_pins:
-            return True, ""
-        else:
-            return False, f"Invalid pin assignment. Must be one of: {', '.join(valid_pins)} (optionally prefixed with !)"
+        # All pins take the same values
+        return ParameterRegistry.shared().validate("cts", value)
     
     @staticmethod
     def validate_boolean(value: str) -> Tuple[bool, str]:
@@ -99,16 +77,7 @@ class ParameterValidator:
         if not isinstance(value, str):
             return False, "COM port name must be a string"
         
-        # Special values
-        if value in ["COM#", "-", "*"]:
-            return True, ""
-        
-        # Standard COM port pattern
-        pattern = r"^COM\d+$"
-        if re.match(pattern, value):
-            return True, ""
-        else:
-            return False, "COM port name must be in format COM<number> or special value COM#"
+        return ParameterRegistry.shared().validate("PortName", value)
     
     @staticmethod
     def validate_parameter_string(param_string: str) -> Tuple[bool, str]:
@@ -188,28 +157,10 @@ class ParameterBuilder:
     @staticmethod
     def validate_and_build(parameters: dict) -> Tuple[bool, str, str]:
         """Validate parameters and build parameter string."""
-        # Validate individual parameters
-        for key, value in parameters.items():
-            if key == "PortName":
-                valid, error = ParameterValidator.validate_com_port_name(str(value))
-                if not valid:
-                    return False, "", f"Invalid PortName: {error}"
-            elif key == "EmuNoise":
-                valid, error = ParameterValidator.validate_emu_noise(value)
-                if not valid:
-                    return False, "", f"Invalid EmuNoise: {error}"
-            elif key in ["EmuBR", "EmuOverrun", "PlugInMode", "ExclusiveMode", "HiddenMode", "AllDataBits"]:
-                valid, error = ParameterValidator.validate_boolean(str(value))
-                if not valid:
-                    return False, "", f"Invalid {key}: {error}"
-            elif key in ["AddRTTO", "AddRITO"]:
-                valid, error = ParameterValidator.validate_positive_integer(value)
-                if not valid:
-                    return False, "", f"Invalid {key}: {error}"
-            elif key in ["cts", "dsr", "dcd", "ri"]:
-                valid, error = ParameterValidator.validate_pin_assignment(str(value))
-                if not valid:
-                    return False, "", f"Invalid {key}: {error}"
+        # Validate individual parameters with the registry's compiled validators
+        valid, error = ParameterRegistry.shared().validate_parameters(parameters)
+        if not valid:
+            return False, "", error
         
         # Build parameter string
         param_string = ParameterBuilder.build_parameter_string(parameters)
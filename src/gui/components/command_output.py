@@ -1,19 +1,48 @@
 """Command output panel component for displaying setupc.exe output."""
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
-                            QPushButton, QLabel, QFrame, QSplitter)
-from PyQt6.QtCore import Qt, pyqtSlot
-from PyQt6.QtGui import QFont, QTextCharFormat, QColor
+import datetime
+import logging
+import logging.handlers
+import os
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
+                            QPushButton, QLabel, QFrame, QLineEdit, QDialog)
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
+from PyQt6.QtGui import QFont, QTextCharFormat, QTextCursor, QColor
 
 from ...core.models import CommandResult
+from ...utils.constants import (DEFAULT_CONSOLE_MAX_BLOCKS, CONSOLE_LOG_MAX_BYTES,
+                               CONSOLE_LOG_BACKUP_COUNT, CONSOLE_SEARCH_MAX_RESULTS)
+
+# Text styles used in the console
+STYLE_DEFAULT = "default"
+STYLE_OUTPUT = "output"
+STYLE_ERROR = "error"
+STYLE_WARNING = "warning"
+STYLE_INFO = "info"
+STYLE_MUTED = "muted"
 
 
 class CommandOutputPanel(QWidget):
-    """Collapsible panel showing command execution output and logs."""
+    """Collapsible panel showing command execution output and logs.
+    
+    Text is queued and written to the console once per event-loop tick, and
+    the console keeps at most max_blocks lines. When a log path is set, all
+    text is also written to a rotating log on disk, which keeps the history
+    beyond the console limit and can be searched from the panel.
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.is_expanded = False
+        self.streaming_command = None  # Command whose output is being appended line by line
+        self.streamed_line_count = 0
+        self._pending: List[Tuple[str, str]] = []  # (text, style) waiting for the next flush
+        self._formats: Dict[str, QTextCharFormat] = {}
+        self._log_path: Optional[str] = None
+        self._log_handler: Optional[logging.handlers.RotatingFileHandler] = None
+        self._logger: Optional[logging.Logger] = None
         self.setup_ui()
         self.setup_connections()
     
@@ -33,11 +62,22 @@ class CommandOutputPanel(QWidget):
         self.toggle_button = QPushButton("▲ Command Output")
         self.toggle_button.setFlat(True)
         
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Find in output...")
+        self.search_edit.setMaximumWidth(200)
+        self.search_edit.setClearButtonEnabled(True)
+        
+        search_log_button = QPushButton("Search Log")
+        search_log_button.setToolTip("Search the full output history saved on disk")
+        search_log_button.setMaximumWidth(90)
+        
         clear_button = QPushButton("Clear")
         clear_button.setMaximumWidth(60)
         
         header_layout.addWidget(self.toggle_button)
         header_layout.addStretch()
+        header_layout.addWidget(self.search_edit)
+        header_layout.addWidget(search_log_button)
         header_layout.addWidget(clear_button)
         
         layout.addWidget(header_frame)
@@ -47,9 +87,11 @@ class CommandOutputPanel(QWidget):
         content_layout = QVBoxLayout(self.content_widget)
         content_layout.setContentsMargins(5, 5, 5, 5)
         
-        # Command output text area
-        self.output_text = QTextEdit()
+        # Command output console; the oldest lines are dropped past the limit
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
+        self.output_text.setUndoRedoEnabled(False)
+        self.output_text.setMaximumBlockCount(DEFAULT_CONSOLE_MAX_BLOCKS)
         self.output_text.setMaximumHeight(200)
         self.output_text.setMinimumHeight(100)
         
@@ -74,13 +116,39 @@ class CommandOutputPanel(QWidget):
         self.content_widget.hide()
         self.setFixedHeight(30)
         
+        # Queued text is written once per event-loop tick
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(0)
+        
         # Store references
         self.clear_button = clear_button
+        self.search_log_button = search_log_button
     
     def setup_connections(self):
         """Connect signals and slots."""
         self.toggle_button.clicked.connect(self.toggle_panel)
         self.clear_button.clicked.connect(self.clear_output)
+        self.search_edit.returnPressed.connect(self.find_next)
+        self.search_log_button.clicked.connect(self.search_log)
+        self.flush_timer.timeout.connect(self.flush_output)
+    
+    def set_max_blocks(self, max_blocks: int):
+        """Set the number of lines kept in the console."""
+        self.output_text.setMaximumBlockCount(max_blocks)
+    
+    def set_log_path(self, path):
+        """Write all output to a rotating log at path (None to stop)."""
+        self.close_log()
+        self._log_path = str(path) if path is not None else None
+    
+    def close_log(self):
+        """Write any queued text and close the on-disk log."""
+        self.flush_output()
+        if self._log_handler is not None:
+            self._logger.removeHandler(self._log_handler)
+            self._log_handler.close()
+            self._log_handler = None
     
     @pyqtSlot()
     def toggle_panel(self):
@@ -98,79 +166,246 @@ class CommandOutputPanel(QWidget):
     
     @pyqtSlot()
     def clear_output(self):
-        """Clear all output text."""
+        """Clear all output text (the on-disk log is kept)."""
+        self.flush_output()
         self.output_text.clear()
     
+    @pyqtSlot(str)
+    def on_command_started(self, command: str):
+        """Start a command entry whose output arrives line by line.
+        
+        Only one entry streams at a time; commands running concurrently
+        with it are written in full when they complete.
+        """
+        if self.streaming_command is not None:
+            return
+        
+        self._append(f"[{self._timestamp()}] {command}\n", STYLE_DEFAULT)
+        
+        self.streaming_command = command
+        self.streamed_line_count = 0
+    
+    @pyqtSlot(str, str)
+    def append_output_line(self, command: str, line: str):
+        """Append one line of output from the streaming command."""
+        if command != self.streaming_command:
+            return
+        
+        if self.streamed_line_count == 0:
+            self._append("Output:\n", STYLE_OUTPUT)
+        self._append(f"{line}\n", STYLE_OUTPUT)
+        
+        self.streamed_line_count += 1
+    
     @pyqtSlot(CommandResult)
     def on_command_completed(self, result: CommandResult):
         """Handle command completion and display output."""
-        self.add_command_entry(result)
+        if self.streaming_command == result.command:
+            # Header and output were already written while the command ran
+            self.add_command_entry(result, include_output=False)
+            self.streaming_command = None
+        else:
+            self.add_command_entry(result)
         
         # Auto-expand if there was an error
         if not result.success and not self.is_expanded:
             self.toggle_panel()
     
-    def add_command_entry(self, result: CommandResult):
-        """Add a command result entry to the output."""
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
+    def add_command_entry(self, result: CommandResult, include_output: bool = True):
+        """Add a command result entry to the output.
         
+        With include_output False only the error and status are added, for
+        entries whose header and output were streamed.
+        """
         # Add timestamp and command
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        cursor.insertText(f"[{timestamp}] {result.command}\n")
-        
-        # Format and add output
-        if result.output.strip():
-            format_normal = QTextCharFormat()
-            format_normal.setForeground(self.palette().color(self.palette().ColorRole.Text))
-            cursor.setCharFormat(format_normal)
-            cursor.insertText("Output:\n")
-            cursor.insertText(f"{result.output.strip()}\n")
-        
-        # Format and add error (if any)
-        if result.error.strip():
-            format_error = QTextCharFormat()
-            format_error.setForeground(QColor("#cc0000"))
-            cursor.setCharFormat(format_error)
-            cursor.insertText("Error:\n")
-            cursor.insertText(f"{result.error.strip()}\n")
+        if include_output:
+            self._append(f"[{self._timestamp()}] {result.command}\n", STYLE_DEFAULT)
         
-        # Add execution time and result
-        format_info = QTextCharFormat()
-        format_info.setForeground(self.palette().color(self.palette().ColorRole.PlaceholderText))
-        cursor.setCharFormat(format_info)
+        # Add output
+        if include_output and result.output.strip():
+            self._append(f"Output:\n{result.output.strip()}\n", STYLE_OUTPUT)
         
-        status = "SUCCESS" if result.success else "FAILED"
-        cursor.insertText(f"Status: {status} (took {result.execution_time:.2f}s)\n")
-        cursor.insertText("-" * 60 + "\n")
+        # Add error (if any)
+        if result.error.strip():
+            self._append(f"Error:\n{result.error.strip()}\n", STYLE_ERROR)
         
-        # Scroll to bottom
-        self.output_text.verticalScrollBar().setValue(
-            self.output_text.verticalScrollBar().maximum()
-        )
+        # Add execution time and result
+        if result.success:
+            status = "SUCCESS"
+        elif result.cancelled:
+            status = "CANCELLED"
+        else:
+            status = "FAILED"
+        self._append(f"Status: {status} (took {result.execution_time:.2f}s)\n" + "-" * 60 + "\n", STYLE_MUTED)
     
     def log_message(self, message: str, level: str = "INFO"):
         """Add a log message to the output."""
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        
-        # Format based on level
-        format_text = QTextCharFormat()
         if level == "ERROR":
-            format_text.setForeground(QColor("#cc0000"))
+            style = STYLE_ERROR
         elif level == "WARNING":
-            format_text.setForeground(QColor("#ff8800"))
+            style = STYLE_WARNING
+        else:
+            style = STYLE_INFO
+        
+        self._append(f"[{self._timestamp()}] {level}: {message}\n", style)
+    
+    @pyqtSlot()
+    def flush_output(self):
+        """Write all queued text to the console and the on-disk log."""
+        if not self._pending:
+            return
+        
+        pending, self._pending = self._pending, []
+        
+        # Follow new output only if the view was already at the bottom
+        scrollbar = self.output_text.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        
+        cursor = QTextCursor(self.output_text.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for text, style in pending:
+            cursor.insertText(text, self._get_format(style))
+        cursor.endEditBlock()
+        
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+        
+        logger = self._get_logger()
+        if logger is not None:
+            logger.info("".join(text for text, _ in pending).rstrip("\n"))
+    
+    @pyqtSlot()
+    def find_next(self):
+        """Select the next match of the search text in the console, wrapping at the end."""
+        text = self.search_edit.text()
+        if not text:
+            return
+        
+        self.flush_output()
+        if not self.is_expanded:
+            self.toggle_panel()
+        
+        if not self.output_text.find(text):
+            # Wrap around to the start
+            self.output_text.moveCursor(QTextCursor.MoveOperation.Start)
+            self.output_text.find(text)
+    
+    @pyqtSlot()
+    def search_log(self):
+        """Search the on-disk output history and show the matching lines."""
+        text = self.search_edit.text().strip()
+        if not text:
+            self.search_edit.setFocus()
+            return
+        
+        self.flush_output()
+        matches, total = self.search_log_files(text)
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"Output History - '{text}'")
+        dialog.resize(700, 400)
+        dialog_layout = QVBoxLayout(dialog)
+        
+        if self._log_path is None:
+            summary = "Output history is not being saved."
+        elif total > len(matches):
+            summary = f"{total} matching lines; showing the latest {len(matches)}."
         else:
-            format_text.setForeground(self.palette().color(self.palette().ColorRole.Link))
+            summary = f"{total} matching line{'s' if total != 1 else ''}."
+        dialog_layout.addWidget(QLabel(summary))
+        
+        results = QPlainTextEdit()
+        results.setReadOnly(True)
+        results.setFont(self.output_text.font())
+        results.setPlainText("\n".join(matches))
+        dialog_layout.addWidget(results)
+        
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(dialog.accept)
+        dialog_layout.addWidget(close_button, alignment=Qt.AlignmentFlag.AlignRight)
+        
+        dialog.exec()
+    
+    def search_log_files(self, text: str) -> Tuple[List[str], int]:
+        """Search the on-disk log, oldest file first, for lines containing text.
+        
+        Returns (latest matching lines, up to CONSOLE_SEARCH_MAX_RESULTS, total match count).
+        """
+        if self._log_path is None:
+            return [], 0
+        
+        needle = text.lower()
+        matches = deque(maxlen=CONSOLE_SEARCH_MAX_RESULTS)
+        total = 0
         
-        cursor.setCharFormat(format_text)
-        cursor.insertText(f"[{timestamp}] {level}: {message}\n")
+        paths = [f"{self._log_path}.{index}" for index in range(CONSOLE_LOG_BACKUP_COUNT, 0, -1)]
+        paths.append(self._log_path)
+        for path in paths:
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    for line in f:
+                        if needle in line.lower():
+                            matches.append(line.rstrip("\n"))
+                            total += 1
+            except OSError:
+                continue
         
-        # Scroll to bottom
-        self.output_text.verticalScrollBar().setValue(
-            self.output_text.verticalScrollBar().maximum()
-        )
\ No newline at end of file
+        return list(matches), total
+    
+    def _append(self, text: str, style: str):
+        """Queue text for the next flush."""
+        self._pending.append((text, style))
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+    
+    def _get_format(self, style: str) -> QTextCharFormat:
+        """Get the character format for a text style."""
+        text_format = self._formats.get(style)
+        if text_format is None:
+            text_format = QTextCharFormat()
+            palette = self.palette()
+            if style == STYLE_OUTPUT:
+                text_format.setForeground(palette.color(palette.ColorRole.Text))
+            elif style == STYLE_ERROR:
+                text_format.setForeground(QColor("#cc0000"))
+            elif style == STYLE_WARNING:
+                text_format.setForeground(QColor("#ff8800"))
+            elif style == STYLE_INFO:
+                text_format.setForeground(palette.color(palette.ColorRole.Link))
+            elif style == STYLE_MUTED:
+                text_format.setForeground(palette.color(palette.ColorRole.PlaceholderText))
+            self._formats[style] = text_format
+        return text_format
+    
+    def _get_logger(self) -> Optional[logging.Logger]:
+        """Get the logger writing to the on-disk log, opening it on first use."""
+        if self._log_path is None:
+            return None
+        
+        if self._log_handler is None:
+            try:
+                os.makedirs(os.path.dirname(self._log_path), exist_ok=True)
+                self._log_handler = logging.handlers.RotatingFileHandler(
+                    self._log_path,
+                    maxBytes=CONSOLE_LOG_MAX_BYTES,
+                    backupCount=CONSOLE_LOG_BACKUP_COUNT,
+                    encoding='utf-8'
+                )
+            except OSError as e:
+                print(f"Warning: Failed to open output log {self._log_path}: {e}")
+                self._log_path = None
+                return None
+            
+            self._log_handler.setFormatter(logging.Formatter("%(message)s"))
+            self._logger = logging.getLogger(f"{__name__}.{id(self)}")
+            self._logger.propagate = False
+            self._logger.setLevel(logging.INFO)
+            self._logger.addHandler(self._log_handler)
+        
+        return self._logger
+    
+    @staticmethod
+    def _timestamp() -> str:
+        """Get the current time for entry headers."""
+        return datetime.datetime.now().strftime("%H:%M:%S")
\ No newline at end of file
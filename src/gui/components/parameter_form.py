@@ -0,0 +1,135 @@
+"""Port parameter form generated from the parameter registry."""
+
+from typing import Dict, Optional
+
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox, QLineEdit,
+                            QCheckBox, QComboBox, QSpinBox, QDoubleSpinBox)
+
+from ...core.change_planner import parameter_delta
+from ...core.models import ParameterSpec
+from ...core.parameter_registry import ParameterRegistry
+from ...utils.constants import (PARAMETER_TYPE_BOOLEAN, PARAMETER_TYPE_INTEGER, PARAMETER_TYPE_FLOAT,
+                               PARAMETER_TYPE_PIN_ASSIGNMENT, PIN_INVERT_PREFIX, INTEGER_PARAMETER_MAXIMUM,
+                               PARAMETER_UNIT_SUFFIXES)
+
+
+class ParameterForm(QWidget):
+    """One group box per specification group with an input for each port parameter.
+    
+    Booleans are checkboxes, numbers spin boxes limited to their range, pins
+    a combo with an invert checkbox and anything else a text field.
+    """
+    
+    def __init__(self, registry: Optional[ParameterRegistry] = None, parent=None):
+        super().__init__(parent)
+        self.registry = registry or ParameterRegistry.shared()
+        self.parameter_widgets: Dict[str, QWidget] = {}
+        self.setup_ui()
+        self.reset()
+    
+    def setup_ui(self):
+        """Create a group box and inputs for every parameter group."""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(15)
+        
+        for group, specs in self.registry.groups().items():
+            group_box = QGroupBox(group.replace("_", " ").title())
+            group_layout = QFormLayout(group_box)
+            for spec in specs:
+                widget = self._create_widget(spec)
+                widget.setToolTip(spec.description)
+                self.parameter_widgets[spec.name] = widget
+                group_layout.addRow(f"{spec.label}:", widget)
+            layout.addWidget(group_box)
+    
+    def _create_widget(self, spec: ParameterSpec) -> QWidget:
+        """Create the input for one parameter."""
+        if spec.type == PARAMETER_TYPE_BOOLEAN:
+            return QCheckBox()
+        
+        if spec.type == PARAMETER_TYPE_INTEGER:
+            spin = QSpinBox()
+            spin.setRange(int(spec.minimum or 0),
+                          INTEGER_PARAMETER_MAXIMUM if spec.maximum is None else int(spec.maximum))
+            spin.setSuffix(PARAMETER_UNIT_SUFFIXES.get(spec.unit, ""))
+            return spin
+        
+        if spec.type == PARAMETER_TYPE_FLOAT:
+            spin = QDoubleSpinBox()
+            maximum = float(INTEGER_PARAMETER_MAXIMUM) if spec.maximum is None else spec.maximum
+            decimals = len(repr(maximum).partition(".")[2])
+            spin.setRange(spec.minimum or 0.0, maximum)
+            spin.setDecimals(decimals)
+            spin.setSingleStep(10 ** -min(decimals, 3))
+            spin.setSuffix(PARAMETER_UNIT_SUFFIXES.get(spec.unit, ""))
+            return spin
+        
+        if spec.type == PARAMETER_TYPE_PIN_ASSIGNMENT:
+            widget = QWidget()
+            layout = QHBoxLayout(widget)
+            layout.setContentsMargins(0, 0, 0, 0)
+            
+            # Combo box for pin assignment and checkbox for inversion
+            widget.combo = QComboBox()
+            widget.combo.addItems(spec.values)
+            widget.invert_check = QCheckBox("Invert")
+            layout.addWidget(widget.combo)
+            layout.addWidget(widget.invert_check)
+            return widget
+        
+        line_edit = QLineEdit()
+        examples = ([spec.example.partition("=")[2]] if spec.example else []) + list(spec.special_values)
+        if examples:
+            line_edit.setPlaceholderText("e.g., " + " or ".join(examples))
+        return line_edit
+    
+    def set_values(self, parameters: Dict[str, str]):
+        """Show parameter values; parameters not given show their driver default."""
+        for name, widget in self.parameter_widgets.items():
+            spec = self.registry.get(name)
+            value = str(parameters.get(name, spec.default or ""))
+            
+            if spec.type == PARAMETER_TYPE_BOOLEAN:
+                widget.setChecked(value.lower() == spec.values[0])
+            elif spec.type in (PARAMETER_TYPE_INTEGER, PARAMETER_TYPE_FLOAT):
+                try:
+                    number = float(value or 0)
+                except ValueError:
+                    number = 0
+                widget.setValue(int(number) if spec.type == PARAMETER_TYPE_INTEGER else number)
+            elif spec.type == PARAMETER_TYPE_PIN_ASSIGNMENT:
+                inverted = value.startswith(PIN_INVERT_PREFIX)
+                clean_value = value[len(PIN_INVERT_PREFIX):] if inverted else value
+                if clean_value in spec.values:
+                    widget.combo.setCurrentText(clean_value)
+                widget.invert_check.setChecked(inverted)
+            else:
+                widget.setText(value)
+    
+    def get_values(self) -> Dict[str, str]:
+        """Get every parameter value; empty text fields are left out."""
+        parameters = {}
+        for name, widget in self.parameter_widgets.items():
+            spec = self.registry.get(name)
+            
+            if spec.type == PARAMETER_TYPE_BOOLEAN:
+                parameters[name] = spec.values[0] if widget.isChecked() else spec.values[1]
+            elif spec.type in (PARAMETER_TYPE_INTEGER, PARAMETER_TYPE_FLOAT):
+                parameters[name] = str(widget.value())
+            elif spec.type == PARAMETER_TYPE_PIN_ASSIGNMENT:
+                prefix = PIN_INVERT_PREFIX if widget.invert_check.isChecked() else ""
+                parameters[name] = f"{prefix}{widget.combo.currentText()}"
+            else:
+                value = widget.text().strip()
+                if value:
+                    parameters[name] = value
+        return parameters
+    
+    def get_changed_values(self, current: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Get the values that differ from current, or from the driver defaults if current is None."""
+        return parameter_delta(current or {}, self.get_values(), self.registry.defaults())
+    
+    def reset(self):
+        """Show the driver defaults."""
+        self.set_values({})
\ No newline at end of file
@@ -0,0 +1,421 @@
+"""Item model exposing virtual port pairs to a tree view."""
+
+import datetime
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex
+from PyQt6.QtGui import QPalette, QFont
+
+from ...core.models import PortPair, Port, PortStatus
+from ...utils.icon_registry import IconRegistry
+
+
+class PortTreeModel(QAbstractItemModel):
+    """Model with a root > port pair > port hierarchy.
+    
+    Rows are not backed by per-item objects: each index carries an integer
+    id encoding the pair number and the row kind, and all data is read
+    from the PortPair snapshot on demand. Pair rows under the root and the
+    two port rows under each pair are populated lazily through
+    canFetchMore/fetchMore.
+    """
+    
+    COLUMNS = ["Port", "Status", "Parameters"]
+    FETCH_BATCH_SIZE = 200
+    
+    # Row kinds stored in the low bits of the index id: (pair number << 2) | kind
+    KIND_ROOT = 0
+    KIND_PAIR = 1
+    KIND_PORT_A = 2
+    KIND_PORT_B = 3
+    
+    # Icons under assets/icons for each row kind and pair status
+    PAIR_ICON = "port_pair_icon"
+    PORT_ICON = "port_icon"
+    STATUS_ICONS = {
+        PortStatus.ACTIVE: "status/active",
+        PortStatus.DISABLED: "status/disabled",
+        PortStatus.ERROR: "status/error",
+        PortStatus.UNKNOWN: "status/unknown"
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pairs: Dict[int, PortPair] = {}
+        self._numbers: List[int] = []  # Sorted pair numbers, matches row order under the root
+        self._fetched_count = 0  # Pair rows exposed under the root
+        self._fetched_ports = set()  # Pair numbers whose port rows are exposed
+        self._port_locations: Dict[str, Tuple[int, int]] = {}  # identifier -> (pair number, kind)
+        self._parameter_text: Dict[str, str] = {}  # identifier -> formatted Parameters column
+        self._fetching = False  # Rows are being exposed; the view must not fetch again meanwhile
+        self._stale_since: Optional[float] = None  # Snapshot timestamp while showing saved, unconfirmed data
+        self._refresh_failed = False  # The live list replacing the snapshot could not be read
+    
+    # Index encoding
+    @staticmethod
+    def _encode(number: int, kind: int) -> int:
+        return (number << 2) | kind
+    
+    @staticmethod
+    def _decode(index: QModelIndex) -> Tuple[int, int]:
+        """Get (kind, pair number) for an index."""
+        internal_id = index.internalId()
+        return internal_id & 3, internal_id >> 2
+    
+    # QAbstractItemModel interface
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if column < 0 or column >= len(self.COLUMNS) or row < 0:
+            return QModelIndex()
+        
+        if not parent.isValid():
+            return self.createIndex(row, column, self.KIND_ROOT) if row == 0 else QModelIndex()
+        
+        kind, number = self._decode(parent)
+        if kind == self.KIND_ROOT and row < self._fetched_count:
+            return self.createIndex(row, column, self._encode(self._numbers[row], self.KIND_PAIR))
+        if kind == self.KIND_PAIR and row < 2 and number in self._fetched_ports:
+            return self.createIndex(row, column, self._encode(number, self.KIND_PORT_A + row))
+        return QModelIndex()
+    
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        
+        kind, number = self._decode(index)
+        if kind == self.KIND_ROOT:
+            return QModelIndex()
+        if kind == self.KIND_PAIR:
+            return self.createIndex(0, 0, self.KIND_ROOT)
+        return self.createIndex(bisect_left(self._numbers, number), 0, self._encode(number, self.KIND_PAIR))
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return 1
+        if parent.column() > 0:
+            return 0
+        
+        kind, number = self._decode(parent)
+        if kind == self.KIND_ROOT:
+            return self._fetched_count
+        if kind == self.KIND_PAIR:
+            return 2 if number in self._fetched_ports else 0
+        return 0
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.COLUMNS)
+    
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return True
+        if parent.column() > 0:
+            return False
+        
+        kind, _ = self._decode(parent)
+        if kind == self.KIND_ROOT:
+            return bool(self._numbers)
+        return kind == self.KIND_PAIR
+    
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if not parent.isValid() or self._fetching:
+            return False
+        
+        kind, number = self._decode(parent)
+        if kind == self.KIND_ROOT:
+            return self._fetched_count < len(self._numbers)
+        if kind == self.KIND_PAIR:
+            return number in self._pairs and number not in self._fetched_ports
+        return False
+    
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if not parent.isValid():
+            return
+        
+        kind, number = self._decode(parent)
+        if kind == self.KIND_ROOT:
+            self._fetch_pairs(min(len(self._numbers), self._fetched_count + self.FETCH_BATCH_SIZE))
+        elif kind == self.KIND_PAIR and number not in self._fetched_ports and not self._fetching:
+            self._fetching = True
+            try:
+                self.beginInsertRows(parent.sibling(parent.row(), 0), 0, 1)
+                self._fetched_ports.add(number)
+                self.endInsertRows()
+            finally:
+                self._fetching = False
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        kind, number = self._decode(index)
+        column = index.column()
+        
+        if self._stale_since is not None:
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return QPalette().color(QPalette.ColorRole.PlaceholderText)
+            if role == Qt.ItemDataRole.FontRole:
+                font = QFont()
+                font.setItalic(True)
+                return font
+        
+        if kind == self.KIND_ROOT:
+            if role == Qt.ItemDataRole.DisplayRole and column == 0:
+                count = len(self._numbers)
+                text = f"com0com Virtual Ports ({count} pair{'s' if count != 1 else ''})"
+                if self._stale_since is not None:
+                    saved = datetime.datetime.fromtimestamp(self._stale_since).strftime("%Y-%m-%d %H:%M")
+                    state = "refresh failed" if self._refresh_failed else "refreshing..."
+                    text += f" - last known state from {saved}, {state}"
+                return text
+            if role == Qt.ItemDataRole.UserRole:
+                return "root"
+            return None
+        
+        pair = self._pairs.get(number)
+        if pair is None:
+            return None
+        
+        if kind == self.KIND_PAIR:
+            if role == Qt.ItemDataRole.DisplayRole:
+                if column == 0:
+                    return f"Pair {pair.number}"
+                if column == 1:
+                    return pair.status.value
+                return f"{pair.port_a.port_name or pair.port_a.identifier} ↔ {pair.port_b.port_name or pair.port_b.identifier}"
+            if role == Qt.ItemDataRole.ForegroundRole and column == 1:
+                return self._status_foreground(pair.status)
+            if role == Qt.ItemDataRole.DecorationRole:
+                if column == 0:
+                    return IconRegistry.icon(self.PAIR_ICON)
+                if column == 1:
+                    return IconRegistry.icon(self.STATUS_ICONS[pair.status])
+                return None
+            if role == Qt.ItemDataRole.UserRole:
+                return ("pair", pair)
+            return None
+        
+        port = pair.port_a if kind == self.KIND_PORT_A else pair.port_b
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                label = "Port A" if kind == self.KIND_PORT_A else "Port B"
+                return f"{label} ({port.identifier})"
+            if column == 1:
+                return port.port_name or "Not assigned"
+            return self._get_parameter_text(port)
+        if role == Qt.ItemDataRole.DecorationRole and column == 0:
+            return IconRegistry.icon(self.PORT_ICON)
+        if role == Qt.ItemDataRole.UserRole:
+            return ("port", port)
+        return None
+    
+    # Snapshot updates
+    def set_port_pairs(self, port_pairs: List[PortPair], stale_since: Optional[float] = None) -> List[int]:
+        """Reconcile the model with a new snapshot.
+        
+        Only rows whose data changed are signalled to the view, so the cost
+        is proportional to the size of the change. stale_since marks the
+        data as a saved snapshot from that time, shown in a stale style
+        until live data arrives. Returns the numbers of newly added pairs.
+        """
+        new_pairs = {pair.number: pair for pair in port_pairs}
+        root = self.createIndex(0, 0, self.KIND_ROOT)
+        
+        # Remove pairs that no longer exist
+        for number in [n for n in self._pairs if n not in new_pairs]:
+            row = bisect_left(self._numbers, number)
+            exposed = row < self._fetched_count
+            if exposed:
+                self.beginRemoveRows(root, row, row)
+            
+            del self._numbers[row]
+            self._forget_pair(self._pairs.pop(number))
+            
+            if exposed:
+                self._fetched_count -= 1
+                self.endRemoveRows()
+        
+        # Add new pairs and update changed ones
+        added = []
+        for number, pair in new_pairs.items():
+            current = self._pairs.get(number)
+            if current is None:
+                self._insert_pair(root, pair)
+                added.append(number)
+            elif current != pair:
+                self._update_pair(current, pair)
+        
+        # Keep at least the first batch exposed without waiting for the view
+        self._fetch_pairs(min(len(self._numbers), self.FETCH_BATCH_SIZE))
+        
+        self._refresh_failed = False
+        if stale_since != self._stale_since:
+            self._stale_since = stale_since
+            self._emit_all_rows_changed()
+        
+        # Root label shows the pair count
+        self.dataChanged.emit(root, root, [Qt.ItemDataRole.DisplayRole])
+        return added
+    
+    def _insert_pair(self, root: QModelIndex, pair: PortPair) -> None:
+        """Insert a pair at its sorted position, exposing it if already fetched."""
+        row = bisect_left(self._numbers, pair.number)
+        exposed = row < self._fetched_count
+        if exposed:
+            self.beginInsertRows(root, row, row)
+        
+        self._numbers.insert(row, pair.number)
+        self._pairs[pair.number] = pair
+        self._remember_pair(pair)
+        
+        if exposed:
+            self._fetched_count += 1
+            self.endInsertRows()
+    
+    def _update_pair(self, current: PortPair, pair: PortPair) -> None:
+        """Replace a pair in place, keeping its port rows exposed, and signal its rows."""
+        self._forget_ports(current)
+        self._pairs[pair.number] = pair
+        self._remember_pair(pair)
+        
+        row = bisect_left(self._numbers, pair.number)
+        if row >= self._fetched_count:
+            return
+        
+        last_column = len(self.COLUMNS) - 1
+        pair_id = self._encode(pair.number, self.KIND_PAIR)
+        self.dataChanged.emit(self.createIndex(row, 0, pair_id), self.createIndex(row, last_column, pair_id))
+        
+        if pair.number in self._fetched_ports:
+            self.dataChanged.emit(self.createIndex(0, 0, self._encode(pair.number, self.KIND_PORT_A)),
+                                  self.createIndex(1, last_column, self._encode(pair.number, self.KIND_PORT_B)))
+    
+    def _emit_all_rows_changed(self) -> None:
+        """Signal that every exposed row changed, e.g. when the stale style toggles."""
+        if not self._fetched_count:
+            return
+        
+        last_column = len(self.COLUMNS) - 1
+        first_id = self._encode(self._numbers[0], self.KIND_PAIR)
+        last_id = self._encode(self._numbers[self._fetched_count - 1], self.KIND_PAIR)
+        self.dataChanged.emit(self.createIndex(0, 0, first_id),
+                              self.createIndex(self._fetched_count - 1, last_column, last_id))
+        
+        for number in self._fetched_ports:
+            self.dataChanged.emit(self.createIndex(0, 0, self._encode(number, self.KIND_PORT_A)),
+                                  self.createIndex(1, last_column, self._encode(number, self.KIND_PORT_B)))
+    
+    def is_stale(self) -> bool:
+        """Check if the model shows a saved snapshot rather than live data."""
+        return self._stale_since is not None
+    
+    def set_refresh_failed(self) -> None:
+        """Mark a shown snapshot as no longer being refreshed because the live list failed."""
+        if self._stale_since is None or self._refresh_failed:
+            return
+        
+        self._refresh_failed = True
+        root = self.createIndex(0, 0, self.KIND_ROOT)
+        self.dataChanged.emit(root, root, [Qt.ItemDataRole.DisplayRole])
+    
+    def _remember_pair(self, pair: PortPair) -> None:
+        self._port_locations[pair.port_a.identifier] = (pair.number, self.KIND_PORT_A)
+        self._port_locations[pair.port_b.identifier] = (pair.number, self.KIND_PORT_B)
+    
+    def _forget_pair(self, pair: PortPair) -> None:
+        self._fetched_ports.discard(pair.number)
+        self._forget_ports(pair)
+    
+    def _forget_ports(self, pair: PortPair) -> None:
+        for port in (pair.port_a, pair.port_b):
+            self._port_locations.pop(port.identifier, None)
+            self._parameter_text.pop(port.identifier, None)
+    
+    def _fetch_pairs(self, count: int) -> None:
+        """Expose pair rows under the root up to the given count."""
+        if count <= self._fetched_count or self._fetching:
+            return
+        root = self.createIndex(0, 0, self.KIND_ROOT)
+        self._fetching = True
+        try:
+            self.beginInsertRows(root, self._fetched_count, count - 1)
+            self._fetched_count = count
+            self.endInsertRows()
+        finally:
+            self._fetching = False
+    
+    # Lookups
+    def root_index(self) -> QModelIndex:
+        """Get the index of the root row."""
+        return self.createIndex(0, 0, self.KIND_ROOT)
+    
+    def pair_index(self, pair_number: int) -> QModelIndex:
+        """Get the index of a pair row, fetching rows up to it if needed."""
+        if pair_number not in self._pairs:
+            return QModelIndex()
+        row = bisect_left(self._numbers, pair_number)
+        self._fetch_pairs(row + 1)
+        return self.createIndex(row, 0, self._encode(pair_number, self.KIND_PAIR))
+    
+    def port_index(self, port_id: str) -> QModelIndex:
+        """Get the index of a port row, fetching its pair's rows if needed."""
+        location = self._port_locations.get(port_id)
+        if location is None:
+            return QModelIndex()
+        number, kind = location
+        pair_index = self.pair_index(number)
+        if number not in self._fetched_ports:
+            self.fetchMore(pair_index)
+        return self.createIndex(kind - self.KIND_PORT_A, 0, self._encode(number, kind))
+    
+    def pair_count(self) -> int:
+        """Get the number of pairs in the snapshot."""
+        return len(self._numbers)
+    
+    # Formatting
+    def _get_parameter_text(self, port: Port) -> str:
+        """Get the Parameters column text, formatting it on first use."""
+        text = self._parameter_text.get(port.identifier)
+        if text is None:
+            text = self.format_parameters(port.parameters)
+            self._parameter_text[port.identifier] = text
+        return text
+    
+    @staticmethod
+    def format_parameters(parameters: dict) -> str:
+        """Format port parameters for display."""
+        if not parameters:
+            return "Default settings"
+        
+        # Show key parameters in abbreviated form
+        key_params = []
+        
+        if parameters.get("EmuBR") == "yes":
+            key_params.append("BR")
+        if parameters.get("EmuOverrun") == "yes":
+            key_params.append("Overrun")
+        if parameters.get("PlugInMode") == "yes":
+            key_params.append("PlugIn")
+        if parameters.get("HiddenMode") == "yes":
+            key_params.append("Hidden")
+        if "EmuNoise" in parameters and float(parameters["EmuNoise"]) > 0:
+            key_params.append(f"Noise:{parameters['EmuNoise']}")
+        
+        if key_params:
+            return ", ".join(key_params)
+        else:
+            param_count = len(parameters)
+            return f"{param_count} custom parameter{'s' if param_count != 1 else ''}"
+    
+    @staticmethod
+    def _status_foreground(status: PortStatus):
+        """Get the status column colour for a pair status."""
+        palette = QPalette()
+        if status == PortStatus.ERROR:
+            return palette.color(QPalette.ColorRole.Text)
+        if status == PortStatus.DISABLED:
+            return palette.color(QPalette.ColorRole.PlaceholderText)
+        return None
\ No newline at end of file
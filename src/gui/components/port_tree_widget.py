@@ -1,156 +1,127 @@
 """Port tree widget for displaying virtual port pairs."""
 
 from typing import List, Optional
-from PyQt6.QtWidgets import (QTreeWidget, QTreeWidgetItem, QHeaderView, 
-                            QMenu, QApplication)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QIcon, QAction
+from PyQt6.QtWidgets import QTreeView, QHeaderView
+from PyQt6.QtCore import Qt, QModelIndex, pyqtSignal
 
-from ...core.models import PortPair, Port, PortStatus
+from ...core.models import PortPair, Port
+from .port_tree_model import PortTreeModel
 
 
-class PortTreeWidget(QTreeWidget):
-    """Tree widget for displaying com0com virtual port pairs."""
+class PortTreeWidget(QTreeView):
+    """Tree view for displaying com0com virtual port pairs."""
+    
+    # Pair rows added by an update are expanded only while the list is this small
+    AUTO_EXPAND_LIMIT = 100
     
     # Signals
     port_pair_selected = pyqtSignal(PortPair)
     port_selected = pyqtSignal(Port)
+    ports_selected = pyqtSignal(list)  # List[Port], emitted when more than one row is selected
     port_pair_double_clicked = pyqtSignal(PortPair)
     context_menu_requested = pyqtSignal(object, object)  # (item_type, item_data)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.port_pairs = []
+        self._multiple_selected = False
+        self.port_model = PortTreeModel(self)
+        self.setModel(self.port_model)
         self.setup_ui()
         self.setup_connections()
     
     def setup_ui(self):
-        """Initialize the tree widget UI."""
-        # Set up columns
-        self.setHeaderLabels(["Port", "Status", "Parameters"])
-        self.setColumnCount(3)
-        
+        """Initialize the tree view UI."""
         # Configure tree appearance
         self.setRootIsDecorated(True)
         self.setAlternatingRowColors(True)
-        self.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
+        self.setUniformRowHeights(True)
+        self.setSelectionMode(QTreeView.SelectionMode.ExtendedSelection)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         
-        # Set column widths
+        # Set column widths; content-sized columns would query every row on each change
         header = self.header()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
         
         # Set initial column widths
         self.setColumnWidth(0, 250)
         self.setColumnWidth(1, 100)
         
-        # Create root item
-        self.create_root_item()
+        self.expand(self.port_model.root_index())
     
     def setup_connections(self):
         """Set up signal connections."""
-        self.itemSelectionChanged.connect(self._on_selection_changed)
-        self.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.selectionModel().currentChanged.connect(self._on_current_changed)
+        self.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.doubleClicked.connect(self._on_item_double_clicked)
         self.customContextMenuRequested.connect(self._on_context_menu_requested)
     
-    def create_root_item(self):
-        """Create the root tree item."""
-        self.clear()
-        root_item = QTreeWidgetItem(["com0com Virtual Ports", "", ""])
-        root_item.setData(0, Qt.ItemDataRole.UserRole, "root")
-        self.addTopLevelItem(root_item)
-        self.expandItem(root_item)
-    
-    def update_port_pairs(self, port_pairs: List[PortPair]):
-        """Update the tree with new port pair data."""
-        self.port_pairs = port_pairs
-        
-        # Clear existing items (except root)
-        root_item = self.topLevelItem(0)
-        root_item.takeChildren()
-        
-        # Update root item text with count
-        count = len(port_pairs)
-        root_item.setText(0, f"com0com Virtual Ports ({count} pair{'s' if count != 1 else ''})")
-        
-        # Add port pairs
-        for pair in port_pairs:
-            self._add_port_pair_item(root_item, pair)
-        
-        # Expand all items
-        self.expandAll()
-    
-    def _add_port_pair_item(self, parent_item: QTreeWidgetItem, pair: PortPair):
-        """Add a port pair item to the tree."""
-        # Create pair item
-        pair_name = f"Pair {pair.number}"
-        status_text = pair.status.value
-        pair_info = f"{pair.port_a.port_name or pair.port_a.identifier} ↔ {pair.port_b.port_name or pair.port_b.identifier}"
+    def update_port_pairs(self, port_pairs: List[PortPair], stale_since: Optional[float] = None):
+        """Update the tree with new port pair data.
         
-        pair_item = QTreeWidgetItem([pair_name, status_text, pair_info])
-        pair_item.setData(0, Qt.ItemDataRole.UserRole, ("pair", pair))
-        
-        # Set status-based styling
-        self._set_status_styling(pair_item, pair.status)
-        
-        parent_item.addChild(pair_item)
-        
-        # Add individual port items
-        self._add_port_item(pair_item, pair.port_a, f"Port A ({pair.port_a.identifier})")
-        self._add_port_item(pair_item, pair.port_b, f"Port B ({pair.port_b.identifier})")
-    
-    def _add_port_item(self, parent_item: QTreeWidgetItem, port: Port, display_name: str):
-        """Add an individual port item to the tree."""
-        port_name = port.port_name or "Not assigned"
-        parameters = self._format_parameters(port.parameters)
-        
-        port_item = QTreeWidgetItem([display_name, port_name, parameters])
-        port_item.setData(0, Qt.ItemDataRole.UserRole, ("port", port))
-        
-        parent_item.addChild(port_item)
+        The model reconciles rows by pair number, so only added, removed or
+        changed rows are touched. Selection, expansion and scroll position
+        are preserved; when the parameters of a selected pair or port
+        changed, the selection signal is emitted again with the new objects. Pass
+        stale_since (a timestamp) to show a saved snapshot in the stale style
+        until live data arrives.
+        """
+        self.port_pairs = port_pairs
+        selected_before = self._selected_parameters()
+        added = self.port_model.set_port_pairs(port_pairs, stale_since)
+        
+        selected_after = self._selected_parameters()
+        if selected_after and selected_after != selected_before:
+            if len(self.selectionModel().selectedRows(0)) > 1:
+                self.ports_selected.emit(self.get_selected_ports())
+            else:
+                self._emit_single_selection(self.currentIndex())
+        
+        self.expand(self.port_model.root_index())
+        if len(port_pairs) <= self.AUTO_EXPAND_LIMIT:
+            for number in added:
+                self.expand(self.port_model.pair_index(number))
+    
+    def mark_refresh_failed(self):
+        """Show that the saved snapshot could not be replaced with live data."""
+        self.port_model.set_refresh_failed()
+    
+    def _selected_parameters(self) -> list:
+        """Get the port names and parameters shown for the selected rows, in selection order."""
+        selected = []
+        for data in map(self._item_data, self.selectionModel().selectedRows(0)):
+            if isinstance(data, tuple):
+                item_type, item = data
+                ports = (item.port_a, item.port_b) if item_type == "pair" else (item,)
+                selected.append([(port.identifier, port.port_name, dict(port.parameters)) for port in ports])
+        return selected
+    
+    def _item_data(self, index: QModelIndex):
+        """Get the (item_type, item_data) tuple or "root" for an index."""
+        if not index.isValid():
+            return None
+        return index.sibling(index.row(), 0).data(Qt.ItemDataRole.UserRole)
     
-    def _format_parameters(self, parameters: dict) -> str:
-        """Format port parameters for display."""
-        if not parameters:
-            return "Default settings"
-        
-        # Show key parameters in abbreviated form
-        key_params = []
-        
-        if parameters.get("EmuBR") == "yes":
-            key_params.append("BR")
-        if parameters.get("EmuOverrun") == "yes":
-            key_params.append("Overrun")
-        if parameters.get("PlugInMode") == "yes":
-            key_params.append("PlugIn")
-        if parameters.get("HiddenMode") == "yes":
-            key_params.append("Hidden")
-        if "EmuNoise" in parameters and float(parameters["EmuNoise"]) > 0:
-            key_params.append(f"Noise:{parameters['EmuNoise']}")
-        
-        if key_params:
-            return ", ".join(key_params)
-        else:
-            param_count = len(parameters)
-            return f"{param_count} custom parameter{'s' if param_count != 1 else ''}"
-    
-    def _set_status_styling(self, item: QTreeWidgetItem, status: PortStatus):
-        """Apply status-based styling to tree item."""
-        # This could be enhanced with icons or colors
-        if status == PortStatus.ERROR:
-            item.setForeground(1, self.palette().color(self.palette().ColorRole.Text))
-        elif status == PortStatus.DISABLED:
-            item.setForeground(1, self.palette().color(self.palette().ColorRole.PlaceholderText))
-    
-    def _on_selection_changed(self):
+    def _on_current_changed(self, current: QModelIndex, previous: QModelIndex):
         """Handle selection change."""
-        current_item = self.currentItem()
-        if not current_item:
-            return
-        
-        data = current_item.data(0, Qt.ItemDataRole.UserRole)
+        if len(self.selectionModel().selectedRows(0)) > 1:
+            return  # Reported by _on_selection_changed
+        self._emit_single_selection(current)
+    
+    def _on_selection_changed(self, selected, deselected):
+        """Report multiple selections, and the return to a single one."""
+        if len(self.selectionModel().selectedRows(0)) > 1:
+            self._multiple_selected = True
+            self.ports_selected.emit(self.get_selected_ports())
+        elif self._multiple_selected:
+            self._multiple_selected = False
+            self._emit_single_selection(self.currentIndex())
+    
+    def _emit_single_selection(self, current: QModelIndex):
+        """Emit the selection signal for one item."""
+        data = self._item_data(current)
         if isinstance(data, tuple):
             item_type, item_data = data
             if item_type == "pair":
@@ -158,9 +129,9 @@ class PortTreeWidget(QTreeWidget):
             elif item_type == "port":
                 self.port_selected.emit(item_data)
     
-    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+    def _on_item_double_clicked(self, index: QModelIndex):
         """Handle item double click."""
-        data = item.data(0, Qt.ItemDataRole.UserRole)
+        data = self._item_data(index)
         if isinstance(data, tuple):
             item_type, item_data = data
             if item_type == "pair":
@@ -168,11 +139,7 @@ class PortTreeWidget(QTreeWidget):
     
     def _on_context_menu_requested(self, position):
         """Handle context menu request."""
-        item = self.itemAt(position)
-        if not item:
-            return
-        
-        data = item.data(0, Qt.ItemDataRole.UserRole)
+        data = self._item_data(self.indexAt(position))
         if isinstance(data, tuple):
             item_type, item_data = data
             self.context_menu_requested.emit(item_type, item_data)
@@ -181,11 +148,7 @@ class PortTreeWidget(QTreeWidget):
     
     def get_selected_port_pair(self) -> Optional[PortPair]:
         """Get the currently selected port pair."""
-        current_item = self.currentItem()
-        if not current_item:
-            return None
-        
-        data = current_item.data(0, Qt.ItemDataRole.UserRole)
+        data = self._item_data(self.currentIndex())
         if isinstance(data, tuple):
             item_type, item_data = data
             if item_type == "pair":
@@ -195,11 +158,7 @@ class PortTreeWidget(QTreeWidget):
     
     def get_selected_port(self) -> Optional[Port]:
         """Get the currently selected individual port."""
-        current_item = self.currentItem()
-        if not current_item:
-            return None
-        
-        data = current_item.data(0, Qt.ItemDataRole.UserRole)
+        data = self._item_data(self.currentIndex())
         if isinstance(data, tuple):
             item_type, item_data = data
             if item_type == "port":
@@ -207,18 +166,39 @@ class PortTreeWidget(QTreeWidget):
         
         return None
     
+    def get_selected_ports(self) -> List[Port]:
+        """Get every selected port; a selected pair contributes both of its ports."""
+        ports = {}
+        for index in self.selectionModel().selectedRows(0):
+            data = self._item_data(index)
+            if not isinstance(data, tuple):
+                continue
+            item_type, item_data = data
+            if item_type == "pair":
+                for port in (item_data.port_a, item_data.port_b):
+                    ports.setdefault(port.identifier, port)
+            elif item_type == "port":
+                ports.setdefault(item_data.identifier, item_data)
+        
+        # Selection order is click order; report ports in tree order
+        return sorted(ports.values(), key=lambda port: (int(port.identifier[4:]), port.identifier[3]))
+    
     def select_port_pair(self, pair_number: int):
         """Select a specific port pair by number."""
-        root_item = self.topLevelItem(0)
-        for i in range(root_item.childCount()):
-            pair_item = root_item.child(i)
-            data = pair_item.data(0, Qt.ItemDataRole.UserRole)
-            if isinstance(data, tuple):
-                item_type, item_data = data
-                if item_type == "pair" and item_data.number == pair_number:
-                    self.setCurrentItem(pair_item)
-                    return True
-        return False
+        index = self.port_model.pair_index(pair_number)
+        if not index.isValid():
+            return False
+        self.setCurrentIndex(index)
+        return True
+    
+    def select_port(self, port_id: str):
+        """Select a specific port by identifier."""
+        index = self.port_model.port_index(port_id)
+        if not index.isValid():
+            return False
+        self.expand(index.parent())
+        self.setCurrentIndex(index)
+        return True
     
     def refresh(self):
         """Refresh the tree display with current data."""
@@ -1,15 +1,13 @@
 """Properties panel for displaying and editing port configuration."""
 
-from typing import Optional, Dict, Any
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QLineEdit, QComboBox, QCheckBox, QPushButton,
-                            QGroupBox, QFormLayout, QTextEdit, QScrollArea,
-                            QDoubleSpinBox, QSpinBox)
+from typing import Optional, Dict, Any, List
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                            QGroupBox, QFormLayout, QScrollArea)
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 
 from ...core.models import PortPair, Port
-from ...utils.constants import BOOLEAN_VALUES, PIN_ASSIGNMENT_VALUES
+from .parameter_form import ParameterForm
 
 
 class PropertiesPanel(QScrollArea):
@@ -17,12 +15,13 @@ class PropertiesPanel(QScrollArea):
     
     # Signals
     apply_changes = pyqtSignal(str, dict)  # (port_id, parameters)
+    bulk_edit_requested = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_port = None
         self.current_pair = None
-        self.parameter_widgets = {}
+        self.parameter_form = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -136,6 +135,32 @@ class PropertiesPanel(QScrollArea):
         
         self.content_layout.addWidget(config_group)
     
+    def show_multiple_ports(self, ports: List[Port]):
+        """Display a summary of several selected ports."""
+        self.clear_content()
+        self.current_port = None
+        self.current_pair = None
+        
+        self.header_label.setText(f"{len(ports)} Ports Selected")
+        
+        summary_group = QGroupBox("Selected Ports")
+        summary_layout = QVBoxLayout(summary_group)
+        
+        ports_label = QLabel(", ".join(port.identifier for port in ports))
+        ports_label.setWordWrap(True)
+        summary_layout.addWidget(ports_label)
+        
+        bulk_edit_button = QPushButton("Bulk Edit...")
+        bulk_edit_button.setToolTip("Apply one parameter change to every selected port")
+        bulk_edit_button.clicked.connect(self.bulk_edit_requested.emit)
+        
+        button_layout = QHBoxLayout()
+        button_layout.addWidget(bulk_edit_button)
+        button_layout.addStretch()
+        summary_layout.addLayout(button_layout)
+        
+        self.content_layout.addWidget(summary_group)
+    
     def _create_port_details_widget(self, port: Port, read_only: bool = True) -> QWidget:
         """Create a widget showing port details."""
         details_widget = QWidget()
@@ -156,175 +181,16 @@ class PropertiesPanel(QScrollArea):
     
     def _create_port_configuration_form(self, port: Port) -> QWidget:
         """Create editable configuration form for a port."""
-        form_widget = QWidget()
-        form_layout = QVBoxLayout(form_widget)
-        
-        self.parameter_widgets = {}
-        
-        # Basic settings
-        basic_group = QGroupBox("Basic Settings")
-        basic_layout = QFormLayout(basic_group)
-        
-        # Port Name
-        port_name_edit = QLineEdit(port.port_name or "")
-        port_name_edit.setPlaceholderText("e.g., COM8 or COM# for auto-assign")
-        self.parameter_widgets["PortName"] = port_name_edit
-        basic_layout.addRow("Port Name:", port_name_edit)
-        
-        form_layout.addWidget(basic_group)
-        
-        # Emulation settings
-        emulation_group = QGroupBox("Emulation Settings")
-        emulation_layout = QFormLayout(emulation_group)
-        
-        # EmuBR
-        emubr_combo = QComboBox()
-        emubr_combo.addItems(BOOLEAN_VALUES)
-        emubr_combo.setCurrentText(port.get_parameter("EmuBR", "no"))
-        self.parameter_widgets["EmuBR"] = emubr_combo
-        emulation_layout.addRow("Baud Rate Emulation:", emubr_combo)
-        
-        # EmuOverrun
-        overrun_combo = QComboBox()
-        overrun_combo.addItems(BOOLEAN_VALUES)
-        overrun_combo.setCurrentText(port.get_parameter("EmuOverrun", "no"))
-        self.parameter_widgets["EmuOverrun"] = overrun_combo
-        emulation_layout.addRow("Buffer Overrun:", overrun_combo)
-        
-        # EmuNoise
-        noise_spin = QDoubleSpinBox()
-        noise_spin.setRange(0.0, 0.99999999)
-        noise_spin.setDecimals(8)
-        noise_spin.setSingleStep(0.001)
-        noise_spin.setValue(float(port.get_parameter("EmuNoise", "0")))
-        self.parameter_widgets["EmuNoise"] = noise_spin
-        emulation_layout.addRow("Noise Level:", noise_spin)
-        
-        form_layout.addWidget(emulation_group)
-        
-        # Timing settings
-        timing_group = QGroupBox("Timing Settings")
-        timing_layout = QFormLayout(timing_group)
-        
-        # AddRTTO
-        rtto_spin = QSpinBox()
-        rtto_spin.setRange(0, 99999)
-        rtto_spin.setSuffix(" ms")
-        rtto_spin.setValue(int(port.get_parameter("AddRTTO", "0")))
-        self.parameter_widgets["AddRTTO"] = rtto_spin
-        timing_layout.addRow("Read Total Timeout:", rtto_spin)
-        
-        # AddRITO
-        rito_spin = QSpinBox()
-        rito_spin.setRange(0, 99999)
-        rito_spin.setSuffix(" ms")
-        rito_spin.setValue(int(port.get_parameter("AddRITO", "0")))
-        self.parameter_widgets["AddRITO"] = rito_spin
-        timing_layout.addRow("Read Interval Timeout:", rito_spin)
-        
-        form_layout.addWidget(timing_group)
-        
-        # Mode settings
-        mode_group = QGroupBox("Mode Settings")
-        mode_layout = QFormLayout(mode_group)
-        
-        # PlugInMode
-        plugin_check = QCheckBox()
-        plugin_check.setChecked(port.get_parameter("PlugInMode", "no") == "yes")
-        self.parameter_widgets["PlugInMode"] = plugin_check
-        mode_layout.addRow("Plug-in Mode:", plugin_check)
-        
-        # ExclusiveMode
-        exclusive_check = QCheckBox()
-        exclusive_check.setChecked(port.get_parameter("ExclusiveMode", "no") == "yes")
-        self.parameter_widgets["ExclusiveMode"] = exclusive_check
-        mode_layout.addRow("Exclusive Mode:", exclusive_check)
-        
-        # HiddenMode
-        hidden_check = QCheckBox()
-        hidden_check.setChecked(port.get_parameter("HiddenMode", "no") == "yes")
-        self.parameter_widgets["HiddenMode"] = hidden_check
-        mode_layout.addRow("Hidden Mode:", hidden_check)
-        
-        # AllDataBits
-        databits_check = QCheckBox()
-        databits_check.setChecked(port.get_parameter("AllDataBits", "no") == "yes")
-        self.parameter_widgets["AllDataBits"] = databits_check
-        mode_layout.addRow("All Data Bits:", databits_check)
-        
-        form_layout.addWidget(mode_group)
-        
-        # Pin wiring settings
-        wiring_group = QGroupBox("Pin Wiring")
-        wiring_layout = QFormLayout(wiring_group)
-        
-        for pin in ["cts", "dsr", "dcd", "ri"]:
-            pin_widget = self._create_pin_assignment_widget(port, pin)
-            self.parameter_widgets[pin] = pin_widget
-            wiring_layout.addRow(f"{pin.upper()}:", pin_widget)
-        
-        form_layout.addWidget(wiring_group)
-        
-        return form_widget
-    
-    def _create_pin_assignment_widget(self, port: Port, pin: str) -> QWidget:
-        """Create pin assignment widget with combo and invert checkbox."""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Get current value
-        current_value = port.get_parameter(pin, "rrts" if pin == "cts" else "rdtr" if pin in ["dsr", "dcd"] else "!on")
-        inverted = current_value.startswith("!")
-        clean_value = current_value[1:] if inverted else current_value
-        
-        # Combo box for pin assignment
-        combo = QComboBox()
-        combo.addItems(PIN_ASSIGNMENT_VALUES)
-        if clean_value in PIN_ASSIGNMENT_VALUES:
-            combo.setCurrentText(clean_value)
-        
-        # Checkbox for inversion
-        invert_check = QCheckBox("Invert")
-        invert_check.setChecked(inverted)
-        
-        layout.addWidget(combo)
-        layout.addWidget(invert_check)
-        
-        # Store both widgets for retrieval
-        widget.combo = combo
-        widget.invert_check = invert_check
-        
-        return widget
+        self.parameter_form = ParameterForm()
+        self.parameter_form.set_values(port.parameters)
+        return self.parameter_form
     
     def _apply_changes(self):
         """Apply configuration changes."""
         if not self.current_port:
             return
         
-        # Collect parameters from widgets
-        parameters = {}
-        
-        for param_name, widget in self.parameter_widgets.items():
-            if isinstance(widget, QLineEdit):
-                value = widget.text().strip()
-                if value:
-                    parameters[param_name] = value
-            elif isinstance(widget, QComboBox):
-                parameters[param_name] = widget.currentText()
-            elif isinstance(widget, QCheckBox):
-                parameters[param_name] = "yes" if widget.isChecked() else "no"
-            elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                value = widget.value()
-                if value != 0:  # Only include non-zero values
-                    parameters[param_name] = str(value)
-            elif hasattr(widget, 'combo'):  # Pin assignment widget
-                combo_value = widget.combo.currentText()
-                if widget.invert_check.isChecked():
-                    value = f"!{combo_value}"
-                else:
-                    value = combo_value
-                parameters[param_name] = value
+        parameters = self.parameter_form.get_values()
         
         # Emit signal with changes
         self.apply_changes.emit(self.current_port.identifier, parameters)
@@ -342,7 +208,7 @@ class PropertiesPanel(QScrollArea):
             if child.widget():
                 child.widget().deleteLater()
         
-        self.parameter_widgets = {}
+        self.parameter_form = None
     
     def show_driver_info(self):
         """Show driver information."""
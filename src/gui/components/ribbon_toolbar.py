@@ -1,6 +1,5 @@
 """Ribbon-style toolbar for main commands."""
 
-import os
 from typing import Optional
 from PyQt6.QtWidgets import (QToolBar, QWidget, QHBoxLayout, QVBoxLayout, 
                             QLabel, QPushButton, QFrame)
@@ -8,6 +7,7 @@ from PyQt6.QtCore import Qt, pyqtSignal, QSize
 from PyQt6.QtGui import QIcon
 
 from ...core.models import PortPair, Port
+from ...utils.icon_registry import IconRegistry
 
 
 class RibbonButton(QPushButton):
@@ -28,19 +28,9 @@ class RibbonButton(QPushButton):
                 self.setIconSize(QSize(16, 16))  # Standard Windows icon size
         
     
-    def _load_svg_icon(self, icon_name: str):
-        """Load SVG icon and return QIcon."""
-        # Get the project root directory
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-        icon_path = os.path.join(project_root, "assets", "icons", "toolbar", f"{icon_name}.svg")
-        
-        if os.path.exists(icon_path):
-            # Create QIcon from SVG
-            return QIcon(icon_path)
-        else:
-            # Return null icon if SVG not found
-            return QIcon()
+    def _load_svg_icon(self, icon_name: str) -> QIcon:
+        """Get a toolbar icon from the shared registry (null if the SVG is missing)."""
+        return IconRegistry.icon(f"toolbar/{icon_name}")
 
 
 class RibbonGroup(QFrame):
@@ -214,6 +204,12 @@ class RibbonToolbar(QToolBar):
             self.configure_button.setEnabled(True)
             self.configure_button.setText("Configure")
             
+        elif selection_type == "ports":
+            # Several ports selected
+            self.remove_button.setEnabled(False)
+            self.configure_button.setEnabled(True)
+            self.configure_button.setText("Bulk Edit")
+        
         elif selection_type == "root":
             # Root node selected
             self.remove_button.setEnabled(False)
@@ -1,13 +1,43 @@
-"""Dialog components for com0com GUI Manager."""
+"""Dialog components for com0com GUI Manager.
 
-from .new_port_dialog import NewPortDialog
-from .configure_dialog import ConfigurePortDialog
-from .driver_ops_dialog import DriverOperationsDialog
-from .help_dialog import HelpDialog
+Dialog modules are imported on first attribute access so that importing
+one dialog does not load the others at startup.
+"""
+
+import importlib
+
+# Exported name -> module defining it
+_DIALOG_MODULES = {
+    'NewPortDialog': 'new_port_dialog',
+    'ConfigurePortDialog': 'configure_dialog',
+    'DriverOperationsDialog': 'driver_ops_dialog',
+    'HelpDialog': 'help_dialog',
+    'BatchProvisionDialog': 'batch_provision_dialog',
+    'CommandJournalDialog': 'command_journal_dialog',
+    'MetricsDialog': 'metrics_dialog',
+    'PlanPreviewDialog': 'plan_preview_dialog',
+    'BulkEditDialog': 'bulk_edit_dialog'
+}
 
 __all__ = [
     'NewPortDialog',
     'ConfigurePortDialog', 
     'DriverOperationsDialog',
-    'HelpDialog'
-]
\ No newline at end of file
+    'HelpDialog',
+    'BatchProvisionDialog',
+    'CommandJournalDialog',
+    'MetricsDialog',
+    'PlanPreviewDialog',
+    'BulkEditDialog'
+]
+
+
+def __getattr__(name):
+    """Import a dialog module when one of its exports is first used."""
+    module_name = _DIALOG_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
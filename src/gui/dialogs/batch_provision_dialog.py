@@ -0,0 +1,240 @@
+"""Dialog for provisioning many virtual port pairs in one batch."""
+
+from typing import List, Tuple
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QLineEdit,
+                            QSpinBox, QCheckBox, QLabel, QGroupBox, QMessageBox,
+                            QDialogButtonBox, QProgressBar, QTableWidget,
+                            QTableWidgetItem, QHeaderView)
+from PyQt6.QtCore import pyqtSignal, pyqtSlot
+
+from ...core.models import BatchInstallItem, CommandResult
+from ...core.validators import ParameterValidator
+
+
+class BatchProvisionDialog(QDialog):
+    """Dialog for installing a range of port pairs with one driver update."""
+    
+    # Signal emitted with the List[BatchInstallItem] to install
+    provision_requested = pyqtSignal(list)
+    # Signal emitted with the List[BatchInstallItem] to preview without installing
+    preview_requested = pyqtSignal(list)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.running = False
+        
+        self.setWindowTitle("Batch Provision Port Pairs")
+        self.setModal(True)
+        self.resize(600, 650)
+        self.setup_ui()
+        self.setup_connections()
+    
+    def setup_ui(self):
+        """Set up the dialog UI."""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        
+        # Title
+        title_label = QLabel("Batch Provision Port Pairs")
+        layout.addWidget(title_label)
+        
+        # Description
+        desc_label = QLabel("Install a range of virtual port pairs. The driver and friendly names "
+                           "are updated once after all pairs have been installed.")
+        desc_label.setWordWrap(True)
+        layout.addWidget(desc_label)
+        
+        # Pair range group
+        range_group = QGroupBox("Pair Range")
+        range_layout = QFormLayout(range_group)
+        
+        self.auto_number_check = QCheckBox("Auto-assign pair numbers")
+        range_layout.addRow("", self.auto_number_check)
+        
+        self.first_pair_spin = QSpinBox()
+        self.first_pair_spin.setRange(0, 999)
+        range_layout.addRow("First Pair Number:", self.first_pair_spin)
+        
+        self.count_spin = QSpinBox()
+        self.count_spin.setRange(1, 1000)
+        self.count_spin.setValue(10)
+        range_layout.addRow("Number of Pairs:", self.count_spin)
+        
+        layout.addWidget(range_group)
+        
+        # Port naming group
+        naming_group = QGroupBox("Port Names")
+        naming_layout = QFormLayout(naming_group)
+        
+        self.assign_names_check = QCheckBox("Assign consecutive COM port names")
+        naming_layout.addRow("", self.assign_names_check)
+        
+        self.first_com_spin = QSpinBox()
+        self.first_com_spin.setRange(1, 9999)
+        self.first_com_spin.setValue(10)
+        self.first_com_spin.setEnabled(False)
+        naming_layout.addRow("First COM Number:", self.first_com_spin)
+        
+        layout.addWidget(naming_group)
+        
+        # Extra parameters group
+        params_group = QGroupBox("Additional Parameters")
+        params_layout = QFormLayout(params_group)
+        
+        self.params_a_edit = QLineEdit()
+        self.params_a_edit.setPlaceholderText("e.g., EmuBR=yes,EmuOverrun=yes")
+        params_layout.addRow("Port A:", self.params_a_edit)
+        
+        self.params_b_edit = QLineEdit()
+        self.params_b_edit.setPlaceholderText("e.g., EmuBR=yes,EmuOverrun=yes")
+        params_layout.addRow("Port B:", self.params_b_edit)
+        
+        layout.addWidget(params_group)
+        
+        # Progress and per-item results
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        
+        self.results_table = QTableWidget(0, 3)
+        self.results_table.setHorizontalHeaderLabels(["Item", "Status", "Message"])
+        self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        self.results_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        self.results_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        self.results_table.verticalHeader().setVisible(False)
+        self.results_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.results_table)
+        
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+        
+        # Buttons
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Close
+        )
+        
+        self.start_button = button_box.button(QDialogButtonBox.StandardButton.Ok)
+        self.start_button.setText("Start")
+        self.close_button = button_box.button(QDialogButtonBox.StandardButton.Close)
+        self.preview_button = button_box.addButton("Preview...", QDialogButtonBox.ButtonRole.ActionRole)
+        self.preview_button.setToolTip("Show the commands that would run and their estimated duration")
+        
+        layout.addWidget(button_box)
+        
+        # Connect button signals
+        self.preview_button.clicked.connect(self.preview_provisioning)
+        button_box.accepted.connect(self.start_provisioning)
+        button_box.rejected.connect(self.reject)
+    
+    def setup_connections(self):
+        """Set up signal connections."""
+        self.auto_number_check.toggled.connect(self.first_pair_spin.setDisabled)
+        self.assign_names_check.toggled.connect(self.first_com_spin.setEnabled)
+    
+    def build_items(self) -> List[BatchInstallItem]:
+        """Build the batch items from the form."""
+        items = []
+        extra_a = self.params_a_edit.text().strip()
+        extra_b = self.params_b_edit.text().strip()
+        
+        for offset in range(self.count_spin.value()):
+            params_a = []
+            params_b = []
+            
+            if self.assign_names_check.isChecked():
+                com_number = self.first_com_spin.value() + offset * 2
+                params_a.append(f"PortName=COM{com_number}")
+                params_b.append(f"PortName=COM{com_number + 1}")
+            
+            if extra_a:
+                params_a.append(extra_a)
+            if extra_b:
+                params_b.append(extra_b)
+            
+            pair_number = None if self.auto_number_check.isChecked() else self.first_pair_spin.value() + offset
+            items.append(BatchInstallItem(
+                pair_number=pair_number,
+                params_a=",".join(params_a) if params_a else "-",
+                params_b=",".join(params_b) if params_b else "-"
+            ))
+        
+        return items
+    
+    def validate_input(self) -> Tuple[bool, str]:
+        """Validate the dialog input."""
+        if not self.auto_number_check.isChecked():
+            last_pair = self.first_pair_spin.value() + self.count_spin.value() - 1
+            valid, error = ParameterValidator.validate_port_number(last_pair)
+            if not valid:
+                return False, f"Pair range ends at {last_pair}: {error}"
+        
+        for port_letter, edit in [("A", self.params_a_edit), ("B", self.params_b_edit)]:
+            params = edit.text().strip()
+            if params:
+                valid, error = ParameterValidator.validate_parameter_string(params)
+                if not valid:
+                    return False, f"Invalid parameters for Port {port_letter}: {error}"
+        
+        return True, ""
+    
+    def preview_provisioning(self):
+        """Validate the form and request a preview of the batch."""
+        valid, error = self.validate_input()
+        if not valid:
+            QMessageBox.warning(self, "Invalid Input", error)
+            return
+        
+        self.preview_requested.emit(self.build_items())
+    
+    def start_provisioning(self):
+        """Validate the form and request the batch install."""
+        valid, error = self.validate_input()
+        if not valid:
+            QMessageBox.warning(self, "Invalid Input", error)
+            return
+        
+        items = self.build_items()
+        
+        self.results_table.setRowCount(len(items))
+        for row, item in enumerate(items):
+            self.results_table.setItem(row, 0, QTableWidgetItem(item.describe()))
+            self.results_table.setItem(row, 1, QTableWidgetItem("Queued"))
+            self.results_table.setItem(row, 2, QTableWidgetItem(""))
+        
+        self.progress_bar.setRange(0, len(items))
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.summary_label.setText(f"Installing {len(items)} port pairs...")
+        self.set_running(True)
+        
+        self.provision_requested.emit(items)
+    
+    def set_running(self, running: bool):
+        """Enable or disable the form while a batch is in progress."""
+        self.running = running
+        self.start_button.setEnabled(not running)
+        self.close_button.setEnabled(not running)
+        self.preview_button.setEnabled(not running)
+    
+    @pyqtSlot(int, int, CommandResult)
+    def on_batch_progress(self, index: int, total: int, result: CommandResult):
+        """Show the result of one batch item."""
+        status = "Installed" if result.success else "Failed"
+        self.results_table.setItem(index, 1, QTableWidgetItem(status))
+        self.results_table.setItem(index, 2, QTableWidgetItem(result.get_error_message()))
+        self.progress_bar.setValue(self.progress_bar.value() + 1)
+    
+    @pyqtSlot(list)
+    def on_batch_finished(self, results: list):
+        """Show the batch summary once the driver update has completed."""
+        failed = sum(1 for result in results if not result.success)
+        self.summary_label.setText(
+            f"Completed: {len(results) - failed} installed, {failed} failed"
+        )
+        self.set_running(False)
+    
+    def reject(self):
+        """Keep the dialog open while a batch is in progress."""
+        if self.running:
+            return
+        super().reject()
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""Dialog for applying one parameter change to many ports."""
+
+from typing import List
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QLineEdit, QLabel, QGroupBox,
+                            QMessageBox, QDialogButtonBox, QListWidget, QAbstractItemView)
+
+from ...core.command_builder import CommandValidationError, validate_parameters
+from ...core.models import Port
+from ...core.validators import ParameterBuilder
+from ...utils.constants import SPECIAL_PARAMETER_VALUES
+
+
+class BulkEditDialog(QDialog):
+    """Dialog that collects one parameter delta for every selected port."""
+    
+    def __init__(self, ports: List[Port], parent=None):
+        super().__init__(parent)
+        self.ports = ports
+        
+        self.setWindowTitle("Bulk Edit Ports")
+        self.setModal(True)
+        self.resize(450, 450)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        """Set up the dialog UI."""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        
+        # Description
+        desc_label = QLabel(f"Apply the same parameter change to {len(self.ports)} ports. Only the listed "
+                            "parameters change; use - to reset a parameter to its default. The port list "
+                            "is refreshed once after all ports have been changed.")
+        desc_label.setWordWrap(True)
+        layout.addWidget(desc_label)
+        
+        # Target ports
+        ports_group = QGroupBox(f"Selected Ports ({len(self.ports)})")
+        ports_layout = QVBoxLayout(ports_group)
+        self.ports_list = QListWidget()
+        self.ports_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        for port in self.ports:
+            name = f" ({port.port_name})" if port.port_name else ""
+            self.ports_list.addItem(f"{port.identifier}{name}")
+        ports_layout.addWidget(self.ports_list)
+        layout.addWidget(ports_group)
+        
+        # Parameter delta
+        params_group = QGroupBox("Parameters")
+        params_layout = QFormLayout(params_group)
+        self.params_edit = QLineEdit()
+        self.params_edit.setPlaceholderText("e.g., EmuBR=yes,AddRTTO=100")
+        params_layout.addRow("Change:", self.params_edit)
+        layout.addWidget(params_group)
+        
+        # Buttons
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        button_box.button(QDialogButtonBox.StandardButton.Ok).setText("Apply to All")
+        layout.addWidget(button_box)
+        
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+    
+    def get_parameters(self) -> str:
+        """Get the parameter string entered by the user."""
+        return self.params_edit.text().strip()
+    
+    def validate_input(self) -> tuple[bool, str]:
+        """Validate the parameter change."""
+        parameters = self.get_parameters()
+        if not parameters:
+            return False, "Enter at least one parameter to change."
+        
+        try:
+            validate_parameters(parameters, "the selected ports")
+        except CommandValidationError as e:
+            return False, str(e)
+        
+        # One fixed port name cannot be given to several ports
+        port_name = ParameterBuilder.parse_parameter_string(parameters).get("PortName")
+        if (port_name is not None and len(self.ports) > 1
+                and port_name not in (SPECIAL_PARAMETER_VALUES["AUTO_COM"], SPECIAL_PARAMETER_VALUES["DEFAULT"])):
+            return False, "PortName can only be set to COM# or - when editing several ports."
+        
+        return True, ""
+    
+    def accept(self):
+        """Validate before closing."""
+        valid, error = self.validate_input()
+        if not valid:
+            QMessageBox.warning(self, "Invalid Parameters", error)
+            return
+        super().accept()
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""Dialog for browsing the command journal."""
+
+import datetime
+import time
+from typing import List
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QComboBox, QLabel,
+                            QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                            QPlainTextEdit, QSplitter, QAbstractItemView)
+from PyQt6.QtCore import Qt, pyqtSlot
+
+from ...core.command_journal import CommandJournal
+from ...core.models import JournalEntry
+from ...utils.constants import SETUPC_COMMANDS, JOURNAL_QUERY_LIMIT
+
+
+class CommandJournalDialog(QDialog):
+    """Dialog listing recorded commands with filters and per-command details."""
+    
+    COLUMNS = ["Finished", "Type", "Command", "Result", "Exit Code", "Duration (s)"]
+    
+    # Time range choices: label -> seconds back from now (None for all)
+    TIME_RANGES = [
+        ("Last hour", 3600),
+        ("Last 24 hours", 24 * 3600),
+        ("Last 7 days", 7 * 24 * 3600),
+        ("All time", None)
+    ]
+    
+    # Result choices: label -> success filter
+    RESULTS = [
+        ("All results", None),
+        ("Succeeded", True),
+        ("Failed", False)
+    ]
+    
+    def __init__(self, journal: CommandJournal, parent=None):
+        super().__init__(parent)
+        self.journal = journal
+        self.entries: List[JournalEntry] = []
+        
+        self.setWindowTitle("Command History")
+        self.setModal(False)
+        self.resize(800, 550)
+        self.setup_ui()
+        self.setup_connections()
+        self.refresh()
+    
+    def setup_ui(self):
+        """Set up the dialog UI."""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        
+        # Filters
+        filter_layout = QHBoxLayout()
+        
+        self.type_combo = QComboBox()
+        self.type_combo.addItem("All commands", None)
+        for command_type in sorted(set(SETUPC_COMMANDS) | set(self.journal.get_command_types())):
+            self.type_combo.addItem(command_type, command_type)
+        
+        self.range_combo = QComboBox()
+        for label, seconds in self.TIME_RANGES:
+            self.range_combo.addItem(label, seconds)
+        self.range_combo.setCurrentIndex(1)
+        
+        self.result_combo = QComboBox()
+        for label, success in self.RESULTS:
+            self.result_combo.addItem(label, success)
+        
+        self.refresh_button = QPushButton("Refresh")
+        
+        filter_layout.addWidget(self.type_combo)
+        filter_layout.addWidget(self.range_combo)
+        filter_layout.addWidget(self.result_combo)
+        filter_layout.addStretch()
+        filter_layout.addWidget(self.refresh_button)
+        layout.addLayout(filter_layout)
+        
+        # Entries and details of the selected entry
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        splitter.addWidget(self.table)
+        
+        self.details_text = QPlainTextEdit()
+        self.details_text.setReadOnly(True)
+        splitter.addWidget(self.details_text)
+        splitter.setSizes([350, 150])
+        layout.addWidget(splitter)
+        
+        # Summary and close button
+        bottom_layout = QHBoxLayout()
+        self.summary_label = QLabel()
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+        bottom_layout.addWidget(self.summary_label)
+        bottom_layout.addStretch()
+        bottom_layout.addWidget(close_button)
+        layout.addLayout(bottom_layout)
+    
+    def setup_connections(self):
+        """Set up signal connections."""
+        self.type_combo.currentIndexChanged.connect(self.refresh)
+        self.range_combo.currentIndexChanged.connect(self.refresh)
+        self.result_combo.currentIndexChanged.connect(self.refresh)
+        self.refresh_button.clicked.connect(self.refresh)
+        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+    
+    @pyqtSlot()
+    def refresh(self):
+        """Query the journal with the current filters and show the entries."""
+        seconds = self.range_combo.currentData()
+        since = time.time() - seconds if seconds is not None else None
+        self.entries = self.journal.query(
+            command_type=self.type_combo.currentData(),
+            since=since,
+            success=self.result_combo.currentData()
+        )
+        
+        self.table.setRowCount(len(self.entries))
+        for row, entry in enumerate(self.entries):
+            if entry.success:
+                result = "Success"
+            elif entry.cancelled:
+                result = "Cancelled"
+            else:
+                result = "Failed"
+            values = [
+                datetime.datetime.fromtimestamp(entry.finished_at).strftime("%Y-%m-%d %H:%M:%S"),
+                entry.command_type,
+                entry.command,
+                result,
+                str(entry.return_code),
+                f"{entry.execution_time:.3f}"
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column in (4, 5):
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+        
+        self.details_text.clear()
+        self.summary_label.setText(self._summarize())
+    
+    def _summarize(self) -> str:
+        """Get a summary of the listed entries."""
+        count = len(self.entries)
+        if not count:
+            return "No commands recorded for these filters."
+        
+        total_time = sum(entry.execution_time for entry in self.entries)
+        failures = sum(1 for entry in self.entries if not entry.success)
+        slowest = max(entry.execution_time for entry in self.entries)
+        summary = (f"{count} command{'s' if count != 1 else ''}, {failures} failed - "
+                   f"total {total_time:.2f}s, average {total_time / count:.2f}s, slowest {slowest:.2f}s")
+        if count >= JOURNAL_QUERY_LIMIT:
+            summary += " (latest commands only)"
+        return summary
+    
+    @pyqtSlot()
+    def _on_selection_changed(self):
+        """Show the output and error of the selected entry."""
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            self.details_text.clear()
+            return
+        
+        entry = self.entries[rows[0].row()]
+        details = [f"{entry.command}", f"Duration: {entry.execution_time:.3f}s, exit code {entry.return_code}"]
+        if entry.output.strip():
+            details.append(f"\nOutput:\n{entry.output.strip()}")
+        if entry.error.strip():
+            details.append(f"\nError:\n{entry.error.strip()}")
+        self.details_text.setPlainText("\n".join(details))
\ No newline at end of file
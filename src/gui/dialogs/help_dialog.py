@@ -10,6 +10,9 @@ from PyQt6.QtCore import Qt
 class HelpDialog(QDialog):
     """Professional help dialog for com0com technical documentation."""
     
+    # Help content, built when the dialog is first opened and shared afterwards
+    _help_content_cache = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("com0com Help")
@@ -19,7 +22,9 @@ class HelpDialog(QDialog):
         
         
         # Help content data
-        self.help_content = self._load_help_content()
+        if HelpDialog._help_content_cache is None:
+            HelpDialog._help_content_cache = self._load_help_content()
+        self.help_content = HelpDialog._help_content_cache
         
         self.setup_ui()
         self.setup_connections()
@@ -0,0 +1,114 @@
+"""Dialog showing per-command latency metrics."""
+
+from typing import Optional
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                            QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView)
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
+
+from ...core.command_metrics import CommandMetrics
+
+
+class MetricsDialog(QDialog):
+    """Live table of command latency percentiles, queue waits and failure rates."""
+    
+    COLUMNS = ["Command", "Count", "Failed", "Timeouts", "Cancelled",
+               "p50 (ms)", "p95 (ms)", "p99 (ms)", "Max (ms)", "Queue p95 (ms)", "Skipped (saved s)"]
+    REFRESH_INTERVAL = 1000  # ms
+    
+    def __init__(self, metrics: CommandMetrics, export_path: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.metrics = metrics
+        self.export_path = export_path
+        
+        self.setWindowTitle("Command Metrics")
+        self.setModal(False)
+        self.resize(800, 350)
+        self.setup_ui()
+        self.setup_connections()
+        self.refresh()
+        self.refresh_timer.start()
+    
+    def setup_ui(self):
+        """Set up the dialog UI."""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+        
+        if self.export_path:
+            export_text = f"Exported for Prometheus to {self.export_path}"
+        else:
+            export_text = "Prometheus export is disabled (set metrics_export_path in config.json)."
+        export_label = QLabel(export_text)
+        export_label.setWordWrap(True)
+        layout.addWidget(export_label)
+        
+        button_layout = QHBoxLayout()
+        self.reset_button = QPushButton("Reset")
+        self.reset_button.setToolTip("Discard the metrics collected so far")
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+        button_layout.addWidget(self.reset_button)
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+        
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL)
+    
+    def setup_connections(self):
+        """Set up signal connections."""
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.reset_button.clicked.connect(self.reset_metrics)
+    
+    @pyqtSlot()
+    def refresh(self):
+        """Show the current metrics."""
+        command_types = sorted(self.metrics.command_types.items())
+        self.table.setRowCount(len(command_types))
+        
+        for row, (command_type, metrics) in enumerate(command_types):
+            quantiles = metrics.duration.quantiles()
+            queue_p95 = metrics.queue_wait.quantiles()[0.95]
+            values = [
+                command_type,
+                str(metrics.count),
+                f"{metrics.failures} ({metrics.failure_rate:.1%})",
+                str(metrics.timeouts),
+                str(metrics.cancellations),
+                self._format_ms(quantiles[0.5]),
+                self._format_ms(quantiles[0.95]),
+                self._format_ms(quantiles[0.99]),
+                self._format_ms(metrics.duration.max),
+                self._format_ms(queue_p95),
+                f"{metrics.suppressed} ({metrics.suppressed_seconds:.1f})"
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+    
+    @pyqtSlot()
+    def reset_metrics(self):
+        """Discard the collected metrics."""
+        self.metrics.reset()
+        self.refresh()
+    
+    def closeEvent(self, event):
+        """Stop refreshing when the dialog closes."""
+        self.refresh_timer.stop()
+        super().closeEvent(event)
+    
+    @staticmethod
+    def _format_ms(seconds: Optional[float]) -> str:
+        """Format seconds as milliseconds, or a dash if there is no value."""
+        if seconds is None:
+            return "-"
+        return f"{seconds * 1000:.1f}"
\ No newline at end of file
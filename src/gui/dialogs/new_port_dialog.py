@@ -1,14 +1,13 @@
 """Dialog for creating new virtual port pairs."""
 
 from typing import Optional, Tuple
-from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
-                            QLineEdit, QSpinBox, QCheckBox, QComboBox, QLabel,
-                            QPushButton, QGroupBox, QMessageBox, QFrame,
-                            QDialogButtonBox, QTabWidget, QWidget)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QSpinBox, QCheckBox, QLabel, QGroupBox,
+                            QMessageBox, QFrame, QDialogButtonBox, QTabWidget, QWidget, QScrollArea)
+from PyQt6.QtCore import pyqtSignal
 
+from ...core.change_planner import format_parameters
 from ...core.validators import ParameterValidator
-from ...utils.constants import BOOLEAN_VALUES, PIN_ASSIGNMENT_VALUES
+from ..components.parameter_form import ParameterForm
 
 
 class NewPortDialog(QDialog):
@@ -91,64 +90,13 @@ class NewPortDialog(QDialog):
         layout = QVBoxLayout(tab)
         layout.setSpacing(10)
         
-        # Store widgets in tab for later access
-        tab.widgets = {}
-        
-        # Basic settings
-        basic_group = QGroupBox("Basic Settings")
-        basic_layout = QFormLayout(basic_group)
-        
-        # Port name
-        port_name_edit = QLineEdit()
-        port_name_edit.setPlaceholderText("e.g., COM8 or COM# for auto-assign")
-        tab.widgets["PortName"] = port_name_edit
-        basic_layout.addRow("Port Name:", port_name_edit)
-        
-        layout.addWidget(basic_group)
-        
-        # Emulation settings
-        emulation_group = QGroupBox("Emulation Settings")
-        emulation_layout = QFormLayout(emulation_group)
-        
-        # Baud rate emulation
-        emubr_combo = QComboBox()
-        emubr_combo.addItems(BOOLEAN_VALUES)
-        emubr_combo.setCurrentText("no")
-        tab.widgets["EmuBR"] = emubr_combo
-        emulation_layout.addRow("Baud Rate Emulation:", emubr_combo)
-        
-        # Buffer overrun
-        overrun_combo = QComboBox()
-        overrun_combo.addItems(BOOLEAN_VALUES)
-        overrun_combo.setCurrentText("no")
-        tab.widgets["EmuOverrun"] = overrun_combo
-        emulation_layout.addRow("Buffer Overrun:", overrun_combo)
-        
-        layout.addWidget(emulation_group)
-        
-        # Mode settings
-        mode_group = QGroupBox("Mode Settings")
-        mode_layout = QFormLayout(mode_group)
-        
-        # Plug-in mode
-        plugin_check = QCheckBox()
-        tab.widgets["PlugInMode"] = plugin_check
-        mode_layout.addRow("Plug-in Mode:", plugin_check)
-        
-        # Exclusive mode
-        exclusive_check = QCheckBox()
-        tab.widgets["ExclusiveMode"] = exclusive_check
-        mode_layout.addRow("Exclusive Mode:", exclusive_check)
-        
-        # Hidden mode
-        hidden_check = QCheckBox()
-        tab.widgets["HiddenMode"] = hidden_check
-        mode_layout.addRow("Hidden Mode:", hidden_check)
-        
-        layout.addWidget(mode_group)
-        
-        # Add stretch to push content to top
-        layout.addStretch()
+        # Parameter form in a scroll area, kept on the tab for later access
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameShape(QFrame.Shape.NoFrame)
+        tab.parameter_form = ParameterForm()
+        scroll_area.setWidget(tab.parameter_form)
+        layout.addWidget(scroll_area)
         
         return tab
     
@@ -161,27 +109,8 @@ class NewPortDialog(QDialog):
         self.pair_number_spin.setEnabled(not checked)
     
     def get_port_parameters(self, tab: QWidget) -> str:
-        """Extract parameters from a port configuration tab."""
-        parameters = []
-        
-        for param_name, widget in tab.widgets.items():
-            value = None
-            
-            if isinstance(widget, QLineEdit):
-                text = widget.text().strip()
-                if text:
-                    value = text
-            elif isinstance(widget, QComboBox):
-                if widget.currentText() != "no":  # Only include non-default values
-                    value = widget.currentText()
-            elif isinstance(widget, QCheckBox):
-                if widget.isChecked():
-                    value = "yes"
-            
-            if value:
-                parameters.append(f"{param_name}={value}")
-        
-        return ",".join(parameters) if parameters else "-"
+        """Extract the parameters that differ from the driver defaults from a port configuration tab."""
+        return format_parameters(tab.parameter_form.get_changed_values())
     
     def validate_input(self) -> Tuple[bool, str]:
         """Validate the dialog input."""
@@ -194,11 +123,9 @@ class NewPortDialog(QDialog):
         
         # Validate port parameters
         for port_letter, tab in [("A", self.port_a_tab), ("B", self.port_b_tab)]:
-            params = self.get_port_parameters(tab)
-            if params != "-":
-                valid, error = ParameterValidator.validate_parameter_string(params)
-                if not valid:
-                    return False, f"Invalid parameters for Port {port_letter}: {error}"
+            valid, error = tab.parameter_form.registry.validate_parameters(tab.parameter_form.get_values())
+            if not valid:
+                return False, f"Invalid parameters for Port {port_letter}: {error}"
         
         return True, ""
     
@@ -226,10 +153,4 @@ class NewPortDialog(QDialog):
         self.pair_number_spin.setValue(0)
         
         for tab in [self.port_a_tab, self.port_b_tab]:
-            for widget in tab.widgets.values():
-                if isinstance(widget, QLineEdit):
-                    widget.clear()
-                elif isinstance(widget, QComboBox):
-                    widget.setCurrentText("no")
-                elif isinstance(widget, QCheckBox):
-                    widget.setChecked(False)
\ No newline at end of file
+            tab.parameter_form.reset()
\ No newline at end of file
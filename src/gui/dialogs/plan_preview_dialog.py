@@ -0,0 +1,88 @@
+"""Dialog previewing planned setupc commands and their estimated duration."""
+
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QDialogButtonBox, QTableWidget,
+                            QTableWidgetItem, QHeaderView, QAbstractItemView)
+from PyQt6.QtCore import Qt
+
+from ...core.change_planner import format_duration
+from ...core.models import PlanEstimate
+
+
+class PlanPreviewDialog(QDialog):
+    """Read-only list of the commands a change would run, with per-command estimates.
+    
+    With runnable set, accepting the dialog means the plan should run.
+    """
+    
+    COLUMNS = ["#", "Command", "Description", "Estimate", "Based On"]
+    
+    def __init__(self, estimate: PlanEstimate, title: str = "Preview Changes", runnable: bool = True, parent=None):
+        super().__init__(parent)
+        self.estimate = estimate
+        self.runnable = runnable
+        
+        self.setWindowTitle(title)
+        self.setModal(True)
+        self.resize(850, 500)
+        self.setup_ui()
+        self.populate()
+    
+    def setup_ui(self):
+        """Set up the dialog UI."""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        
+        self.summary_label = QLabel()
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label)
+        
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        header = self.table.horizontalHeader()
+        for column in (0, 3, 4):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+        
+        if self.runnable:
+            button_box = QDialogButtonBox(
+                QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+            )
+            run_button = button_box.button(QDialogButtonBox.StandardButton.Ok)
+            run_button.setText("Run")
+            run_button.setEnabled(bool(self.estimate.estimates))
+        else:
+            button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+    
+    def populate(self):
+        """Fill the table and the summary."""
+        estimates = self.estimate.estimates
+        self.table.setRowCount(len(estimates))
+        
+        for row, estimate in enumerate(estimates):
+            seconds = "-" if estimate.seconds is None else format_duration(estimate.seconds)
+            values = [str(row + 1), estimate.planned.command, estimate.planned.description, seconds, estimate.source]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column in (0, 3):
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+        
+        if not estimates:
+            self.summary_label.setText("The ports already match; nothing needs to run.")
+            return
+        
+        summary = (f"{len(estimates)} commands, estimated duration "
+                   f"{format_duration(self.estimate.total_seconds())}.")
+        unknown = self.estimate.unknown_count()
+        if unknown:
+            summary += (f" {unknown} commands have no recorded duration yet and are not included, "
+                        "so the actual time will be longer.")
+        self.summary_label.setText(summary)
\ No newline at end of file
@@ -9,19 +9,19 @@ from PyQt6.QtCore import Qt, QTimer, pyqtSlot
 from PyQt6.QtGui import QAction, QIcon, QKeySequence, QKeyEvent
 
 from ..core.command_manager import CommandManager
-from ..core.models import PortPair, Port, CommandResult, DriverInfo, DriverStatus
+from ..core.change_planner import DurationEstimator, plan_change_set, estimate_plan
+from ..core.command_builder import CommandValidationError
+from ..core.command_journal import CommandJournal
+from ..core.models import PortPair, Port, CommandResult, DriverInfo, DriverStatus, ChangeSet
+from ..core.topology import Topology, TopologyError, plan_topology
 from ..core.config_manager import ConfigManager
 from ..utils.constants import (WINDOW_TITLE, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT,
-                              WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT)
+                              WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT,
+                              EXECUTION_MODE_ONESHOT, EXECUTION_MODE_SESSION)
 from .components.ribbon_toolbar import RibbonToolbar
 from .components.port_tree_widget import PortTreeWidget
 from .components.properties_panel import PropertiesPanel
 from .components.command_output import CommandOutputPanel
-from .dialogs.new_port_dialog import NewPortDialog
-from .dialogs.configure_dialog import ConfigurePortDialog
-from .dialogs.driver_ops_dialog import DriverOperationsDialog
-from .dialogs.help_dialog import HelpDialog
-from .dialogs.about_dialog import AboutDialog
 
 
 class MainWindow(QMainWindow):
@@ -43,11 +43,27 @@ class MainWindow(QMainWindow):
         
         # Configure command manager from settings
         self.command_manager.set_timeout(self.config_manager.get_command_timeout())
+        self.command_manager.set_execution_mode(self.config_manager.get_execution_mode())
+        self.command_manager.set_refresh_coalesce_window(self.config_manager.get_refresh_coalesce_window())
+        self.command_manager.set_cancel_grace_periods(*self.config_manager.get_cancel_grace_periods())
         
-        # Initialize application
-        # Serialize startup commands to avoid concurrent execution
-        self.command_manager.port_list_updated.connect(self._on_initial_port_list_loaded, Qt.ConnectionType.SingleShotConnection)
-        self.refresh_port_list()
+        # Record every command result in the persistent journal
+        self.command_journal = CommandJournal(self.config_manager.get_command_journal_path())
+        self.command_manager.set_journal(self.command_journal)
+        self.command_manager.set_metrics_export(*self.config_manager.get_metrics_export())
+        
+        # Bound the output console and keep its full history on disk
+        self.command_output.set_max_blocks(self.config_manager.get_console_max_blocks())
+        self.command_output.set_log_path(self.config_manager.get_console_log_path())
+        
+        # Show the last known ports immediately, then reconcile with live data
+        self.command_manager.set_snapshot_path(self.config_manager.get_port_snapshot_path())
+        self.show_port_snapshot()
+        
+        # Initialize application: one list provides both the ports and the driver status
+        self.set_busy(True)
+        self.status_label.setText("Loading port list...")
+        self.command_manager.probe_startup()
     
     def setup_ui(self):
         """Set up the main window UI."""
@@ -121,19 +137,27 @@ class MainWindow(QMainWindow):
         # Port tree signals
         self.port_tree.port_pair_selected.connect(self.on_port_pair_selected)
         self.port_tree.port_selected.connect(self.on_port_selected)
+        self.port_tree.ports_selected.connect(self.on_ports_selected)
         self.port_tree.port_pair_double_clicked.connect(self.on_port_pair_double_clicked)
         self.port_tree.context_menu_requested.connect(self.show_context_menu)
         
         # Properties panel signals
         self.properties_panel.apply_changes.connect(self.apply_port_changes)
+        self.properties_panel.bulk_edit_requested.connect(self.show_bulk_edit_dialog)
         
         # Command manager signals
         self.command_manager.port_list_updated.connect(self.on_port_list_updated)
         self.command_manager.command_completed.connect(self.on_command_completed)
         self.command_manager.driver_status_changed.connect(self.on_driver_status_changed)
         self.command_manager.error_occurred.connect(self.show_error_message)
+        self.command_manager.queue_depth_changed.connect(self.on_queue_depth_changed)
+        self.command_manager.refreshes_saved.connect(self.on_refreshes_saved)
+        self.command_manager.port_list_warnings.connect(self.on_port_list_warnings)
+        self.command_manager.command_suppressed.connect(self.on_command_suppressed)
         
         # Command output panel signals
+        self.command_manager.command_started.connect(self.command_output.on_command_started)
+        self.command_manager.output_line.connect(self.command_output.append_output_line)
         self.command_manager.command_completed.connect(self.command_output.on_command_completed)
     
     def setup_menu_bar(self):
@@ -174,6 +198,10 @@ class MainWindow(QMainWindow):
         new_pair_action.triggered.connect(self.show_new_port_dialog)
         action_menu.addAction(new_pair_action)
         
+        batch_provision_action = QAction("Batch Provision...", self)
+        batch_provision_action.triggered.connect(self.show_batch_provision_dialog)
+        action_menu.addAction(batch_provision_action)
+        
         remove_action = QAction("Remove Selected", self)
         remove_action.setShortcut(QKeySequence.StandardKey.Delete)
         remove_action.triggered.connect(self.remove_selected_port_pair)
@@ -183,6 +211,16 @@ class MainWindow(QMainWindow):
         configure_action.triggered.connect(self.configure_selected_port)
         action_menu.addAction(configure_action)
         
+        bulk_edit_action = QAction("Bulk Edit Selected Ports...", self)
+        bulk_edit_action.triggered.connect(self.show_bulk_edit_dialog)
+        action_menu.addAction(bulk_edit_action)
+        
+        action_menu.addSeparator()
+        
+        cancel_action = QAction("Cancel Commands", self)
+        cancel_action.triggered.connect(self.cancel_commands)
+        action_menu.addAction(cancel_action)
+        
         # Tools menu
         tools_menu = menubar.addMenu("Tools")
         
@@ -204,6 +242,26 @@ class MainWindow(QMainWindow):
         check_busy_action.triggered.connect(self.show_check_busy_names_dialog)
         tools_menu.addAction(check_busy_action)
         
+        command_history_action = QAction("Command History...", self)
+        command_history_action.triggered.connect(self.show_command_journal_dialog)
+        tools_menu.addAction(command_history_action)
+        
+        command_metrics_action = QAction("Command Metrics...", self)
+        command_metrics_action.triggered.connect(self.show_metrics_dialog)
+        tools_menu.addAction(command_metrics_action)
+        
+        apply_topology_action = QAction("Apply Topology File...", self)
+        apply_topology_action.triggered.connect(self.show_apply_topology_dialog)
+        tools_menu.addAction(apply_topology_action)
+        
+        tools_menu.addSeparator()
+        
+        session_mode_action = QAction("Use Persistent setupc Session", self)
+        session_mode_action.setCheckable(True)
+        session_mode_action.setChecked(self.config_manager.get_execution_mode() == EXECUTION_MODE_SESSION)
+        session_mode_action.toggled.connect(self.set_session_mode)
+        tools_menu.addAction(session_mode_action)
+        
         # Help menu
         help_menu = menubar.addMenu("Help")
         
@@ -239,10 +297,21 @@ class MainWindow(QMainWindow):
         self.progress_bar.setMaximumWidth(200)
         self.status_bar.addPermanentWidget(self.progress_bar)
         
+        # Queued commands label (hidden while the queue is empty)
+        self.queue_label = QLabel()
+        self.queue_label.setVisible(False)
+        self.status_bar.addPermanentWidget(self.queue_label)
+        
         # Driver status label
         self.driver_status_label = QLabel("Driver: Unknown")
         self.status_bar.addPermanentWidget(self.driver_status_label)
     
+    def show_port_snapshot(self):
+        """Show the saved port snapshot in the stale style, if there is one."""
+        snapshot = self.command_manager.load_port_snapshot()
+        if snapshot is not None:
+            self.port_tree.update_port_pairs(snapshot.port_pairs, stale_since=snapshot.timestamp)
+    
     # Slot implementations
     @pyqtSlot()
     def refresh_port_list(self):
@@ -254,10 +323,26 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def show_new_port_dialog(self):
         """Show dialog for creating new port pair."""
+        from .dialogs.new_port_dialog import NewPortDialog
         dialog = NewPortDialog(self)
         dialog.create_port_pair.connect(self.create_port_pair)
         dialog.exec()
     
+    @pyqtSlot()
+    def show_batch_provision_dialog(self):
+        """Show dialog for installing many port pairs at once."""
+        from .dialogs.batch_provision_dialog import BatchProvisionDialog
+        dialog = BatchProvisionDialog(self)
+        dialog.provision_requested.connect(self.command_manager.install_port_pairs)
+        dialog.preview_requested.connect(lambda items: self.preview_change_set(ChangeSet(installs=items), dialog))
+        self.command_manager.batch_progress.connect(dialog.on_batch_progress)
+        self.command_manager.batch_finished.connect(dialog.on_batch_finished)
+        
+        dialog.exec()
+        
+        self.command_manager.batch_progress.disconnect(dialog.on_batch_progress)
+        self.command_manager.batch_finished.disconnect(dialog.on_batch_finished)
+    
     @pyqtSlot()
     def remove_selected_port_pair(self):
         """Remove the currently selected port pair."""
@@ -282,9 +367,14 @@ class MainWindow(QMainWindow):
     
     @pyqtSlot()
     def configure_selected_port(self):
-        """Configure the currently selected port."""
+        """Configure the currently selected port, or bulk edit several."""
+        if self.current_selection is not None and self.current_selection[0] == "ports":
+            self.show_bulk_edit_dialog()
+            return
+        
         selected_port = self.port_tree.get_selected_port()
         if selected_port:
+            from .dialogs.configure_dialog import ConfigurePortDialog
             dialog = ConfigurePortDialog(selected_port, self)
             dialog.apply_configuration.connect(self.apply_port_configuration)
             dialog.exec()
@@ -305,15 +395,34 @@ class MainWindow(QMainWindow):
         self.ribbon_toolbar.update_selection("port", port)
         self.properties_panel.show_port_properties(port)
     
+    @pyqtSlot(list)
+    def on_ports_selected(self, ports: list):
+        """Handle selection of several ports and pairs."""
+        self.current_selection = ("ports", ports)
+        self.ribbon_toolbar.update_selection("ports", ports)
+        self.properties_panel.show_multiple_ports(ports)
+    
+    @pyqtSlot()
+    def show_bulk_edit_dialog(self):
+        """Apply one parameter change to every selected port."""
+        ports = self.port_tree.get_selected_ports()
+        if not ports:
+            self.show_error_message("No ports selected for editing.")
+            return
+        
+        from .dialogs.bulk_edit_dialog import BulkEditDialog
+        dialog = BulkEditDialog(ports, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self.status_label.setText(f"Applying changes to {len(ports)} ports...")
+            self.command_manager.change_ports_config([port.identifier for port in ports], dialog.get_parameters())
+    
     @pyqtSlot(PortPair)
     def on_port_pair_double_clicked(self, pair: PortPair):
         """Handle port pair double click."""
         from .dialogs.configure_dialog import ConfigurePortDialog
         dialog = ConfigurePortDialog(pair.port_a, self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            # Apply configuration changes to port A
-            parameters = dialog.get_parameters()
-            self.apply_port_changes(pair.port_a.identifier, parameters)
+        dialog.apply_configuration.connect(self.apply_port_configuration)
+        dialog.exec()
     
     @pyqtSlot(str, object)
     @pyqtSlot(object, object)
@@ -324,6 +433,13 @@ class MainWindow(QMainWindow):
         
         menu = QMenu(self)
         
+        if self.current_selection is not None and self.current_selection[0] == "ports":
+            # Several rows selected
+            bulk_edit_action = QAction("Bulk Edit Selected Ports...", self)
+            bulk_edit_action.triggered.connect(self.show_bulk_edit_dialog)
+            menu.addAction(bulk_edit_action)
+            menu.addSeparator()
+        
         if item_type == "pair":
             # Port pair context menu
             configure_action = QAction("Configure", self)
@@ -410,6 +526,7 @@ class MainWindow(QMainWindow):
     
     def show_driver_operations_dialog(self):
         """Show driver operations dialog."""
+        from .dialogs.driver_ops_dialog import DriverOperationsDialog
         dialog = DriverOperationsDialog(self)
         
         # Connect dialog signals to command manager
@@ -423,17 +540,15 @@ class MainWindow(QMainWindow):
         self.command_manager.command_completed.connect(dialog.on_operation_completed)
         self.command_manager.driver_status_changed.connect(dialog.update_driver_status)
         
-        # Get initial status only if no command is running
-        if not self.command_manager.is_busy():
-            self.command_manager.get_driver_status()
+        # Get initial status (queued behind any running command)
+        self.command_manager.get_driver_status()
         
         dialog.exec()
     
     @pyqtSlot()
     def _handle_driver_dialog_refresh(self):
-        """Handle driver dialog refresh request with busy check."""
-        if not self.command_manager.is_busy():
-            self.command_manager.get_driver_status()
+        """Handle driver dialog refresh request."""
+        self.command_manager.get_driver_status()
     
     def apply_saved_geometry(self):
         """Apply saved window geometry."""
@@ -463,21 +578,46 @@ class MainWindow(QMainWindow):
         self.status_label.setText(f"Ready - {count} port pair{'s' if count != 1 else ''}")
         self.set_busy(False)
     
-    @pyqtSlot(list)
-    def _on_initial_port_list_loaded(self, port_pairs: list):
-        """Handle initial port list load during startup - triggers driver status check."""
-        # Now that port list is loaded, check driver status
-        self.command_manager.get_driver_status()
-    
     @pyqtSlot(CommandResult)
     def on_command_completed(self, result: CommandResult):
         """Handle command completion."""
         if result.success:
             self.status_label.setText("Command completed successfully")
+        elif result.cancelled:
+            self.status_label.setText("Command cancelled")
         else:
             self.status_label.setText("Command failed")
         self.set_busy(False)
     
+    @pyqtSlot(int)
+    def on_queue_depth_changed(self, depth: int):
+        """Show how many commands are waiting to run."""
+        self.queue_label.setText(f"Queued: {depth}")
+        self.queue_label.setVisible(depth > 0)
+    
+    @pyqtSlot(int)
+    def on_refreshes_saved(self, count: int):
+        """Report port list refreshes merged into a single list command."""
+        self.command_output.log_message(
+            f"Merged {count + 1} port list refresh requests into one ({count} saved)"
+        )
+    
+    @pyqtSlot(str, float)
+    def on_command_suppressed(self, command: str, saved_seconds: float):
+        """Report a change command skipped because the port already matches."""
+        self.command_output.log_message(
+            f"Skipped {command}: no parameter would change (about {saved_seconds:.1f} s saved)"
+        )
+        # Within a batch, completion of the remaining commands reports the outcome
+        if not self.command_manager.is_busy():
+            self.status_label.setText("No changes to apply")
+            self.set_busy(False)
+    
+    def on_port_list_warnings(self, warnings: list):
+        """Report port list lines that could not be parsed."""
+        for warning in warnings:
+            self.command_output.log_message(f"Skipped port list entry - {warning}", "WARNING")
+    
     @pyqtSlot(DriverInfo)
     def on_driver_status_changed(self, driver_info: DriverInfo):
         """Handle driver status change."""
@@ -485,6 +625,8 @@ class MainWindow(QMainWindow):
             status_text = "Driver: Installed"
         else:
             status_text = "Driver: Not Installed"
+            # The list behind this status failed, so a shown snapshot stays unconfirmed
+            self.port_tree.mark_refresh_failed()
         self.driver_status_label.setText(status_text)
     
     @pyqtSlot(str)
@@ -500,10 +642,12 @@ class MainWindow(QMainWindow):
     
     def show_help_dialog(self):
         """Show help dialog with technical documentation."""
+        from .dialogs.help_dialog import HelpDialog
         HelpDialog.show_help(self)
     
     def show_about_dialog(self):
         """Show about dialog."""
+        from .dialogs.about_dialog import AboutDialog
         AboutDialog.show_about(self)
     
     def copy_to_clipboard(self, text: str):
@@ -515,10 +659,77 @@ class MainWindow(QMainWindow):
     
     def show_configure_port_dialog(self, port):
         """Show port configuration dialog."""
+        from .dialogs.configure_dialog import ConfigurePortDialog
         dialog = ConfigurePortDialog(port, self)
         dialog.apply_configuration.connect(self.apply_port_configuration)
         dialog.exec()
     
+    def show_command_journal_dialog(self):
+        """Show the history of executed commands."""
+        from .dialogs.command_journal_dialog import CommandJournalDialog
+        dialog = CommandJournalDialog(self.command_journal, self)
+        dialog.show()
+    
+    def show_metrics_dialog(self):
+        """Show per-command latency metrics."""
+        from .dialogs.metrics_dialog import MetricsDialog
+        export_path, _ = self.config_manager.get_metrics_export()
+        dialog = MetricsDialog(self.command_manager.metrics, export_path, self)
+        dialog.show()
+    
+    def get_duration_estimator(self) -> DurationEstimator:
+        """Get an estimator based on this session's metrics and the command history."""
+        return DurationEstimator(self.command_manager.metrics, self.command_journal)
+    
+    def preview_change_set(self, change_set: ChangeSet, parent=None):
+        """Show the commands a change set would run, without running them."""
+        from .dialogs.plan_preview_dialog import PlanPreviewDialog
+        try:
+            plan = plan_change_set(change_set)
+        except CommandValidationError as e:
+            self.show_error_message(str(e))
+            return
+        estimate = estimate_plan(plan, self.get_duration_estimator())
+        PlanPreviewDialog(estimate, "Preview Changes", runnable=False, parent=parent or self).exec()
+    
+    @pyqtSlot()
+    def show_apply_topology_dialog(self):
+        """Plan a topology file against a freshly listed port list, preview it and run it."""
+        from PyQt6.QtWidgets import QFileDialog
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Apply Topology File", "", "Topology Files (*.json *.yaml *.yml);;All Files (*)"
+        )
+        if not path:
+            return
+        
+        try:
+            topology = Topology.load(path)
+        except TopologyError as e:
+            self.show_error_message(str(e))
+            return
+        
+        # Plan only once the live port list has arrived; the cache may be stale or empty
+        self.set_busy(True)
+        self.status_label.setText("Reading current ports...")
+        list_future = self.command_manager.list_ports()
+        list_future.add_done_callback(
+            lambda future: QTimer.singleShot(0, lambda: self.preview_topology_plan(path, topology, future.result()))
+        )
+    
+    def preview_topology_plan(self, path: str, topology: Topology, list_result: CommandResult):
+        """Plan a topology against the port list just read, preview it and run it."""
+        from .dialogs.plan_preview_dialog import PlanPreviewDialog
+        if not list_result.success:
+            # The failed or cancelled list has already been reported
+            return
+        
+        plan = plan_topology(self.command_manager.get_cached_port_pairs(), topology)
+        estimate = estimate_plan(plan, self.get_duration_estimator())
+        dialog = PlanPreviewDialog(estimate, f"Apply Topology - {os.path.basename(path)}", parent=self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self.status_label.setText(f"Applying {len(plan.operations)} topology changes...")
+            self.command_manager.run_plan(plan)
+    
     def show_check_busy_names_dialog(self):
         """Show dialog to check busy names with a pattern."""
         from PyQt6.QtWidgets import QInputDialog
@@ -531,6 +742,13 @@ class MainWindow(QMainWindow):
         if ok and pattern.strip():
             self.command_manager.check_busy_names(pattern.strip())
     
+    @pyqtSlot(bool)
+    def set_session_mode(self, enabled: bool):
+        """Switch between a persistent setupc session and one process per command."""
+        mode = EXECUTION_MODE_SESSION if enabled else EXECUTION_MODE_ONESHOT
+        self.config_manager.set_execution_mode(mode)
+        self.command_manager.set_execution_mode(mode)
+    
     # Driver operations
     @pyqtSlot()
     def preinstall_driver(self):
@@ -601,6 +819,15 @@ class MainWindow(QMainWindow):
         self.status_label.setText("Disabling all ports...")
         self.command_manager.disable_all_ports()
     
+    def cancel_commands(self):
+        """Cancel the running command and drop queued commands."""
+        count = self.command_manager.cancel_all_commands()
+        if count:
+            self.status_label.setText("Cancelling commands...")
+            self.command_output.log_message(f"Cancelling {count} command{'s' if count != 1 else ''}", "WARNING")
+        else:
+            self.status_label.setText("No commands to cancel")
+    
     def set_busy(self, busy: bool):
         """Set the application busy state."""
         # Update UI elements
@@ -627,8 +854,9 @@ class MainWindow(QMainWindow):
         # Save window geometry
         self.save_window_geometry()
         
-        # Cancel any running commands
-        if self.command_manager.is_busy():
-            self.command_manager.cancel_current_command()
+        # Cancel running and queued commands and stop the persistent setupc session
+        self.command_manager.shutdown()
+        self.command_journal.close()
+        self.command_output.close_log()
         
         event.accept()
\ No newline at end of file
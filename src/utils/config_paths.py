@@ -0,0 +1,33 @@
+"""Locations of the configuration file, application state and bundled resources."""
+
+import os
+import sys
+from pathlib import Path
+
+from .constants import APP_NAME
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def get_config_file_path() -> Path:
+    """Get the path to the configuration file, creating its directory."""
+    # Use AppData on Windows, ~/.config on Unix
+    if os.name == 'nt':  # Windows
+        config_dir = Path(os.environ.get('APPDATA', Path.home() / 'AppData/Roaming'))
+    else:  # Unix-like
+        config_dir = Path.home() / '.config'
+    
+    app_config_dir = config_dir / APP_NAME.replace(' ', '_').lower()
+    app_config_dir.mkdir(parents=True, exist_ok=True)
+    
+    return app_config_dir / 'config.json'
+
+
+def get_resource_path(*parts: str) -> str:
+    """Get the path of a bundled resource such as assets/icons/app_icon.svg.
+    
+    Resources are read from the project root when running from source and
+    from the PyInstaller bundle directory when frozen.
+    """
+    base_dir = getattr(sys, "_MEIPASS", None) or PROJECT_ROOT
+    return os.path.join(base_dir, *parts)
\ No newline at end of file
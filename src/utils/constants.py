@@ -7,6 +7,21 @@ APP_VERSION = "1.0.0"
 DEFAULT_SETUPC_PATH = r"C:\Program Files (x86)\com0com\setupc.exe"
 DEFAULT_COMMAND_TIMEOUT = 30
 
+# Command execution modes
+EXECUTION_MODE_ONESHOT = "oneshot"  # One setupc.exe process per command
+EXECUTION_MODE_SESSION = "session"  # One long-lived interactive setupc.exe process
+EXECUTION_MODES = [EXECUTION_MODE_ONESHOT, EXECUTION_MODE_SESSION]
+DEFAULT_EXECUTION_MODE = EXECUTION_MODE_ONESHOT
+
+# Interactive setupc.exe session framing
+SETUPC_SESSION_PROMPT = "command>"  # Printed by setupc.exe when ready for the next command
+SETUPC_SESSION_STARTUP_TIMEOUT = 10
+SETUPC_SESSION_CLOSE_TIMEOUT = 2
+
+# Seconds to wait after each cancellation step (interrupt, terminate) before escalating
+DEFAULT_CANCEL_GRACE_PERIOD = 2.0
+DEFAULT_CANCEL_TERMINATE_GRACE_PERIOD = 2.0
+
 # Default com0com installation paths (Windows)
 DEFAULT_COM0COM_PATHS = [
     r"C:\Program Files\com0com\setupc.exe",
@@ -25,6 +40,56 @@ WINDOW_DEFAULT_HEIGHT = 700
 
 PORT_TREE_REFRESH_INTERVAL = 5000
 
+# Startup profiling: set to a file path (or "-" for stdout) to record startup timings
+STARTUP_PROFILE_ENV = "VPM_STARTUP_PROFILE"
+# When set as well, the application quits right after the first paint
+STARTUP_PROFILE_EXIT_ENV = "VPM_STARTUP_PROFILE_EXIT"
+
+# Headless command line (main.py --cli) exit codes
+CLI_EXIT_SUCCESS = 0
+CLI_EXIT_FAILURE = 1  # setupc.exe reported a failure
+CLI_EXIT_INVALID = 2  # Invalid arguments or parameters; nothing was run
+CLI_EXIT_SETUPC_NOT_FOUND = 3
+CLI_EXIT_TIMEOUT = 4
+
+# Command output console: lines kept in the panel; the full history is kept in a
+# rotating log under the config directory and can be searched from the panel
+DEFAULT_CONSOLE_MAX_BLOCKS = 5000
+CONSOLE_LOG_DIRNAME = "logs"
+CONSOLE_LOG_FILENAME = "console.log"
+CONSOLE_LOG_MAX_BYTES = 1024 * 1024
+CONSOLE_LOG_BACKUP_COUNT = 5
+CONSOLE_SEARCH_MAX_RESULTS = 1000
+
+# Command journal: SQLite history of every command result in the config directory
+COMMAND_JOURNAL_FILENAME = "command_journal.sqlite3"
+JOURNAL_BATCH_SIZE = 100  # Results written per transaction at most
+JOURNAL_FLUSH_INTERVAL = 0.5  # Seconds to wait for more results before committing
+JOURNAL_MAX_ENTRIES = 100000  # Older entries are pruned when the journal opens
+JOURNAL_MAX_TEXT_LENGTH = 65536  # Output and error are truncated to this many characters
+JOURNAL_QUERY_LIMIT = 1000
+
+# Command latency metrics
+METRICS_SAMPLE_SIZE = 1000  # Recent samples per command type used for p50/p95/p99
+METRICS_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)  # Seconds
+METRICS_PREFIX = "virtual_port_manager"
+DEFAULT_METRICS_EXPORT_INTERVAL = 60  # Seconds between Prometheus text file exports
+
+# Change plan duration estimates: median of this session's metrics, else of the journal
+ESTIMATE_SOURCE_SESSION = "session"
+ESTIMATE_SOURCE_JOURNAL = "history"
+ESTIMATE_SOURCE_NONE = "no data"
+ESTIMATE_JOURNAL_SAMPLE_SIZE = 50  # Most recent successful journal entries per command type
+
+# Last known port list, saved next to config.json for display at startup
+PORT_SNAPSHOT_FILENAME = "port_snapshot.json"
+
+# Seconds a list result may be reused for driver status, if no write ran since
+DRIVER_STATUS_MAX_AGE = 5.0
+
+# Window (ms) in which post-command port list refreshes are merged into one
+DEFAULT_REFRESH_COALESCE_WINDOW = 150
+
 SETUPC_COMMANDS = {
     "INSTALL_NUMBERED": "install {} {} {}",
     "INSTALL_AUTO": "install {} {}",
@@ -43,24 +108,74 @@ SETUPC_COMMANDS = {
     "INFCLEAN": "infclean",
     "LISTFNAMES": "listfnames",
     "BUSYNAMES": "busynames {}",
-    "UPDATEFNAMES": "updatefnames"
+    "UPDATEFNAMES": "updatefnames",
+    # Interactive mode
+    "QUIT": "quit"
 }
 
-PORT_PARAMETERS = {
-    "BASIC": ["PortName", "RealPortName"],
-    "EMULATION": ["EmuBR", "EmuOverrun", "EmuNoise"],
-    "TIMING": ["AddRTTO", "AddRITO"],
-    "MODES": ["PlugInMode", "ExclusiveMode", "HiddenMode", "AllDataBits"],
-    "PIN_WIRING": ["cts", "dsr", "dcd", "ri"]
+# setupc.exe global options (placed before the command)
+SETUPC_OPTIONS = {
+    "NO_UPDATE": "--no-update",
+    "NO_UPDATE_FNAMES": "--no-update-fnames",
+    "DETAIL_PRMS": "--detail-prms",
+    "SILENT": "--silent",
+    "SHOW_FNAMES": "--show-fnames"
 }
 
-PIN_ASSIGNMENT_VALUES = [
-    "rrts", "lrts", "rdtr", "ldtr",
-    "rout1", "lout1", "rout2", "lout2",
-    "ropen", "lopen", "on"
-]
+# Access class of each SETUPC_COMMANDS entry. Reads only query driver state and
+# may run concurrently; writes change it and run alone. Unlisted keys are writes.
+COMMAND_ACCESS_READ = "read"
+COMMAND_ACCESS_WRITE = "write"
+SETUPC_COMMAND_ACCESS = {
+    "INSTALL_NUMBERED": COMMAND_ACCESS_WRITE,
+    "INSTALL_AUTO": COMMAND_ACCESS_WRITE,
+    "INSTALL_UPDATE": COMMAND_ACCESS_WRITE,
+    "REMOVE": COMMAND_ACCESS_WRITE,
+    "CHANGE": COMMAND_ACCESS_WRITE,
+    "LIST": COMMAND_ACCESS_READ,
+    "PREINSTALL": COMMAND_ACCESS_WRITE,
+    "UPDATE": COMMAND_ACCESS_WRITE,
+    "RELOAD": COMMAND_ACCESS_WRITE,
+    "UNINSTALL": COMMAND_ACCESS_WRITE,
+    "DISABLE_ALL": COMMAND_ACCESS_WRITE,
+    "ENABLE_ALL": COMMAND_ACCESS_WRITE,
+    "HELP": COMMAND_ACCESS_READ,
+    "INFCLEAN": COMMAND_ACCESS_WRITE,
+    "LISTFNAMES": COMMAND_ACCESS_READ,
+    "BUSYNAMES": COMMAND_ACCESS_READ,
+    "UPDATEFNAMES": COMMAND_ACCESS_WRITE,
+    "QUIT": COMMAND_ACCESS_WRITE
+}
+
+# Maximum number of setupc.exe processes running at once (read commands only)
+MAX_CONCURRENT_COMMANDS = 4
+
+# Command queue priorities (lower value runs first)
+COMMAND_PRIORITY_MUTATION = 0
+COMMAND_PRIORITY_READ = 1
+
+# Port parameters are described in this file at the project root, see ParameterRegistry
+PARAMETER_SPECIFICATION_FILE = "com0com_cli_specification.json"
+
+# Port parameter types used in the specification
+PARAMETER_TYPE_STRING = "string"
+PARAMETER_TYPE_BOOLEAN = "boolean"
+PARAMETER_TYPE_INTEGER = "integer"
+PARAMETER_TYPE_FLOAT = "float"
+PARAMETER_TYPE_PIN_ASSIGNMENT = "pin_assignment"
+
+PIN_INVERT_PREFIX = "!"
+
+# Upper bound of the input for integer parameters the specification gives no range for
+INTEGER_PARAMETER_MAXIMUM = 99999
+
+# Input suffixes for parameter units in the specification
+PARAMETER_UNIT_SUFFIXES = {
+    "milliseconds": " ms"
+}
 
-BOOLEAN_VALUES = ["yes", "no"]
+# Parameters whose changes need a friendly name update (updatefnames)
+FRIENDLY_NAME_PARAMETERS = ("PortName", "RealPortName")
 
 SPECIAL_PARAMETER_VALUES = {
     "DEFAULT": "-",
@@ -4,7 +4,8 @@ import os
 import sys
 import traceback
 import logging
-from typing import Optional, Dict, Any
+import re
+from typing import Optional, Dict, Any, List, Tuple, Pattern
 from enum import Enum
 from PyQt6.QtWidgets import QMessageBox, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit, QWidget
 from PyQt6.QtCore import Qt, pyqtSignal
@@ -61,11 +62,25 @@ class ErrorInfo:
         self.solutions = solutions or []
 
 
-class ErrorHandler:
-    """Enhanced error handler with user-friendly messages and solutions."""
+class _LazyClassAttribute:
+    """Class attribute built by a factory on first access, then stored on the class."""
+    
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = None
     
-    # Error patterns and their friendly messages
-    ERROR_PATTERNS = {
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner):
+        value = self.factory()
+        setattr(owner, self.name, value)
+        return value
+
+
+def _build_error_patterns() -> Dict[str, ErrorInfo]:
+    """Build the error patterns and their friendly messages."""
+    return {
         # Driver-related errors
         "access denied": ErrorInfo(
             ErrorCategory.PERMISSION,
@@ -213,6 +228,24 @@ class ErrorHandler:
             ]
         )
     }
+
+
+class ErrorHandler:
+    """Enhanced error handler with user-friendly messages and solutions."""
+    
+    # Error patterns and their friendly messages, built on first use
+    ERROR_PATTERNS = _LazyClassAttribute(_build_error_patterns)
+    
+    # (compiled pattern, error info) pairs, compiled on first use
+    _compiled_patterns: Optional[List[Tuple[Pattern, ErrorInfo]]] = None
+    
+    @classmethod
+    def _get_compiled_patterns(cls) -> List[Tuple[Pattern, ErrorInfo]]:
+        """Get ERROR_PATTERNS compiled as regular expressions."""
+        if cls._compiled_patterns is None:
+            cls._compiled_patterns = [(re.compile(pattern), error_info)
+                                      for pattern, error_info in cls.ERROR_PATTERNS.items()]
+        return cls._compiled_patterns
     
     @classmethod
     def get_error_info(cls, error_text: str) -> ErrorInfo:
@@ -220,8 +253,8 @@ class ErrorHandler:
         error_text_lower = error_text.lower()
         
         # Check for known error patterns
-        for pattern, error_info in cls.ERROR_PATTERNS.items():
-            if pattern in error_text_lower:
+        for pattern, error_info in cls._get_compiled_patterns():
+            if pattern.search(error_text_lower):
                 return error_info
         
         # Default error info for unknown errors
@@ -550,23 +583,38 @@ def setup_error_logging():
     return logging.getLogger(APP_NAME)
 
 
-# Global error logger
-error_logger = setup_error_logging()
+# Global error logger, set up on first use
+_error_logger: Optional[logging.Logger] = None
+
+
+def get_error_logger() -> logging.Logger:
+    """Get the error logger, setting up logging on first use."""
+    global _error_logger
+    if _error_logger is None:
+        _error_logger = setup_error_logging()
+    return _error_logger
+
+
+def __getattr__(name):
+    """Keep error_logger available as a module attribute."""
+    if name == "error_logger":
+        return get_error_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def log_error(error: Exception, context: str = ""):
     """Log an error with context information."""
     error_msg = f"{context}: {str(error)}" if context else str(error)
-    error_logger.error(error_msg, exc_info=True)
+    get_error_logger().error(error_msg, exc_info=True)
 
 
 def log_warning(message: str, context: str = ""):
     """Log a warning message."""
     warning_msg = f"{context}: {message}" if context else message
-    error_logger.warning(warning_msg)
+    get_error_logger().warning(warning_msg)
 
 
 def log_info(message: str, context: str = ""):
     """Log an info message."""
     info_msg = f"{context}: {message}" if context else message
-    error_logger.info(info_msg)
\ No newline at end of file
+    get_error_logger().info(info_msg)
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""Process-wide registry of the application's SVG icons."""
+
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtCore import Qt, QByteArray
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QGuiApplication
+from PyQt6.QtSvg import QSvgRenderer
+
+from .config_paths import get_resource_path
+
+
+class IconRegistry:
+    """Shared cache of SVG icons and their rendered pixmaps.
+    
+    Icons are named by their path under assets/icons without the extension,
+    e.g. "toolbar/new". Each SVG file is read and parsed once per process,
+    and each (size, device pixel ratio) rendering once, so repeated lookups
+    never touch the disk. A QGuiApplication must exist before use.
+    """
+    
+    ICON_SIZE = 16
+    
+    _renderers: Dict[str, Optional[QSvgRenderer]] = {}  # name -> parsed SVG, None if missing
+    _pixmaps: Dict[Tuple[str, int, float], QPixmap] = {}  # (name, size, ratio) -> pixmap
+    _icons: Dict[Tuple[str, int], QIcon] = {}  # (name, size) -> icon
+    
+    @classmethod
+    def icon(cls, name: str, size: int = ICON_SIZE) -> QIcon:
+        """Get an icon with pixmaps for every screen's device pixel ratio.
+        
+        Returns a null QIcon if the SVG does not exist.
+        """
+        key = (name, size)
+        icon = cls._icons.get(key)
+        if icon is None:
+            icon = QIcon()
+            if cls._get_renderer(name) is not None:
+                for ratio in cls._get_device_pixel_ratios():
+                    icon.addPixmap(cls.pixmap(name, size, ratio))
+            cls._icons[key] = icon
+        return icon
+    
+    @classmethod
+    def pixmap(cls, name: str, size: int = ICON_SIZE, device_pixel_ratio: float = 1.0) -> QPixmap:
+        """Get the icon rendered at size logical pixels for a device pixel ratio.
+        
+        Returns a null QPixmap if the SVG does not exist.
+        """
+        key = (name, size, device_pixel_ratio)
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is None:
+            renderer = cls._get_renderer(name)
+            if renderer is None:
+                pixmap = QPixmap()
+            else:
+                physical_size = round(size * device_pixel_ratio)
+                pixmap = QPixmap(physical_size, physical_size)
+                pixmap.fill(Qt.GlobalColor.transparent)
+                painter = QPainter(pixmap)
+                renderer.render(painter)
+                painter.end()
+                pixmap.setDevicePixelRatio(device_pixel_ratio)
+            cls._pixmaps[key] = pixmap
+        return pixmap
+    
+    @classmethod
+    def _get_renderer(cls, name: str) -> Optional[QSvgRenderer]:
+        """Get the parsed SVG for an icon, reading the file on first use."""
+        if name not in cls._renderers:
+            renderer = None
+            try:
+                with open(get_resource_path("assets", "icons", f"{name}.svg"), 'rb') as f:
+                    renderer = QSvgRenderer(QByteArray(f.read()))
+                if not renderer.isValid():
+                    print(f"Warning: Invalid SVG icon '{name}'")
+                    renderer = None
+            except OSError:
+                pass
+            cls._renderers[name] = renderer
+        return cls._renderers[name]
+    
+    @staticmethod
+    def _get_device_pixel_ratios() -> list:
+        """Get the distinct device pixel ratios of the connected screens, including 1.0."""
+        ratios = {1.0}
+        for screen in QGuiApplication.screens():
+            ratios.add(screen.devicePixelRatio())
+        return sorted(ratios)
\ No newline at end of file
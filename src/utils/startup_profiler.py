@@ -0,0 +1,95 @@
+"""Startup timing for measuring import time and time to first paint."""
+
+import json
+import os
+import sys
+import time
+from typing import Dict, Optional
+
+from PyQt6.QtCore import QObject, QEvent, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from .constants import STARTUP_PROFILE_ENV, STARTUP_PROFILE_EXIT_ENV
+
+
+class StartupProfiler(QObject):
+    """Records named startup milestones relative to interpreter start.
+    
+    Profiling is enabled by setting STARTUP_PROFILE_ENV to a file path (or
+    "-" for stdout); when disabled every method is a no-op. The report is
+    written as one JSON line once the main window first paints.
+    """
+    
+    def __init__(self, start_time: float, output: Optional[str] = None, exit_after_paint: bool = False):
+        super().__init__()
+        self.start_time = start_time
+        self.output = output
+        self.exit_after_paint = exit_after_paint
+        self.marks: Dict[str, float] = {}  # Milestone name -> seconds since start_time
+        self._watched_window = None
+    
+    @classmethod
+    def from_environment(cls, start_time: float) -> "StartupProfiler":
+        """Create a profiler configured from the environment."""
+        return cls(start_time,
+                   os.environ.get(STARTUP_PROFILE_ENV) or None,
+                   bool(os.environ.get(STARTUP_PROFILE_EXIT_ENV)))
+    
+    @property
+    def enabled(self) -> bool:
+        """Check if startup profiling was requested."""
+        return self.output is not None
+    
+    def mark(self, name: str) -> None:
+        """Record a milestone at the current time."""
+        if self.enabled:
+            self.marks[name] = time.perf_counter() - self.start_time
+    
+    def watch_first_paint(self, window) -> None:
+        """Record the first paint of the window, then write the report."""
+        if not self.enabled:
+            return
+        
+        self._watched_window = window
+        QApplication.instance().installEventFilter(self)
+    
+    def eventFilter(self, obj, event) -> bool:
+        """Catch the first paint event of any widget in the watched window."""
+        if (event.type() == QEvent.Type.Paint and self._watched_window is not None
+                and obj.isWidgetType() and obj.window() is self._watched_window):
+            self._watched_window = None
+            self.mark("first_paint")
+            QApplication.instance().removeEventFilter(self)
+            # Finish after the paint has been flushed to the screen
+            QTimer.singleShot(0, self._finish)
+        return False
+    
+    def _finish(self) -> None:
+        """Write the report and optionally quit."""
+        self.mark("first_paint_flushed")
+        self.write_report()
+        if self.exit_after_paint:
+            QApplication.instance().quit()
+    
+    def write_report(self) -> None:
+        """Write the recorded milestones as one JSON line."""
+        if not self.enabled:
+            return
+        
+        report = {
+            "frozen": bool(getattr(sys, "frozen", False)),
+            "python": sys.version.split()[0],
+            "modules_loaded": len(sys.modules),
+            "marks": {name: round(seconds, 6) for name, seconds in self.marks.items()},
+        }
+        line = json.dumps(report)
+        
+        try:
+            if self.output == "-":
+                if sys.stdout is not None:  # No console in windowed builds
+                    print(line, flush=True)
+            else:
+                with open(self.output, 'a', encoding='utf-8') as f:
+                    f.write(line + "\n")
+        except OSError as e:
+            print(f"Warning: Failed to write startup profile: {e}")
\ No newline at end of file